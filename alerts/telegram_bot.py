@@ -12,6 +12,8 @@ Sends notifications for:
 
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional
 from datetime import datetime
 import json
@@ -44,6 +46,16 @@ class TelegramBot:
         self.base_url = f"https://api.telegram.org/bot{self.bot_token}"
         self.enabled = bool(self.bot_token and self.chat_id)
 
+        # Keep-alive session so alerts after the first reuse the TLS
+        # connection instead of handshaking per message. Retry only covers
+        # failures before the request is sent (POSTs aren't re-sent).
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(total=3, backoff_factor=0.2)
+        ))
+
         if self.enabled:
             print("✓ Telegram bot initialized")
         else:
@@ -73,7 +85,7 @@ class TelegramBot:
                 "disable_web_page_preview": True
             }
 
-            response = requests.post(url, json=payload, timeout=10)
+            response = self._session.post(url, json=payload, timeout=10)
             response.raise_for_status()
 
             return response.json().get('ok', False)
@@ -333,7 +345,7 @@ class TelegramBot:
         """
         try:
             url = f"{self.base_url}/getUpdates"
-            response = requests.get(url, timeout=10)
+            response = self._session.get(url, timeout=10)
             data = response.json()
 
             if data.get('ok') and data.get('result'):
@@ -8,14 +8,16 @@ This module provides event-driven backtesting with:
 """
 
 from .position_sizer import PositionSizer, calculate_position_size
-from .backtester import Backtester, BacktestResult
+from .backtester import Backtester, BacktestData, BacktestResult, trades_to_frame
 from .performance import calculate_performance_metrics, generate_performance_report
 
 __all__ = [
     'PositionSizer',
     'calculate_position_size',
     'Backtester',
+    'BacktestData',
     'BacktestResult',
+    'trades_to_frame',
     'calculate_performance_metrics',
     'generate_performance_report'
 ]
@@ -13,15 +13,17 @@ import numpy as np
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
+from operator import attrgetter
 import sys
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
 from backtest.position_sizer import PositionSizer
-from signals.entry_signals import generate_entry_signals
+from signals.entry_signals import calculate_entry_indicators, apply_entry_signals
 from signals.exit_signals import simulate_position_exit
 from data.data_loader import load_historical_ohlcv, load_multiple_symbols
+from indicators.batch import compute_all
 
 
 @dataclass
@@ -61,6 +63,37 @@ class Trade:
     max_adverse_excursion: float
 
 
+# Trade fields written to the backtest result CSVs
+TRADE_REPORT_COLUMNS = [
+    'symbol', 'entry_date', 'entry_price', 'exit_date', 'exit_price',
+    'position_size_usd', 'return_pct', 'return_usd', 'holding_days',
+    'exit_reason', 'peak_price', 'max_adverse_excursion'
+]
+
+
+# Equity curve columns, in the order _update_equity records each row
+EQUITY_COLUMNS = ['date', 'equity', 'cash', 'positions_value', 'num_positions']
+
+
+def trades_to_frame(trades: List[Trade], columns: List[str] = TRADE_REPORT_COLUMNS) -> pd.DataFrame:
+    """
+    Build a DataFrame of trades, one row per trade.
+
+    Rows are pulled as tuples with a single attrgetter rather than a dict
+    per trade, so there is no per-row key hashing or column inference.
+
+    Args:
+        trades: Completed trades
+        columns: Trade fields to include (default: TRADE_REPORT_COLUMNS)
+
+    Returns:
+        DataFrame with the given columns
+    """
+    return pd.DataFrame.from_records(
+        list(map(attrgetter(*columns), trades)), columns=columns
+    )
+
+
 @dataclass
 class BacktestResult:
     """Container for backtest results."""
@@ -71,6 +104,15 @@ class BacktestResult:
     config: Dict = field(default_factory=dict)
 
 
+@dataclass
+class BacktestData:
+    """Loaded OHLCV and entry indicators, reusable across simulate() runs."""
+    data: Dict[str, pd.DataFrame]
+    indicators: Dict[str, pd.DataFrame]
+    end_date: datetime
+    ma_period: int = 20
+
+
 class Backtester:
     """
     Event-driven backtester for the strategy.
@@ -118,14 +160,21 @@ class Backtester:
             max_positions=max_positions
         )
 
-        # Trading state
+        self.reset()
+
+    def reset(self):
+        """Clear trading state so the backtester can run again from initial capital."""
+        self.capital = self.initial_capital
+        self.sizer.update_account_size(self.initial_capital)
+
+        # Trading state (new objects, so earlier results keep theirs)
         self.positions: Dict[str, Position] = {}
         self.trades: List[Trade] = []
-        self.equity_history: List[Dict] = []
+        self.equity_history: List[Tuple] = []  # rows in EQUITY_COLUMNS order
 
         # Risk management tracking
-        self.daily_start_capital = initial_capital
-        self.weekly_start_capital = initial_capital
+        self.daily_start_capital = self.initial_capital
+        self.weekly_start_capital = self.initial_capital
         self.current_date = None
         self.current_week = None
         self.size_multiplier = 1.0  # For weekly loss limit adjustment
@@ -200,6 +249,31 @@ class Backtester:
         Returns:
             BacktestResult with trades, equity curve, and metrics
         """
+        prepared = self.precompute(symbols, start_date, end_date, ma_period)
+        return self.simulate(prepared, bbwidth_threshold, rvr_threshold, use_ma_exit)
+
+    def precompute(
+        self,
+        symbols: List[str],
+        start_date: datetime,
+        end_date: datetime,
+        ma_period: int = 20
+    ) -> BacktestData:
+        """
+        Load data and calculate the threshold-independent indicators.
+
+        The result can be passed to simulate() any number of times, so a
+        threshold sweep loads and calculates indicators only once.
+
+        Args:
+            symbols: List of symbols to trade
+            start_date: Backtest start date
+            end_date: Backtest end date
+            ma_period: MA period for trend/exit
+
+        Returns:
+            BacktestData for simulate()
+        """
         print(f"\n{'='*80}")
         print(f"BACKTESTING: {len(symbols)} symbols from {start_date.date()} to {end_date.date()}")
         print(f"{'='*80}\n")
@@ -208,18 +282,53 @@ class Backtester:
         print("Loading historical data...")
         data = load_multiple_symbols(symbols, start_date, end_date, timeframe='1D')
 
-        # Generate entry signals for all symbols
+        # Indicators for all symbols (one worker thread per symbol)
+        print("\nCalculating indicators...")
+        indicators = compute_all(
+            {symbol: data[symbol] for symbol in symbols if symbol in data},
+            calculate_entry_indicators,
+            ma_period=ma_period
+        )
+
+        return BacktestData(data, indicators, end_date, ma_period)
+
+    def simulate(
+        self,
+        prepared: BacktestData,
+        bbwidth_threshold: float = 0.25,
+        rvr_threshold: float = 2.0,
+        use_ma_exit: bool = True
+    ) -> BacktestResult:
+        """
+        Run the day-by-day simulation on data from precompute().
+
+        Trading state is reset first, so one backtester can simulate the
+        same BacktestData with different thresholds.
+
+        Args:
+            prepared: Output of precompute()
+            bbwidth_threshold: BBWidth percentile threshold
+            rvr_threshold: Minimum RVR for entry
+            use_ma_exit: Use MA as exit signal
+
+        Returns:
+            BacktestResult with trades, equity curve, and metrics
+        """
+        self.reset()
+        data = prepared.data
+        ma_period = prepared.ma_period
+        end_date = prepared.end_date
+
+        # Evaluate entry criteria at these thresholds (copies, so the
+        # shared indicator frames stay untouched)
         print("\nGenerating entry signals...")
-        signals = {}
-        for symbol in symbols:
-            if symbol not in data:
-                continue
-            signals[symbol] = generate_entry_signals(
-                data[symbol],
-                bbwidth_threshold=bbwidth_threshold,
-                rvr_threshold=rvr_threshold,
-                ma_period=ma_period
-            )
+        signals = compute_all(
+            prepared.indicators,
+            apply_entry_signals,
+            bbwidth_threshold=bbwidth_threshold,
+            rvr_threshold=rvr_threshold,
+            ma_period=ma_period
+        )
 
         # Get all unique dates
         all_dates = set()
@@ -471,13 +580,9 @@ class Backtester:
 
         total_equity = self.capital + positions_value
 
-        self.equity_history.append({
-            'date': current_date,
-            'equity': total_equity,
-            'cash': self.capital,
-            'positions_value': positions_value,
-            'num_positions': len(self.positions)
-        })
+        self.equity_history.append(
+            (current_date, total_equity, self.capital, positions_value, len(self.positions))
+        )
 
     def _close_all_positions(self, end_date: datetime, data: Dict[str, pd.DataFrame]):
         """Close all remaining positions at end of backtest."""
@@ -501,7 +606,7 @@ class Backtester:
     def _generate_results(self) -> BacktestResult:
         """Generate backtest results."""
         # Convert equity history to DataFrame
-        equity_df = pd.DataFrame(self.equity_history)
+        equity_df = pd.DataFrame.from_records(self.equity_history, columns=EQUITY_COLUMNS)
 
         if len(equity_df) > 0:
             equity_df['returns'] = equity_df['equity'].pct_change()
@@ -10,9 +10,67 @@ Calculates standard trading metrics:
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List
+from collections import Counter
+from typing import Dict, List, Tuple
 from dataclasses import dataclass
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _trade_scan_loop(returns_pct: np.ndarray, returns_usd: np.ndarray) -> Tuple:
+    """
+    Win/loss statistics in one pass over the trades.
+
+    Returns:
+        (n_wins, n_losses, sum_win_pct, max_win_pct, sum_loss_pct,
+         max_loss_pct, total_win_usd, total_loss_usd)
+    """
+    n_wins = 0
+    n_losses = 0
+    sum_win = 0.0
+    max_win = -np.inf
+    sum_loss = 0.0
+    max_loss = np.inf
+    win_usd = 0.0
+    loss_usd = 0.0
+    for i in range(returns_pct.shape[0]):
+        r = returns_pct[i]
+        if r > 0:
+            n_wins += 1
+            sum_win += r
+            max_win = max(max_win, r)
+            win_usd += returns_usd[i]
+        elif r <= 0:
+            n_losses += 1
+            sum_loss += r
+            max_loss = min(max_loss, r)
+            loss_usd += returns_usd[i]
+    return n_wins, n_losses, sum_win, max_win, sum_loss, max_loss, win_usd, loss_usd
+
+
+def _trade_scan_numpy(returns_pct: np.ndarray, returns_usd: np.ndarray) -> Tuple:
+    """Vectorized _trade_scan_loop. Used when numba is unavailable."""
+    wins = returns_pct > 0
+    losses = returns_pct <= 0
+    win_pct = returns_pct[wins]
+    loss_pct = returns_pct[losses]
+    return (
+        int(wins.sum()), int(losses.sum()),
+        win_pct.sum(), win_pct.max(initial=-np.inf),
+        loss_pct.sum(), loss_pct.min(initial=np.inf),
+        returns_usd[wins].sum(), returns_usd[losses].sum()
+    )
+
+
+if NUMBA_AVAILABLE:
+    _trade_scan = njit(cache=True, nogil=True)(_trade_scan_loop)
+else:
+    _trade_scan = _trade_scan_numpy
+
 
 def calculate_performance_metrics(
     trades: List,
@@ -40,46 +98,47 @@ def calculate_performance_metrics(
     if len(trades) == 0:
         return _empty_metrics()
 
-    # Trade-based metrics
-    winning_trades = [t for t in trades if t.return_pct > 0]
-    losing_trades = [t for t in trades if t.return_pct <= 0]
+    # Trade-based metrics: pull the fields into arrays once, then a single
+    # compiled pass does all the win/loss accumulation
+    returns = np.fromiter((t.return_pct for t in trades), np.float64, len(trades))
+    returns_usd = np.fromiter((t.return_usd for t in trades), np.float64, len(trades))
+    (n_wins, n_losses, sum_win, max_win,
+     sum_loss, max_loss, total_wins, total_losses) = _trade_scan(returns, returns_usd)
 
-    metrics['winning_trades'] = len(winning_trades)
-    metrics['losing_trades'] = len(losing_trades)
-    metrics['win_rate'] = len(winning_trades) / len(trades) if len(trades) > 0 else 0
+    metrics['winning_trades'] = n_wins
+    metrics['losing_trades'] = n_losses
+    metrics['win_rate'] = n_wins / len(trades)
 
     # Return metrics
-    returns = [t.return_pct for t in trades]
-    metrics['avg_return_pct'] = np.mean(returns) if returns else 0
-    metrics['median_return_pct'] = np.median(returns) if returns else 0
-    metrics['std_return_pct'] = np.std(returns) if returns else 0
+    metrics['avg_return_pct'] = returns.mean()
+    metrics['median_return_pct'] = np.median(returns)
+    metrics['std_return_pct'] = returns.std()
 
     # Win/Loss metrics
-    if winning_trades:
-        metrics['avg_win_pct'] = np.mean([t.return_pct for t in winning_trades])
-        metrics['max_win_pct'] = max([t.return_pct for t in winning_trades])
+    if n_wins:
+        metrics['avg_win_pct'] = sum_win / n_wins
+        metrics['max_win_pct'] = max_win
     else:
         metrics['avg_win_pct'] = 0
         metrics['max_win_pct'] = 0
 
-    if losing_trades:
-        metrics['avg_loss_pct'] = np.mean([t.return_pct for t in losing_trades])
-        metrics['max_loss_pct'] = min([t.return_pct for t in losing_trades])
+    if n_losses:
+        metrics['avg_loss_pct'] = sum_loss / n_losses
+        metrics['max_loss_pct'] = max_loss
     else:
         metrics['avg_loss_pct'] = 0
         metrics['max_loss_pct'] = 0
 
     # Profit factor
-    total_wins = sum([t.return_usd for t in winning_trades])
-    total_losses = abs(sum([t.return_usd for t in losing_trades]))
+    total_losses = abs(total_losses)
     metrics['total_profit_usd'] = total_wins
     metrics['total_loss_usd'] = total_losses
     metrics['profit_factor'] = total_wins / total_losses if total_losses > 0 else np.inf
 
     # Holding period
-    holding_days = [t.holding_days for t in trades]
-    metrics['avg_holding_days'] = np.mean(holding_days) if holding_days else 0
-    metrics['median_holding_days'] = np.median(holding_days) if holding_days else 0
+    holding_days = np.fromiter((t.holding_days for t in trades), np.float64, len(trades))
+    metrics['avg_holding_days'] = holding_days.mean()
+    metrics['median_holding_days'] = np.median(holding_days)
 
     # Equity curve metrics
     if len(equity_curve) > 0:
@@ -112,27 +171,21 @@ def calculate_performance_metrics(
             metrics['sortino_ratio'] = 0
 
     # Exit reason breakdown
-    exit_reasons = {}
-    for trade in trades:
-        reason = trade.exit_reason
-        if reason not in exit_reasons:
-            exit_reasons[reason] = 0
-        exit_reasons[reason] += 1
-    metrics['exit_reasons'] = exit_reasons
-
-    # Symbol breakdown
-    symbol_stats = {}
-    for trade in trades:
-        if trade.symbol not in symbol_stats:
-            symbol_stats[trade.symbol] = {
-                'trades': 0,
-                'wins': 0,
-                'total_return': 0
-            }
-        symbol_stats[trade.symbol]['trades'] += 1
-        if trade.return_pct > 0:
-            symbol_stats[trade.symbol]['wins'] += 1
-        symbol_stats[trade.symbol]['total_return'] += trade.return_pct
+    metrics['exit_reasons'] = dict(Counter(t.exit_reason for t in trades))
+
+    # Symbol breakdown (factorize keeps first-seen order)
+    codes, symbols = pd.factorize(np.array([t.symbol for t in trades], dtype=object))
+    trade_counts = np.bincount(codes, minlength=len(symbols))
+    win_counts = np.bincount(codes, weights=returns > 0, minlength=len(symbols))
+    return_sums = np.bincount(codes, weights=returns, minlength=len(symbols))
+    symbol_stats = {
+        symbol: {
+            'trades': int(trade_counts[i]),
+            'wins': int(win_counts[i]),
+            'total_return': float(return_sums[i])
+        }
+        for i, symbol in enumerate(symbols)
+    }
 
     metrics['symbol_stats'] = symbol_stats
 
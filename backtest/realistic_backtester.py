@@ -21,6 +21,7 @@ from data.bybit_api import BybitDataFetcher, DynamicUniverseScanner
 from backtest.backtester import Backtester, BacktestResult, Position, Trade
 from backtest.position_sizer import PositionSizer
 from signals.entry_signals import generate_entry_signals
+from indicators.batch import compute_all
 from signals.exit_signals import check_exit_signal
 from signals.btc_regime_filter import check_btc_regime, apply_regime_filter
 
@@ -49,7 +50,8 @@ class RealisticBacktester(Backtester):
         universe_update_days: int = 7,
         static_universe: Optional[List[str]] = None,
         daily_loss_limit_pct: float = 0.03,
-        weekly_loss_limit_pct: float = 0.08
+        weekly_loss_limit_pct: float = 0.08,
+        kline_cache_dir: Optional[str] = None
     ):
         """
         Initialize realistic backtester.
@@ -62,6 +64,8 @@ class RealisticBacktester(Backtester):
             static_universe: Optional list of symbols for static universe (disables dynamic scanning)
             daily_loss_limit_pct: Daily loss limit (default: 3%)
             weekly_loss_limit_pct: Weekly loss limit for size reduction (default: 8%)
+            kline_cache_dir: On-disk kline cache directory; only windows that
+                             end in the past are cached (default: None, no cache)
         """
         super().__init__(
             initial_capital, risk_per_trade_pct, stop_loss_pct,
@@ -74,8 +78,8 @@ class RealisticBacktester(Backtester):
         self.universe_update_days = universe_update_days
         self.static_universe = static_universe
 
-        # API and scanner
-        self.api = BybitDataFetcher()
+        # API (optionally caching closed kline windows on disk) and scanner
+        self.api = BybitDataFetcher(cache_dir=kline_cache_dir)
 
         # Only initialize scanner if not using static universe
         if static_universe is None:
@@ -174,20 +178,22 @@ class RealisticBacktester(Backtester):
 
         # Generate signals for all data
         print("\nGenerating entry signals...")
-        signals = {}
         min_required_candles = lookback_period + ma_period + 10  # lookback + MA + small buffer
+        eligible = {}
         for symbol in data.keys():
             if symbol not in data or len(data[symbol]) < min_required_candles:
                 print(f"  Skipping {symbol}: insufficient data ({len(data.get(symbol, []))} < {min_required_candles} candles)")
                 continue
-
-            signals[symbol] = generate_entry_signals(
-                data[symbol],
-                bbwidth_threshold=bbwidth_threshold,
-                rvr_threshold=rvr_threshold,
-                ma_period=ma_period,
-                lookback_period=lookback_period
-            )
+            eligible[symbol] = data[symbol]
+
+        signals = compute_all(
+            eligible,
+            generate_entry_signals,
+            bbwidth_threshold=bbwidth_threshold,
+            rvr_threshold=rvr_threshold,
+            ma_period=ma_period,
+            lookback_period=lookback_period
+        )
 
         # Apply BTC regime filter if enabled
         if use_btc_regime_filter:
@@ -0,0 +1,153 @@
+"""
+Save and load backtest result tables (trades, equity curve, metrics).
+
+Tables are written as zstd-compressed Parquet when pyarrow is installed:
+smaller on disk than CSV and much faster to read back for comparisons.
+Without pyarrow they are written as CSV, as before. A CSV copy can still
+be requested for spreadsheet use; it is written on a background thread
+so it doesn't hold up the end of the run.
+
+The metrics dict is a single record, so it is saved as JSON rather than
+as a one-row table.
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+import pandas as pd
+
+try:
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+# 10 significant digits keeps cents on 8-figure equity values while
+# skipping pandas' full repr() formatting of every float
+CSV_FLOAT_FORMAT = '%.10g'
+
+_csv_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _to_csv(df: pd.DataFrame, path: Path):
+    """Write a CSV through one large write buffer."""
+    with open(path, 'w', buffering=1 << 20, newline='') as fh:
+        df.to_csv(fh, index=False, float_format=CSV_FLOAT_FORMAT)
+
+
+def _write_csv_async(df: pd.DataFrame, path: Path):
+    """Queue a CSV write on the background writer thread."""
+    global _csv_executor
+    if _csv_executor is None:
+        # concurrent.futures joins its worker threads at interpreter exit,
+        # so queued writes still complete
+        _csv_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="results-csv")
+    _csv_executor.submit(_to_csv, df, path)
+
+
+def save_results_table(df: pd.DataFrame, path: Path, csv_copy: bool = False) -> Path:
+    """
+    Save a results table.
+
+    Args:
+        df: Table to save
+        path: Output path without suffix (e.g. results/backtest_trades)
+        csv_copy: Also write path.csv in the background (default: False)
+
+    Returns:
+        Path of the primary file written (.parquet, or .csv without pyarrow)
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if not PARQUET_AVAILABLE:
+        csv_file = path.with_suffix('.csv')
+        _to_csv(df, csv_file)
+        return csv_file
+
+    parquet_file = path.with_suffix('.parquet')
+    df.to_parquet(parquet_file, index=False, compression='zstd')
+    if csv_copy:
+        _write_csv_async(df, path.with_suffix('.csv'))
+    return parquet_file
+
+
+def load_results_table(
+    path: Path,
+    columns: Optional[Sequence[str]] = None
+) -> Optional[pd.DataFrame]:
+    """
+    Load a table saved by save_results_table.
+
+    Args:
+        path: Path without suffix, as passed to save_results_table
+        columns: Only read these columns; names missing from the file are
+                 skipped rather than raising (default: all columns)
+
+    Returns:
+        DataFrame, or None if neither a .parquet nor a .csv file exists
+    """
+    path = Path(path)
+    parquet_file = path.with_suffix('.parquet')
+    if PARQUET_AVAILABLE and parquet_file.exists():
+        if columns is not None:
+            available = set(pq.read_schema(parquet_file).names)
+            columns = [col for col in columns if col in available]
+        return pd.read_parquet(parquet_file, columns=columns)
+
+    csv_file = path.with_suffix('.csv')
+    if csv_file.exists():
+        usecols = None if columns is None else set(columns).__contains__
+        return pd.read_csv(csv_file, usecols=usecols)
+    return None
+
+
+def _json_default(obj):
+    """Serialize NumPy scalars (metrics values) as plain Python numbers."""
+    if hasattr(obj, 'item'):
+        return obj.item()
+    return str(obj)
+
+
+def save_metrics(metrics: Dict, path: Path) -> Path:
+    """
+    Save a performance metrics dict as JSON.
+
+    Args:
+        metrics: Output of calculate_performance_metrics
+        path: Output path without suffix (e.g. results/performance_metrics)
+
+    Returns:
+        Path of the .json file written
+    """
+    json_file = Path(path).with_suffix('.json')
+    json_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(json_file, 'w') as fh:
+        json.dump(metrics, fh, default=_json_default)
+    return json_file
+
+
+def load_metrics(path: Path) -> Optional[Dict]:
+    """
+    Load metrics saved by save_metrics.
+
+    Falls back to a one-row metrics table from older runs.
+
+    Args:
+        path: Path without suffix, as passed to save_metrics
+
+    Returns:
+        Metrics dict, or None if nothing was saved at path
+    """
+    json_file = Path(path).with_suffix('.json')
+    if json_file.exists():
+        with open(json_file) as fh:
+            return json.load(fh)
+
+    table = load_results_table(path)
+    if table is None or table.empty:
+        return None
+    # Per column, so integer columns keep their dtype
+    return {col: table[col].iloc[0] for col in table.columns}
@@ -10,12 +10,42 @@ more realistic by:
 
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 from pybit.unified_trading import HTTP
 import time
 import os
 import json
+import hashlib
+from pathlib import Path
+
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+# Bybit caps a kline request at 1000 candles
+KLINE_PAGE_SIZE = 1000
+# Concurrent page requests when a kline fetch spans several pages
+KLINE_FETCH_WORKERS = 4
+# Attempts per page of a multi-page fetch before the whole fetch fails
+KLINE_PAGE_ATTEMPTS = 3
+
+# Accepted interval spellings -> Bybit interval
+_BYBIT_INTERVALS = {
+    '1': '1', '5': '5', '15': '15', '60': '60',
+    '240': '240', '4h': '240', '4H': '240',
+    'D': 'D', '1D': 'D'
+}
+
+# Minutes per candle, for every key of _BYBIT_INTERVALS
+_INTERVAL_MINUTES = {
+    '1': 1, '5': 5, '15': 15, '60': 60,
+    '240': 240, '4h': 240, '4H': 240,
+    'D': 1440, '1D': 1440
+}
 
 
 class BybitDataFetcher:
@@ -23,16 +53,23 @@ class BybitDataFetcher:
     Fetches live market data from Bybit API.
     """
 
-    def __init__(self, testnet: bool = False):
+    def __init__(self, testnet: bool = False, cache_dir: Optional[str] = None):
         """
         Initialize Bybit API client.
 
         Args:
             testnet: Whether to use testnet (default: False for mainnet)
+            cache_dir: Directory for an on-disk kline cache, so reruns over
+                       the same closed period skip the API (default: None,
+                       no cache)
         """
         self.session = HTTP(testnet=testnet)
         self.rate_limit_delay = 0.1  # 100ms between requests
 
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
     def get_all_usdt_symbols(self, min_volume_24h: float = 0) -> List[Dict]:
         """
         Get all USDT perpetual symbols currently trading on Bybit.
@@ -93,7 +130,8 @@ class BybitDataFetcher:
         """
         Fetch historical klines (OHLCV) data.
 
-        If limit > 1000, automatically fetches in multiple paginated requests.
+        If limit > 1000, automatically fetches in multiple paginated requests,
+        issued concurrently (KLINE_FETCH_WORKERS at a time).
 
         Args:
             symbol: Trading pair symbol (e.g., 'BTCUSDT')
@@ -104,42 +142,99 @@ class BybitDataFetcher:
 
         Returns:
             DataFrame with OHLCV data
+
+        Raises:
+            ValueError: If interval is not one of the supported timeframes
         """
+        if interval not in _BYBIT_INTERVALS:
+            raise ValueError(
+                f"Unsupported kline interval {interval!r}; expected one of {list(_BYBIT_INTERVALS)}"
+            )
+
+        # Only windows whose last candle has closed are cached: a window
+        # reaching the present (or open-ended) would keep serving a partial
+        # candle and miss every bar added since
+        step = timedelta(minutes=_INTERVAL_MINUTES[interval])
+        if self.cache_dir is None or end_time is None or end_time + step > datetime.now():
+            return self._fetch_klines(symbol, interval, start_time, end_time, limit)
+
+        start_key = start_time.isoformat() if start_time else None
+        key = f"{symbol}|{interval}|{start_key}|{end_time.isoformat()}|{limit}"
+        cache_file = self.cache_dir / hashlib.sha256(key.encode()).hexdigest()
+        cache_file = cache_file.with_suffix('.parquet' if PARQUET_AVAILABLE else '.pkl')
+
+        if cache_file.exists():
+            try:
+                if PARQUET_AVAILABLE:
+                    return pd.read_parquet(cache_file)
+                return pd.read_pickle(cache_file)
+            except Exception as e:
+                print(f"Could not read kline cache for {symbol}: {e}")
+
+        df = self._fetch_klines(symbol, interval, start_time, end_time, limit)
+
+        # Empty results may be transient API errors - don't cache them
+        if not df.empty:
+            try:
+                if PARQUET_AVAILABLE:
+                    df.to_parquet(cache_file, index=False, compression='zstd')
+                else:
+                    df.to_pickle(cache_file)
+            except Exception as e:
+                print(f"Could not write kline cache for {symbol}: {e}")
+
+        return df
+
+    def _fetch_klines(
+        self,
+        symbol: str,
+        interval: str,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+        limit: int
+    ) -> pd.DataFrame:
+        """Fetch klines from the API (see get_klines)."""
         try:
             # If limit <= 1000, use single request
             if limit <= 1000:
                 return self._fetch_single_kline_batch(symbol, interval, start_time, end_time, limit)
 
-            # Otherwise, paginate
-            all_data = []
-            current_end = end_time
-            remaining = limit
-
-            while remaining > 0:
-                batch_limit = min(remaining, 1000)
-                df = self._fetch_single_kline_batch(symbol, interval, start_time, current_end, batch_limit)
-
-                if df.empty:
-                    break
-
-                all_data.append(df)
-                remaining -= len(df)
-
-                # Update end time to oldest timestamp in this batch for next request
-                current_end = df['timestamp'].min() - timedelta(seconds=1)
-
-                # If we got less than requested, we've reached the start
-                if len(df) < batch_limit:
-                    break
-
+            # Otherwise split the range into page-sized time windows and
+            # fetch them concurrently instead of walking back page by page
+            step = timedelta(minutes=_INTERVAL_MINUTES[interval])
+            end = end_time or datetime.now()
+            start = end - step * limit
+            if start_time and start_time > start:
+                start = start_time
+
+            windows = []
+            window_end = end
+            while window_end > start:
+                window_start = max(window_end - step * (KLINE_PAGE_SIZE - 1), start)
+                windows.append((window_start, window_end))
+                window_end = window_start - timedelta(milliseconds=1)
+
+            with ThreadPoolExecutor(
+                max_workers=min(KLINE_FETCH_WORKERS, len(windows)),
+                thread_name_prefix="klines"
+            ) as executor:
+                futures = [
+                    executor.submit(self._fetch_kline_page, symbol, interval, ws, we)
+                    for ws, we in windows
+                ]
+                # A page that still fails after retrying raises here and fails
+                # the whole fetch, rather than leaving a gap in the series
+                all_data = [f.result() for f in futures]
+
+            all_data = [df for df in all_data if not df.empty]
             if not all_data:
                 return pd.DataFrame()
 
             # Combine all batches
             combined = pd.concat(all_data, ignore_index=True)
-            combined = combined.sort_values('timestamp').drop_duplicates(subset=['timestamp']).reset_index(drop=True)
+            combined = combined.sort_values('timestamp').drop_duplicates(subset=['timestamp'])
 
-            return combined
+            return combined.tail(limit).reset_index(drop=True)
 
         except Exception as e:
             print(f"Error fetching klines for {symbol}: {e}")
@@ -153,65 +248,77 @@ class BybitDataFetcher:
         end_time: Optional[datetime],
         limit: int
     ) -> pd.DataFrame:
-        """Fetch a single batch of klines (max 1000)."""
+        """Fetch a single batch of klines (max 1000). Safe to call from worker threads."""
         try:
-            # Convert interval to Bybit format
-            interval_map = {
-                '1': '1',
-                '5': '5',
-                '15': '15',
-                '60': '60',
-                '240': '240',  # 4 hour
-                '4h': '240',
-                '4H': '240',
-                'D': 'D',
-                '1D': 'D'
-            }
-            bybit_interval = interval_map.get(interval, '240')
-
-            # Convert timestamps to milliseconds
-            params = {
-                'category': 'linear',
-                'symbol': symbol,
-                'interval': bybit_interval,
-                'limit': min(limit, 1000)
-            }
-
-            if start_time:
-                params['start'] = int(start_time.timestamp() * 1000)
-            if end_time:
-                params['end'] = int(end_time.timestamp() * 1000)
-
-            response = self.session.get_kline(**params)
+            return self._request_kline_batch(symbol, interval, start_time, end_time, limit)
+        except Exception as e:
+            print(f"Error fetching klines for {symbol}: {e}")
+            return pd.DataFrame()
 
-            if response['retCode'] != 0:
-                raise Exception(f"API Error: {response['retMsg']}")
+    def _fetch_kline_page(
+        self,
+        symbol: str,
+        interval: str,
+        start_time: datetime,
+        end_time: datetime
+    ) -> pd.DataFrame:
+        """Fetch one page of a multi-page fetch, retrying; raises if every attempt fails."""
+        for attempt in range(KLINE_PAGE_ATTEMPTS):
+            try:
+                return self._request_kline_batch(symbol, interval, start_time, end_time, KLINE_PAGE_SIZE)
+            except Exception:
+                if attempt == KLINE_PAGE_ATTEMPTS - 1:
+                    raise
+                time.sleep(self.rate_limit_delay * 2 ** (attempt + 1))
+
+    def _request_kline_batch(
+        self,
+        symbol: str,
+        interval: str,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+        limit: int
+    ) -> pd.DataFrame:
+        """Request a single batch of klines (max 1000); raises on API errors."""
+        # Convert timestamps to milliseconds
+        params = {
+            'category': 'linear',
+            'symbol': symbol,
+            'interval': _BYBIT_INTERVALS[interval],
+            'limit': min(limit, 1000)
+        }
 
-            klines = response['result']['list']
+        if start_time:
+            params['start'] = int(start_time.timestamp() * 1000)
+        if end_time:
+            params['end'] = int(end_time.timestamp() * 1000)
 
-            if not klines:
-                return pd.DataFrame()
+        response = self.session.get_kline(**params)
+
+        if response['retCode'] != 0:
+            raise Exception(f"API Error: {response['retMsg']}")
 
-            # Parse klines
-            df = pd.DataFrame(klines, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume', 'turnover'
-            ])
+        klines = response['result']['list']
 
-            # Convert types
-            df['timestamp'] = pd.to_datetime(df['timestamp'].astype(float), unit='ms')
-            for col in ['open', 'high', 'low', 'close', 'volume', 'turnover']:
-                df[col] = df[col].astype(float)
+        if not klines:
+            return pd.DataFrame()
 
-            # Sort by timestamp (oldest first)
-            df = df.sort_values('timestamp').reset_index(drop=True)
+        # Parse klines
+        df = pd.DataFrame(klines, columns=[
+            'timestamp', 'open', 'high', 'low', 'close', 'volume', 'turnover'
+        ])
 
-            time.sleep(self.rate_limit_delay)
+        # Convert types
+        df['timestamp'] = pd.to_datetime(df['timestamp'].astype(float), unit='ms')
+        for col in ['open', 'high', 'low', 'close', 'volume', 'turnover']:
+            df[col] = df[col].astype(float)
 
-            return df
+        # Sort by timestamp (oldest first)
+        df = df.sort_values('timestamp').reset_index(drop=True)
 
-        except Exception as e:
-            print(f"Error fetching klines for {symbol}: {e}")
-            return pd.DataFrame()
+        time.sleep(self.rate_limit_delay)
+
+        return df
 
     def get_multiple_symbols_klines(
         self,
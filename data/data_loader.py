@@ -9,12 +9,18 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Dict
 import glob
+import os
 
 # Path to Bybit datawarehouse
 BYBIT_DATA_DIR = Path("/home/william/STRATEGIES/datawarehouse/bybit_data")
 
+# Parse price/volume columns straight to float64 so the indicator kernels
+# get their NumPy buffers without a per-call conversion (integer volumes
+# would otherwise load as int64)
+OHLCV_DTYPES = dict.fromkeys(['open', 'high', 'low', 'close', 'volume', 'turnover'], np.float64)
+
 
 def get_available_symbols() -> List[str]:
     """
@@ -52,9 +58,47 @@ def get_symbol_date_range(symbol: str) -> Tuple[Optional[datetime], Optional[dat
     # Find all 1m CSV files (we'll use 1m as the source)
     csv_files = sorted(glob.glob(str(symbol_dir / "*_1m.csv")))
 
-    if not csv_files:
-        return None, None
+    return _date_range_from_files(csv_files)
+
+
+def get_all_symbol_date_ranges() -> Dict[str, Tuple[Optional[datetime], Optional[datetime]]]:
+    """
+    Get the available date range for every symbol in the datawarehouse.
+
+    Lists each symbol directory once instead of the separate exists/glob
+    calls made by get_symbol_date_range().
+
+    Returns:
+        Dictionary mapping symbol -> (start_date, end_date), with
+        (None, None) for symbols without data
+    """
+    if not BYBIT_DATA_DIR.exists():
+        raise FileNotFoundError(f"Bybit data directory not found: {BYBIT_DATA_DIR}")
 
+    ranges = {}
+    with os.scandir(BYBIT_DATA_DIR) as symbol_entries:
+        for symbol_entry in symbol_entries:
+            if not symbol_entry.is_dir() or symbol_entry.name.startswith('.'):
+                continue
+
+            with os.scandir(symbol_entry.path) as file_entries:
+                csv_files = [f.name for f in file_entries if f.name.endswith('_1m.csv')]
+
+            ranges[symbol_entry.name] = _date_range_from_files(csv_files)
+
+    return dict(sorted(ranges.items()))
+
+
+def _date_range_from_files(csv_files: List[str]) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """
+    Extract the (start_date, end_date) range from 1m CSV file names.
+
+    Args:
+        csv_files: File names or paths like ".../2024-08-16_1m.csv"
+
+    Returns:
+        Tuple of (start_date, end_date) or (None, None) if no dates found
+    """
     # Extract dates from filenames
     dates = []
     for file in csv_files:
@@ -115,7 +159,7 @@ def load_historical_ohlcv(
 
         if csv_path.exists():
             try:
-                df = pd.read_csv(csv_path)
+                df = pd.read_csv(csv_path, dtype=OHLCV_DTYPES)
                 df['timestamp'] = pd.to_datetime(df['timestamp'])
                 all_data.append(df)
             except Exception as e:
@@ -7,9 +7,141 @@ requirements for backtesting.
 
 import pandas as pd
 import numpy as np
+import time
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
-from .data_loader import get_available_symbols, get_symbol_date_range, load_historical_ohlcv
+from .data_loader import (
+    get_all_symbol_date_ranges,
+    get_symbol_date_range,
+    load_historical_ohlcv
+)
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Gaps between consecutive bars larger than this are reported (3 days, in ns)
+GAP_THRESHOLD_NS = 3 * 86_400 * 1_000_000_000
+
+# Cached symbol date ranges are refreshed after this many seconds
+DATE_RANGE_CACHE_TTL = 3600
+
+# Validation issues are stored as (code, *args) tuples and only formatted
+# into messages when reported
+ISSUE_MESSAGES = {
+    'EMPTY': "DataFrame is empty",
+    'MISSING': "Column '{}' has {} missing values ({:.2f}%)",
+    'NON_POSITIVE': "Column '{}' has {} negative/zero values",
+    'HIGH_LT_LOW': "Found {} rows where high < low",
+    'HIGH_LT_OPEN_CLOSE': "Found {} rows where high < open/close",
+    'LOW_GT_OPEN_CLOSE': "Found {} rows where low > open/close",
+    'EXTREME_MOVES': "Found {} extreme price moves (>50%), max: {:.2%}",
+    'ZERO_VOLUME': "Found {} rows with zero volume ({:.2f}%)",
+    'TIME_GAPS': "Found {} large time gaps (>3 days)",
+}
+
+
+def _scan_ohlcv_numpy(o, h, l, c, v) -> Tuple:
+    """
+    Count price, OHLC consistency, extreme-move and volume anomalies.
+
+    All inputs are float64 arrays of equal length; NaN entries never count
+    as anomalies. Used directly when numba is unavailable.
+
+    Returns:
+        Tuple of (neg_open, neg_high, neg_low, neg_close, high_lt_low,
+        high_lt_open, high_lt_close, low_gt_open, low_gt_close,
+        extreme_moves, max_change, zero_volume)
+    """
+    neg_o = np.count_nonzero(o <= 0)
+    neg_h = np.count_nonzero(h <= 0)
+    neg_l = np.count_nonzero(l <= 0)
+    neg_c = np.count_nonzero(c <= 0)
+
+    # Clean data is the common case - only count per check if the
+    # combined screen finds a violation
+    hl = ho = hc = lo = lc = 0
+    if ((h < l) | (h < o) | (h < c) | (l > o) | (l > c)).any():
+        hl = np.count_nonzero(h < l)
+        ho = np.count_nonzero(h < o)
+        hc = np.count_nonzero(h < c)
+        lo = np.count_nonzero(l > o)
+        lc = np.count_nonzero(l > c)
+
+    extreme = 0
+    max_change = 0.0
+    if len(c) > 1:
+        # Single buffer: diff, then abs and divide in place
+        price_changes = np.diff(c)
+        np.abs(price_changes, out=price_changes)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.divide(price_changes, c[:-1], out=price_changes)
+        extreme = np.count_nonzero(price_changes > 0.5)
+        if extreme > 0:
+            max_change = np.nanmax(price_changes)
+
+    zero_vol = np.count_nonzero(v == 0)
+
+    return neg_o, neg_h, neg_l, neg_c, hl, ho, hc, lo, lc, extreme, max_change, zero_vol
+
+
+def _scan_ohlcv_loop(o, h, l, c, v) -> Tuple:
+    """
+    Single-pass version of _scan_ohlcv_numpy for numba compilation.
+
+    Reads each column once and allocates no temporary arrays.
+    """
+    n = len(c)
+    neg_o = neg_h = neg_l = neg_c = 0
+    hl = ho = hc = lo = lc = 0
+    extreme = 0
+    max_change = 0.0
+    zero_vol = 0
+
+    for i in range(n):
+        if o[i] <= 0:
+            neg_o += 1
+        if h[i] <= 0:
+            neg_h += 1
+        if l[i] <= 0:
+            neg_l += 1
+        if c[i] <= 0:
+            neg_c += 1
+
+        if h[i] < l[i]:
+            hl += 1
+        if h[i] < o[i]:
+            ho += 1
+        if h[i] < c[i]:
+            hc += 1
+        if l[i] > o[i]:
+            lo += 1
+        if l[i] > c[i]:
+            lc += 1
+
+        if i > 0:
+            change = abs(c[i] - c[i - 1]) / c[i - 1]
+            if change > 0.5:
+                extreme += 1
+                if change > max_change:
+                    max_change = change
+
+        if v[i] == 0:
+            zero_vol += 1
+
+    return neg_o, neg_h, neg_l, neg_c, hl, ho, hc, lo, lc, extreme, max_change, zero_vol
+
+
+if NUMBA_AVAILABLE:
+    # numpy error model: x / 0 gives inf/nan like the NumPy path instead of raising.
+    # fastmath is left off since it would assume no NaNs in the comparisons.
+    _scan_ohlcv = njit(cache=True, error_model='numpy')(_scan_ohlcv_loop)
+else:
+    _scan_ohlcv = _scan_ohlcv_numpy
 
 
 def validate_data_quality(df: pd.DataFrame, symbol: str = "Unknown") -> Dict:
@@ -28,7 +160,8 @@ def validate_data_quality(df: pd.DataFrame, symbol: str = "Unknown") -> Dict:
         symbol: Symbol name for reporting
 
     Returns:
-        Dictionary with validation results
+        Dictionary with validation results. 'warnings' and 'errors' hold
+        (code, *args) issue tuples; use format_issue() to render them.
     """
     results = {
         'symbol': symbol,
@@ -41,86 +174,112 @@ def validate_data_quality(df: pd.DataFrame, symbol: str = "Unknown") -> Dict:
     # Check for empty dataframe
     if len(df) == 0:
         results['passed'] = False
-        results['errors'].append("DataFrame is empty")
+        results['errors'].append(('EMPTY',))
         return results
 
-    # 1. Check for missing values
-    missing = df.isnull().sum()
-    if missing.any():
+    # 1. Check for missing values (one screen over the whole frame first)
+    has_missing = df.isnull().values.any()
+    if has_missing:
+        missing = df.isnull().sum()
         for col, count in missing[missing > 0].items():
             pct = (count / len(df)) * 100
-            msg = f"Column '{col}' has {count} missing values ({pct:.2f}%)"
+            issue = ('MISSING', col, count, pct)
             if pct > 5:
-                results['errors'].append(msg)
+                results['errors'].append(issue)
                 results['passed'] = False
             else:
-                results['warnings'].append(msg)
+                results['warnings'].append(issue)
+
+    # 2-5. Scan prices and volume in one fused pass; absent columns are
+    # NaN-filled so they never count as anomalies
+    n = len(df)
+    o, h, l, c, v = (
+        df[col].to_numpy(dtype=np.float64) if col in df.columns else np.full(n, np.nan)
+        for col in ('open', 'high', 'low', 'close', 'volume')
+    )
+    (neg_o, neg_h, neg_l, neg_c,
+     invalid_hl, invalid_ho, invalid_hc, invalid_lo, invalid_lc,
+     extreme_moves, max_change, zero_vol) = _scan_ohlcv(o, h, l, c, v)
 
     # 2. Check for negative prices
     price_cols = ['open', 'high', 'low', 'close']
-    for col in price_cols:
-        if col in df.columns:
-            negative_count = (df[col] <= 0).sum()
-            if negative_count > 0:
-                results['errors'].append(f"Column '{col}' has {negative_count} negative/zero values")
-                results['passed'] = False
+    for col, negative_count in zip(price_cols, (neg_o, neg_h, neg_l, neg_c)):
+        if negative_count > 0:
+            results['errors'].append(('NON_POSITIVE', col, negative_count))
+            results['passed'] = False
 
     # 3. Check OHLC consistency
-    if all(col in df.columns for col in price_cols):
-        # High should be >= Low
-        invalid_hl = (df['high'] < df['low']).sum()
-        if invalid_hl > 0:
-            results['errors'].append(f"Found {invalid_hl} rows where high < low")
-            results['passed'] = False
+    # High should be >= Low
+    if invalid_hl > 0:
+        results['errors'].append(('HIGH_LT_LOW', invalid_hl))
+        results['passed'] = False
 
-        # High should be >= Open and Close
-        invalid_ho = (df['high'] < df['open']).sum()
-        invalid_hc = (df['high'] < df['close']).sum()
-        if invalid_ho > 0 or invalid_hc > 0:
-            results['warnings'].append(f"Found {invalid_ho + invalid_hc} rows where high < open/close")
+    # High should be >= Open and Close
+    if invalid_ho > 0 or invalid_hc > 0:
+        results['warnings'].append(('HIGH_LT_OPEN_CLOSE', invalid_ho + invalid_hc))
 
-        # Low should be <= Open and Close
-        invalid_lo = (df['low'] > df['open']).sum()
-        invalid_lc = (df['low'] > df['close']).sum()
-        if invalid_lo > 0 or invalid_lc > 0:
-            results['warnings'].append(f"Found {invalid_lo + invalid_lc} rows where low > open/close")
+    # Low should be <= Open and Close
+    if invalid_lo > 0 or invalid_lc > 0:
+        results['warnings'].append(('LOW_GT_OPEN_CLOSE', invalid_lo + invalid_lc))
 
     # 4. Check for extreme price jumps (>50% in one period)
-    if 'close' in df.columns and len(df) > 1:
-        price_changes = df['close'].pct_change().abs()
-        extreme_moves = (price_changes > 0.5).sum()
-        if extreme_moves > 0:
-            max_change = price_changes.max()
-            results['warnings'].append(f"Found {extreme_moves} extreme price moves (>50%), max: {max_change:.2%}")
+    if extreme_moves > 0:
+        results['warnings'].append(('EXTREME_MOVES', extreme_moves, max_change))
 
     # 5. Check for zero volume
-    if 'volume' in df.columns:
-        zero_vol = (df['volume'] == 0).sum()
-        if zero_vol > 0:
-            pct = (zero_vol / len(df)) * 100
-            msg = f"Found {zero_vol} rows with zero volume ({pct:.2f}%)"
-            if pct > 10:
-                results['errors'].append(msg)
-                results['passed'] = False
-            else:
-                results['warnings'].append(msg)
+    if zero_vol > 0:
+        pct = (zero_vol / n) * 100
+        issue = ('ZERO_VOLUME', zero_vol, pct)
+        if pct > 10:
+            results['errors'].append(issue)
+            results['passed'] = False
+        else:
+            results['warnings'].append(issue)
 
     # 6. Check timestamp gaps (for daily data)
     if 'timestamp' in df.columns and len(df) > 1:
-        df_sorted = df.sort_values('timestamp')
-        time_diffs = df_sorted['timestamp'].diff()
+        ts = df['timestamp']
+        ts_values = ts.to_numpy()
+        if ts_values.dtype.kind != 'M':
+            ts_values = ts_values.astype('datetime64[ns]')
+        if has_missing:
+            ts_values = ts_values[~np.isnat(ts_values)]
+
+        # Work on the raw int64 ticks in the column's own resolution (no
+        # unit conversion copy) to avoid boxing Timedelta scalars
+        ts_ticks = ts_values.view('i8')
+        unit, count = np.datetime_data(ts_values.dtype)
+        gap_threshold = GAP_THRESHOLD_NS // int(np.timedelta64(count, unit) / np.timedelta64(1, 'ns'))
+
+        # Only the timestamp column is sorted, and only if it isn't already
+        if not ts.is_monotonic_increasing:
+            ts_ticks = np.sort(ts_ticks)
 
         # For daily data, expect roughly 1 day between timestamps
         # Allow some flexibility for weekends/holidays
-        expected_freq = pd.Timedelta(days=1)
-        large_gaps = time_diffs[time_diffs > expected_freq * 3]  # Gaps > 3 days
+        large_gaps = int(np.count_nonzero(np.diff(ts_ticks) > gap_threshold))
 
-        if len(large_gaps) > 0:
-            results['warnings'].append(f"Found {len(large_gaps)} large time gaps (>3 days)")
+        if large_gaps > 0:
+            results['warnings'].append(('TIME_GAPS', large_gaps))
 
     return results
 
 
+@lru_cache(maxsize=4096)
+def _date_range_cached(
+    symbol: str,
+    cache_epoch: int
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """
+    Memoized get_symbol_date_range().
+
+    cache_epoch is the current DATE_RANGE_CACHE_TTL window, so entries expire
+    when the window rolls over. Call _date_range_cached.cache_clear() to pick
+    up new data immediately.
+    """
+    return get_symbol_date_range(symbol)
+
+
 def check_data_coverage(
     symbol: str,
     required_days: int = 90,
@@ -140,7 +299,9 @@ def check_data_coverage(
     if end_date is None:
         end_date = datetime.now()
 
-    start_date, available_end_date = get_symbol_date_range(symbol)
+    start_date, available_end_date = _date_range_cached(
+        symbol, int(time.time() // DATE_RANGE_CACHE_TTL)
+    )
 
     if start_date is None:
         return {
@@ -165,82 +326,161 @@ def check_data_coverage(
     }
 
 
-def scan_all_symbols(required_days: int = 90, min_volume_usd: float = 50_000_000) -> pd.DataFrame:
+def _scan_one(symbol: str) -> Optional[Dict]:
     """
-    Scan all available symbols and return those meeting requirements.
+    Load recent data and validate a single symbol.
 
     Args:
-        required_days: Minimum days of historical data required
-        min_volume_usd: Minimum average daily volume in USD
+        symbol: Symbol name
 
     Returns:
-        DataFrame with symbol analysis including:
-        - symbol, days_available, avg_daily_volume, data_quality, etc.
+        Dictionary with volume and data quality results, or None if the
+        symbol is skipped
     """
-    print("Scanning all symbols in datawarehouse...")
-    symbols = get_available_symbols()
-    print(f"Found {len(symbols)} total symbols\n")
-
-    results = []
-
-    for i, symbol in enumerate(symbols):
-        if i % 20 == 0:
-            print(f"Processing {i}/{len(symbols)} symbols...")
-
-        # Check data coverage
-        coverage = check_data_coverage(symbol, required_days)
+    # Load recent data to calculate volume
+    try:
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=30)
+        df = load_historical_ohlcv(symbol, start_date, end_date, timeframe='1D')
 
-        if not coverage['has_coverage']:
-            continue
+        if len(df) == 0:
+            return None
 
-        # Load recent data to calculate volume
-        try:
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=30)
-            df = load_historical_ohlcv(symbol, start_date, end_date, timeframe='1D')
+        # Calculate average daily volume
+        avg_volume = df['turnover'].mean()
 
-            if len(df) == 0:
-                continue
+        # Validate data quality
+        validation = validate_data_quality(df, symbol)
 
-            # Calculate average daily volume
-            avg_volume = df['turnover'].mean()
+        return {
+            'avg_daily_volume_usd': avg_volume,
+            'data_quality_passed': validation['passed'],
+            'warnings_count': len(validation['warnings']),
+            'errors_count': len(validation['errors']),
+            'recent_close': df['close'].iloc[-1] if len(df) > 0 else None
+        }
 
-            # Validate data quality
-            validation = validate_data_quality(df, symbol)
+    except Exception as e:
+        print(f"Error processing {symbol}: {e}")
+        return None
 
-            results.append({
-                'symbol': symbol,
-                'days_available': coverage['days_available'],
-                'start_date': coverage['start_date'],
-                'end_date': coverage['end_date'],
-                'avg_daily_volume_usd': avg_volume,
-                'data_quality_passed': validation['passed'],
-                'warnings_count': len(validation['warnings']),
-                'errors_count': len(validation['errors']),
-                'recent_close': df['close'].iloc[-1] if len(df) > 0 else None
-            })
 
-        except Exception as e:
-            print(f"Error processing {symbol}: {e}")
-            continue
+def scan_all_symbols(
+    required_days: int = 90,
+    min_volume_usd: float = 50_000_000,
+    max_workers: int = 16
+) -> pd.DataFrame:
+    """
+    Scan all available symbols and return those meeting requirements.
 
-    # Convert to DataFrame
-    results_df = pd.DataFrame(results)
+    Coverage is computed for all symbols in one pass over the warehouse
+    listing; only covered symbols are then loaded, concurrently on a thread
+    pool since the per-symbol work is dominated by CSV I/O.
 
-    if len(results_df) > 0:
-        # Sort by average volume descending
-        results_df = results_df.sort_values('avg_daily_volume_usd', ascending=False)
+    Args:
+        required_days: Minimum days of historical data required
+        min_volume_usd: Minimum average daily volume in USD
+        max_workers: Maximum number of loader threads
 
-        # Filter by minimum volume
-        results_df = results_df[results_df['avg_daily_volume_usd'] >= min_volume_usd]
+    Returns:
+        DataFrame with symbol analysis including:
+        - symbol, days_available, avg_daily_volume, data_quality, etc.
+    """
+    print("Scanning all symbols in datawarehouse...")
+    date_ranges = get_all_symbol_date_ranges()
+    print(f"Found {len(date_ranges)} total symbols\n")
+
+    # Vectorized coverage check over all symbols
+    all_symbols = np.array(list(date_ranges), dtype=object)
+    starts = np.array([r[0] or np.datetime64('NaT') for r in date_ranges.values()], dtype='datetime64[ns]')
+    ends = np.array([r[1] or np.datetime64('NaT') for r in date_ranges.values()], dtype='datetime64[ns]')
+    has_range = ~np.isnat(starts)
+    all_days = np.where(has_range, (ends - starts).astype('timedelta64[D]').astype(np.int64), 0)
+    covered = has_range & (all_days >= required_days)
+
+    symbols = all_symbols[covered]
+    days_col = all_days[covered]
+    start_col = starts[covered]
+    end_col = ends[covered]
+
+    # Preallocate one typed array per output column, written by symbol index
+    n = len(symbols)
+    volume_col = np.zeros(n, dtype=np.float64)
+    passed_col = np.zeros(n, dtype=bool)
+    warnings_col = np.zeros(n, dtype=np.int64)
+    errors_col = np.zeros(n, dtype=np.int64)
+    close_col = np.full(n, np.nan, dtype=np.float64)
+    valid = np.zeros(n, dtype=bool)
+    covered_count = 0
+
+    if n > 0:
+        with ThreadPoolExecutor(max_workers=min(max_workers, n)) as executor:
+            futures = {
+                executor.submit(_scan_one, symbol): i
+                for i, symbol in enumerate(symbols)
+            }
+
+            for done, future in enumerate(as_completed(futures)):
+                if done % 20 == 0:
+                    print(f"Processing {done}/{n} symbols...")
+
+                result = future.result()
+                if result is None:
+                    continue
+                covered_count += 1
+
+                # Drop symbols below the volume floor as they arrive
+                # (written as "not >=" so a NaN volume is rejected too)
+                if not result['avg_daily_volume_usd'] >= min_volume_usd:
+                    continue
+
+                i = futures[future]
+                volume_col[i] = result['avg_daily_volume_usd']
+                passed_col[i] = result['data_quality_passed']
+                warnings_col[i] = result['warnings_count']
+                errors_col[i] = result['errors_count']
+                if result['recent_close'] is not None:
+                    close_col[i] = result['recent_close']
+                valid[i] = True
+
+    # Order the qualifying symbols by average volume descending, so the
+    # DataFrame is built already sorted from just those rows
+    keep = np.flatnonzero(valid)
+    keep = keep[np.argsort(-volume_col[keep], kind='stable')]
+
+    results_df = pd.DataFrame({
+        'symbol': symbols[keep],
+        'days_available': days_col[keep],
+        'start_date': start_col[keep],
+        'end_date': end_col[keep],
+        'avg_daily_volume_usd': volume_col[keep],
+        'data_quality_passed': passed_col[keep],
+        'warnings_count': warnings_col[keep],
+        'errors_count': errors_col[keep],
+        'recent_close': close_col[keep]
+    })
 
     print(f"\n✓ Scan complete!")
-    print(f"  Symbols with {required_days}+ days data: {len(results_df)}")
+    print(f"  Symbols with {required_days}+ days data: {covered_count}")
     print(f"  Symbols with ${min_volume_usd:,.0f}+ daily volume: {len(results_df)}")
 
     return results_df
 
 
+def format_issue(issue: Tuple) -> str:
+    """
+    Render a validation issue tuple as a human-readable message.
+
+    Args:
+        issue: (code, *args) tuple from validate_data_quality()
+
+    Returns:
+        Formatted message string
+    """
+    code, *args = issue
+    return ISSUE_MESSAGES[code].format(*args)
+
+
 def print_validation_report(validation: Dict):
     """
     Print a formatted validation report.
@@ -257,12 +497,12 @@ def print_validation_report(validation: Dict):
     if validation['errors']:
         print(f"\nErrors ({len(validation['errors'])}):")
         for error in validation['errors']:
-            print(f"  ✗ {error}")
+            print(f"  ✗ {format_issue(error)}")
 
     if validation['warnings']:
         print(f"\nWarnings ({len(validation['warnings'])}):")
         for warning in validation['warnings']:
-            print(f"  ! {warning}")
+            print(f"  ! {format_issue(warning)}")
 
     if not validation['errors'] and not validation['warnings']:
         print("\n✓ No issues found")
@@ -7,10 +7,63 @@ Works identically for demo and live - mode is just a column.
 
 import sqlite3
 import json
+import threading
+from collections import deque
 from datetime import datetime
 from typing import Dict, List, Optional
 from pathlib import Path
-import shutil
+
+# Event writes are buffered and flushed in batches by a background thread
+EVENT_FLUSH_INTERVAL = 0.05  # seconds
+EVENT_FLUSH_BATCH_SIZE = 100
+
+_INSERT_TRADE = '''
+    INSERT INTO trades (
+        trade_id, mode, symbol, side, entry_time, entry_price,
+        quantity, position_size_usd, stop_loss, take_profit, signal_strength
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_UPDATE_TRADE_EXIT = '''
+    UPDATE trades
+    SET exit_time = ?, exit_price = ?, pnl_usd = ?,
+        pnl_pct = ?, exit_reason = ?, holding_time_seconds = ?
+    WHERE trade_id = ?
+'''
+
+_SELECT_TRADES_BETWEEN = '''
+    SELECT * FROM trades
+    WHERE exit_time >= ? AND exit_time < ?
+'''
+
+_COUNT_TRADES_BETWEEN = '''
+    SELECT COUNT(*) FROM trades
+    WHERE exit_time >= ? AND exit_time < ?
+'''
+
+_UPSERT_DAILY_SNAPSHOT = '''
+    INSERT OR REPLACE INTO daily_snapshots (
+        date, mode, starting_equity, ending_equity,
+        daily_pnl, daily_pnl_pct, trades_count, wins_count,
+        losses_count, open_positions
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_INSERT_EVENT = '''
+    INSERT INTO system_events (event_time, event_type, event_level, message, details)
+    VALUES (?, ?, ?, ?, ?)
+'''
+
+_INSERT_RISK_EVENT = '''
+    INSERT INTO risk_events (event_time, risk_type, current_value, limit_value, action_taken)
+    VALUES (?, ?, ?, ?, ?)
+'''
+
+
+def _rows_to_dicts(cursor: sqlite3.Cursor) -> List[Dict]:
+    """Convert a cursor's result rows to dicts, resolving column names once."""
+    cols = tuple(c[0] for c in cursor.description)
+    return [dict(zip(cols, row)) for row in cursor.fetchall()]
 
 
 class TradeDatabase:
@@ -35,11 +88,40 @@ class TradeDatabase:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
         self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row  # Return rows as dictionaries
 
+        # Connection is shared across threads - serialize writers, which
+        # all reuse a single cursor while holding the lock
+        self._lock = threading.Lock()
+        self._cursor = self.conn.cursor()
+
+        self._tune_pragmas()
         self._create_tables()
+
+        # Buffered system/risk events, written by the flusher thread
+        self._event_buf = deque()
+        self._risk_buf = deque()
+        self._flush_requested = threading.Event()
+        self._stopping = threading.Event()
+        self._flusher_thread = threading.Thread(
+            target=self._flusher, name="TradeDatabaseFlusher", daemon=True
+        )
+        self._flusher_thread.start()
+
         print(f"✓ Database initialized: {self.db_path}")
 
+    def _tune_pragmas(self):
+        """
+        Configure SQLite for a write-heavy trade logger.
+
+        WAL with synchronous=NORMAL avoids an fsync on every commit while
+        keeping the database consistent, and lets readers run during writes.
+        """
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('PRAGMA temp_store=MEMORY')
+        self.conn.execute('PRAGMA mmap_size=268435456')  # 256 MB
+        self.conn.execute('PRAGMA cache_size=-65536')  # 64 MB
+
     def _create_tables(self):
         """Create database tables if they don't exist."""
         cursor = self.conn.cursor()
@@ -118,6 +200,10 @@ class TradeDatabase:
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_trades_entry_time ON trades(entry_time)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_trades_mode ON trades(mode)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_daily_date ON daily_snapshots(date)')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_trades_closed ON trades(mode, exit_time)
+            WHERE exit_time IS NOT NULL
+        ''')
 
         self.conn.commit()
 
@@ -134,24 +220,18 @@ class TradeDatabase:
         position_size_usd: float,
         stop_loss: float = None,
         take_profit: float = None,
-        signal_strength: float = None
+        signal_strength: float = None,
+        ts: datetime = None
     ) -> int:
-        """Log a new trade entry."""
-        cursor = self.conn.cursor()
-
-        cursor.execute('''
-            INSERT INTO trades (
-                trade_id, mode, symbol, side, entry_time, entry_price,
-                quantity, position_size_usd, stop_loss, take_profit, signal_strength
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            trade_id, mode, symbol, side, datetime.now(),
-            entry_price, quantity, position_size_usd,
-            stop_loss, take_profit, signal_strength
-        ))
-
-        self.conn.commit()
-        return cursor.lastrowid
+        """Log a new trade entry (entry_time is ts, default now)."""
+        with self._lock:
+            self._cursor.execute(_INSERT_TRADE, (
+                trade_id, mode, symbol, side, ts or datetime.now(),
+                entry_price, quantity, position_size_usd,
+                stop_loss, take_profit, signal_strength
+            ))
+            self.conn.commit()
+            return self._cursor.lastrowid
 
     def log_trade_exit(
         self,
@@ -160,22 +240,16 @@ class TradeDatabase:
         pnl_usd: float,
         pnl_pct: float,
         exit_reason: str,
-        holding_time_seconds: int
+        holding_time_seconds: int,
+        ts: datetime = None
     ):
-        """Log trade exit."""
-        cursor = self.conn.cursor()
-
-        cursor.execute('''
-            UPDATE trades
-            SET exit_time = ?, exit_price = ?, pnl_usd = ?,
-                pnl_pct = ?, exit_reason = ?, holding_time_seconds = ?
-            WHERE trade_id = ?
-        ''', (
-            datetime.now(), exit_price, pnl_usd,
-            pnl_pct, exit_reason, holding_time_seconds, trade_id
-        ))
-
-        self.conn.commit()
+        """Log trade exit (exit_time is ts, default now)."""
+        with self._lock:
+            self._cursor.execute(_UPDATE_TRADE_EXIT, (
+                ts or datetime.now(), exit_price, pnl_usd,
+                pnl_pct, exit_reason, holding_time_seconds, trade_id
+            ))
+            self.conn.commit()
 
     def get_open_trades(self, mode: str = None) -> List[Dict]:
         """Get all open trades."""
@@ -194,7 +268,7 @@ class TradeDatabase:
                 ORDER BY entry_time DESC
             ''')
 
-        return [dict(row) for row in cursor.fetchall()]
+        return _rows_to_dicts(cursor)
 
     def get_recent_trades(self, limit: int = 50, mode: str = None) -> List[Dict]:
         """Get recent closed trades."""
@@ -215,7 +289,41 @@ class TradeDatabase:
                 LIMIT ?
             ''', (limit,))
 
-        return [dict(row) for row in cursor.fetchall()]
+        return _rows_to_dicts(cursor)
+
+    def get_trades_between(self, start: datetime, end: datetime, mode: str = None) -> List[Dict]:
+        """
+        Get trades closed in [start, end), oldest first.
+
+        The range is filtered in SQL (exit_time is stored as an ISO string,
+        so it compares in time order) and entry_time/exit_time come back as
+        datetime objects.
+        """
+        cursor = self.conn.cursor()
+
+        if mode:
+            cursor.execute(_SELECT_TRADES_BETWEEN + ' AND mode = ? ORDER BY exit_time',
+                           (start, end, mode))
+        else:
+            cursor.execute(_SELECT_TRADES_BETWEEN + ' ORDER BY exit_time', (start, end))
+
+        trades = _rows_to_dicts(cursor)
+        for trade in trades:
+            for col in ('entry_time', 'exit_time'):
+                if isinstance(trade[col], str):
+                    trade[col] = datetime.fromisoformat(trade[col])
+        return trades
+
+    def count_trades_between(self, start: datetime, end: datetime, mode: str = None) -> int:
+        """Count trades closed in [start, end) without fetching them."""
+        cursor = self.conn.cursor()
+
+        if mode:
+            cursor.execute(_COUNT_TRADES_BETWEEN + ' AND mode = ?', (start, end, mode))
+        else:
+            cursor.execute(_COUNT_TRADES_BETWEEN, (start, end))
+
+        return cursor.fetchone()[0]
 
     # ========== Daily Snapshots ==========
 
@@ -233,21 +341,13 @@ class TradeDatabase:
         open_positions: int
     ):
         """Save daily performance snapshot."""
-        cursor = self.conn.cursor()
-
-        cursor.execute('''
-            INSERT OR REPLACE INTO daily_snapshots (
+        with self._lock:
+            self._cursor.execute(_UPSERT_DAILY_SNAPSHOT, (
                 date, mode, starting_equity, ending_equity,
                 daily_pnl, daily_pnl_pct, trades_count, wins_count,
                 losses_count, open_positions
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            date, mode, starting_equity, ending_equity,
-            daily_pnl, daily_pnl_pct, trades_count, wins_count,
-            losses_count, open_positions
-        ))
-
-        self.conn.commit()
+            ))
+            self.conn.commit()
 
     def get_daily_snapshots(self, days: int = 30, mode: str = None) -> List[Dict]:
         """Get recent daily snapshots."""
@@ -267,7 +367,7 @@ class TradeDatabase:
                 LIMIT ?
             ''', (days,))
 
-        return [dict(row) for row in cursor.fetchall()]
+        return _rows_to_dicts(cursor)
 
     # ========== System Events ==========
 
@@ -276,31 +376,33 @@ class TradeDatabase:
         event_type: str,
         level: str,
         message: str,
-        details: Dict = None
+        details: Dict = None,
+        ts: datetime = None
     ):
         """
         Log a system event.
 
+        Events are buffered and written in batches by a background thread;
+        call flush() to force them to disk.
+
         Args:
             event_type: Type (SYSTEM_START, SYSTEM_STOP, TRADE, ERROR, etc.)
             level: Level (INFO, WARNING, ERROR, CRITICAL)
             message: Event message
             details: Additional details as dict
+            ts: Event time (default: now)
         """
-        cursor = self.conn.cursor()
-
-        cursor.execute('''
-            INSERT INTO system_events (event_time, event_type, event_level, message, details)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (
-            datetime.now(), event_type, level, message,
+        self._event_buf.append((
+            ts or datetime.now(), event_type, level, message,
             json.dumps(details) if details else None
         ))
 
-        self.conn.commit()
+        if len(self._event_buf) >= EVENT_FLUSH_BATCH_SIZE:
+            self._flush_requested.set()
 
     def get_recent_events(self, limit: int = 100, level: str = None) -> List[Dict]:
         """Get recent system events."""
+        self.flush()
         cursor = self.conn.cursor()
 
         if level:
@@ -317,7 +419,7 @@ class TradeDatabase:
                 LIMIT ?
             ''', (limit,))
 
-        return [dict(row) for row in cursor.fetchall()]
+        return _rows_to_dicts(cursor)
 
     # ========== Risk Events ==========
 
@@ -326,17 +428,55 @@ class TradeDatabase:
         risk_type: str,
         current_value: float,
         limit_value: float,
-        action_taken: str
+        action_taken: str,
+        ts: datetime = None
     ):
-        """Log a risk limit event."""
-        cursor = self.conn.cursor()
-
-        cursor.execute('''
-            INSERT INTO risk_events (event_time, risk_type, current_value, limit_value, action_taken)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (datetime.now(), risk_type, current_value, limit_value, action_taken))
-
-        self.conn.commit()
+        """Log a risk limit event (buffered like log_event)."""
+        self._risk_buf.append((ts or datetime.now(), risk_type, current_value, limit_value, action_taken))
+
+        if len(self._risk_buf) >= EVENT_FLUSH_BATCH_SIZE:
+            self._flush_requested.set()
+
+    def flush(self):
+        """Write all buffered system and risk events in a single transaction."""
+        events = self._drain(self._event_buf)
+        risk_events = self._drain(self._risk_buf)
+
+        if not events and not risk_events:
+            return
+
+        with self._lock:
+            try:
+                if events:
+                    self._cursor.executemany(_INSERT_EVENT, events)
+                if risk_events:
+                    self._cursor.executemany(_INSERT_RISK_EVENT, risk_events)
+                self.conn.commit()
+            except sqlite3.Error:
+                # Put the batch back at the front so it is retried, in order,
+                # by the next flush instead of being lost
+                self.conn.rollback()
+                self._event_buf.extendleft(reversed(events))
+                self._risk_buf.extendleft(reversed(risk_events))
+                raise
+
+    @staticmethod
+    def _drain(buf: deque) -> List[tuple]:
+        """Pop every row currently in a buffer."""
+        rows = []
+        while buf:
+            rows.append(buf.popleft())
+        return rows
+
+    def _flusher(self):
+        """Background loop flushing buffered events periodically or when full."""
+        while not self._stopping.is_set():
+            self._flush_requested.wait(EVENT_FLUSH_INTERVAL)
+            self._flush_requested.clear()
+            try:
+                self.flush()
+            except sqlite3.Error as e:
+                print(f"Error flushing events: {e}")
 
     # ========== Statistics ==========
 
@@ -353,7 +493,10 @@ class TradeDatabase:
             params.append(mode)
 
         if days:
-            conditions.append("exit_time >= datetime('now', '-{} days')".format(days))
+            if not isinstance(days, int) or isinstance(days, bool):
+                raise ValueError(f"days must be an int, got {days!r}")
+            conditions.append("exit_time >= datetime('now', ? || ' days')")
+            params.append(f"-{days}")
 
         where_clause = " AND ".join(conditions)
 
@@ -374,24 +517,25 @@ class TradeDatabase:
             WHERE {where_clause}
         ''', params)
 
-        row = cursor.fetchone()
+        (total_trades, wins, losses, total_pnl, avg_pnl_pct, avg_win_pct,
+         avg_loss_pct, best_trade, worst_trade, avg_holding_seconds) = cursor.fetchone()
 
-        total_trades = row['total_trades'] or 0
-        wins = row['wins'] or 0
-        losses = row['losses'] or 0
+        total_trades = total_trades or 0
+        wins = wins or 0
+        losses = losses or 0
 
         return {
             'total_trades': total_trades,
             'wins': wins,
             'losses': losses,
             'win_rate': wins / total_trades if total_trades > 0 else 0,
-            'total_pnl': row['total_pnl'] or 0,
-            'avg_pnl_pct': row['avg_pnl_pct'] or 0,
-            'avg_win_pct': row['avg_win_pct'] or 0,
-            'avg_loss_pct': row['avg_loss_pct'] or 0,
-            'best_trade': row['best_trade'] or 0,
-            'worst_trade': row['worst_trade'] or 0,
-            'avg_holding_hours': (row['avg_holding_seconds'] or 0) / 3600
+            'total_pnl': total_pnl or 0,
+            'avg_pnl_pct': avg_pnl_pct or 0,
+            'avg_win_pct': avg_win_pct or 0,
+            'avg_loss_pct': avg_loss_pct or 0,
+            'best_trade': best_trade or 0,
+            'worst_trade': worst_trade or 0,
+            'avg_holding_hours': (avg_holding_seconds or 0) / 3600
         }
 
     # ========== Backup & Maintenance ==========
@@ -402,12 +546,23 @@ class TradeDatabase:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             backup_path = f"{self.db_path}.backup_{timestamp}"
 
-        shutil.copy2(self.db_path, backup_path)
+        # Flush pending events, then copy a consistent snapshot page by page
+        # while other writers keep working
+        self.flush()
+        dst = sqlite3.connect(backup_path)
+        try:
+            self.conn.backup(dst, pages=256, sleep=0.005)
+        finally:
+            dst.close()
         print(f"✓ Database backed up to: {backup_path}")
         return backup_path
 
     def close(self):
-        """Close database connection."""
+        """Flush buffered events and close database connection."""
+        self._stopping.set()
+        self._flush_requested.set()
+        self._flusher_thread.join()
+        self.flush()
         self.conn.close()
 
 
@@ -6,21 +6,92 @@ Mode is controlled by configuration - no code changes needed.
 """
 
 import os
+import copy
 import time
+import socket
+import ssl
 import hmac
 import hashlib
 import requests
-from typing import Dict, List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+from typing import Dict, List, Optional, Tuple
+from decimal import Decimal
 from datetime import datetime
 import json
 import sys
-import math
+import logging
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
 from config.trading_config import TradingMode
 
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+    _json_loads = json.loads
+
+# OpenSSL HMAC via cryptography signs ~2x faster than the stdlib hmac
+# object (0.76us vs 1.5us per copy+sign on CPython 3.11)
+try:
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives import hmac as _crypto_hmac
+except ImportError:
+    _crypto_hmac = None
+
+# HTTP/2 lets concurrent REST calls share one multiplexed connection
+try:
+    import httpx
+    import h2  # noqa: F401 - required by httpx for http2=True
+    _HTTP_ERRORS = (requests.exceptions.RequestException, httpx.HTTPError)
+except ImportError:
+    httpx = None
+    _HTTP_ERRORS = (requests.exceptions.RequestException,)
+
+try:
+    from pybit.unified_trading import WebSocket
+except ImportError:
+    WebSocket = None
+
+
+# TCP keepalive stops NATs/firewalls silently dropping pooled connections
+# while the bot idles between trading loops, which would otherwise cost a
+# fresh TCP+TLS handshake on the first call after the pause
+_SOCKET_OPTIONS = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+if hasattr(socket, "TCP_KEEPIDLE"):
+    _SOCKET_OPTIONS += [
+        (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60),
+        (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 30),
+    ]
+
+
+class InvalidOrder(ValueError):
+    """Order rejected locally because it breaks the instrument's rules."""
+
+
+class _PooledTLSAdapter(HTTPAdapter):
+    """HTTPAdapter whose pools share one SSL context and keepalive sockets."""
+
+    def __init__(self, ssl_context: ssl.SSLContext, **kwargs):
+        self._ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["ssl_context"] = self._ssl_context
+        kwargs["socket_options"] = HTTPConnection.default_socket_options + _SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
 
 class BybitExchange:
     """
@@ -30,7 +101,18 @@ class BybitExchange:
     All methods work identically for demo and live.
     """
 
-    def __init__(self, mode: TradingMode, api_key: str, api_secret: str, base_url: str):
+    # Max orders per /v5/order/create-batch request
+    BATCH_ORDER_LIMIT = 10
+
+    def __init__(
+        self,
+        mode: TradingMode,
+        api_key: str,
+        api_secret: str,
+        base_url: str,
+        ticker_cache_ttl: float = 0.1,
+        http2: bool = True
+    ):
         """
         Initialize exchange client.
 
@@ -39,6 +121,10 @@ class BybitExchange:
             api_key: API key
             api_secret: API secret
             base_url: API base URL
+            ticker_cache_ttl: Seconds a ticker/orderbook response is reused
+                for identical requests (0 disables)
+            http2: Use an HTTP/2 httpx client when httpx[http2] is
+                installed (falls back to a requests session otherwise)
         """
         self.mode = mode
         self.api_key = api_key
@@ -46,22 +132,114 @@ class BybitExchange:
         self.base_url = base_url
         self.recv_window = 20000  # Increased to handle clock skew (system time issue)
 
-        self.session = requests.Session()
+        # Signing inputs that never change, pre-encoded once
+        self._api_key_bytes = (self.api_key or "").encode()
+        # HMAC keyed with the secret; the key schedule (inner/outer pads)
+        # is computed once here and copied for each signature
+        secret = (self.api_secret or "").encode()
+        if _crypto_hmac is not None:
+            self._hmac_template = _crypto_hmac.HMAC(secret, hashes.SHA256())
+        else:
+            self._hmac_template = hmac.new(secret, b"", hashlib.sha256)
+        self._recv_window_bytes = str(self.recv_window).encode()
+        self._auth_headers = {
+            "X-BAPI-API-KEY": self.api_key,
+            "X-BAPI-SIGN-TYPE": "2",
+            "X-BAPI-RECV-WINDOW": str(self.recv_window)
+        }
+
+        # One SSL context (CA bundle loaded once) for every connection
+        self._ssl_context = ssl.create_default_context()
+
+        if http2 and httpx is not None:
+            # One TLS connection multiplexes concurrent calls; transport
+            # retries only cover failed connects, so they are POST-safe
+            self.session = httpx.Client(
+                transport=httpx.HTTPTransport(
+                    verify=self._ssl_context,
+                    http2=True,
+                    retries=2,
+                    # httpx drops idle connections after 5s by default,
+                    # forcing a new TLS handshake every trading loop
+                    limits=httpx.Limits(
+                        max_keepalive_connections=8,
+                        max_connections=32,
+                        keepalive_expiry=300.0
+                    ),
+                    socket_options=_SOCKET_OPTIONS
+                ),
+                headers={"Content-Type": "application/json"},
+                timeout=10.0
+            )
+            self._body_kwarg = "content"
+        else:
+            self.session = self._requests_session(self._ssl_context)
+            self._body_kwarg = "data"
+
+        # Independent read calls (account snapshot, health check) are
+        # dispatched concurrently so they cost ~1 RTT instead of one each
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="bybit")
 
         self.instrument_info_cache: Dict[str, Dict] = {}
+        # Per-symbol (qty_step, min_qty, max_qty, max_mkt_qty, tick_size) as
+        # Decimals, derived once from instrument info
+        self._qty_rules: Dict[str, Tuple[Decimal, ...]] = {}
+
+        # Short-lived ticker/orderbook responses: key -> (fetched_at, data)
+        self.ticker_cache_ttl = ticker_cache_ttl
+        self._market_cache: Dict[tuple, Tuple[float, Dict]] = {}
+
+        # WebSocket streams (opt-in via start_streams); while connected,
+        # tickers and positions are served from pushed state instead of REST
+        self._public_ws = None
+        self._private_ws = None
+        self._ticker_state: Dict[str, Dict] = {}
+        self._position_state: Dict[str, Dict] = {}
 
         mode_str = "🟡 DEMO" if mode == TradingMode.DEMO else "🔴 LIVE"
-        print(f"Bybit Exchange initialized: {mode_str}")
-        print(f"API Endpoint: {self.base_url}")
-
-    def _generate_signature(self, params_str: str, timestamp: str) -> str:
-        """Generate HMAC SHA256 signature for V5 API."""
-        param_str = str(timestamp) + self.api_key + str(self.recv_window) + params_str
-        return hmac.new(
-            self.api_secret.encode('utf-8'),
-            param_str.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
+        logger.info("Bybit Exchange initialized: %s", mode_str)
+        logger.info("API Endpoint: %s", self.base_url)
+
+    @staticmethod
+    def _requests_session(ssl_context: ssl.SSLContext) -> requests.Session:
+        """
+        Session for connection pooling - all calls go to a single host, so
+        keep one large pool of kept-alive connections to it.
+        """
+        session = requests.Session()
+        adapter = _PooledTLSAdapter(
+            ssl_context,
+            pool_connections=4,
+            pool_maxsize=32,
+            # Only idempotent GETs are retried; a retried POST could
+            # duplicate an order
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.1,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=["GET"]
+            )
+        )
+        session.mount("https://", adapter)
+        session.headers.update({
+            "Connection": "keep-alive",
+            "Content-Type": "application/json"
+        })
+        return session
+
+    def _generate_signature(self, payload: bytes, timestamp: str) -> str:
+        """Generate HMAC SHA256 signature for V5 API over the exact bytes sent."""
+        message = (
+            timestamp.encode() + self._api_key_bytes
+            + self._recv_window_bytes + payload
+        )
+        # Copying the pre-keyed template skips the per-call key setup, which
+        # benchmarks faster than one-shot hmac.digest()
+        mac = self._hmac_template.copy()
+        mac.update(message)
+        if _crypto_hmac is not None:
+            return mac.finalize().hex()
+        return mac.hexdigest()
 
     def _send_request(
         self,
@@ -74,44 +252,48 @@ class BybitExchange:
         url = self.base_url + endpoint
         params = params or {}
 
-        headers = {"Content-Type": "application/json"}
+        # Content-Type is a session default; only auth headers vary per call
+        headers = None
 
-        if auth_required:
-            timestamp = int(time.time() * 1000)
+        # Payloads are serialized once; the same bytes are signed and sent
+        # (GET query in sorted key order, POST as a JSON body)
+        query = urlencode(sorted(params.items())) if method == "GET" else ""
+        body = _json_dumps(params) if method == "POST" and params else b""
 
-            if method == "GET":
-                params_str = "&".join([f"{k}={v}" for k, v in sorted(params.items())])
-            else:
-                params_str = json.dumps(params) if params else ""
+        if auth_required:
+            # Integer nanoseconds -> milliseconds, no float round trip
+            timestamp = str(time.time_ns() // 1_000_000)
 
-            signature = self._generate_signature(params_str, timestamp)
+            payload = query.encode() if method == "GET" else body
+            signature = self._generate_signature(payload, timestamp)
 
-            headers.update({
-                "X-BAPI-API-KEY": self.api_key,
-                "X-BAPI-SIGN": signature,
-                "X-BAPI-SIGN-TYPE": "2",
-                "X-BAPI-TIMESTAMP": str(timestamp),
-                "X-BAPI-RECV-WINDOW": str(self.recv_window)
-            })
+            headers = self._auth_headers.copy()
+            headers["X-BAPI-SIGN"] = signature
+            headers["X-BAPI-TIMESTAMP"] = timestamp
 
         try:
             if method == "GET":
-                response = self.session.get(url, params=params, headers=headers, timeout=10)
+                if query:
+                    url += "?" + query
+                response = self.session.get(url, headers=headers, timeout=10)
             elif method == "POST":
-                response = self.session.post(url, json=params, headers=headers, timeout=10)
+                response = self.session.post(
+                    url, headers=headers, timeout=10, **{self._body_kwarg: body}
+                )
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
 
             response.raise_for_status()
-            result = response.json()
+            # Parse the raw body bytes; skips decoding to str first
+            result = _json_loads(response.content)
 
             if result.get('retCode') != 0:
                 raise Exception(f"Bybit API Error: {result.get('retMsg', 'Unknown error')}")
 
             return result
 
-        except requests.exceptions.RequestException as e:
-            print(f"Request error: {e}")
+        except _HTTP_ERRORS as e:
+            logger.warning("Request error: %s %s: %s", method, endpoint, e)
             raise
 
     # ========== Market Data ==========
@@ -127,19 +309,93 @@ class BybitExchange:
         result = self._send_request("GET", "/v5/market/instruments-info", params)
         
         info = result['result']['list'][0]
-        self.instrument_info_cache[symbol] = info
+        self._cache_instrument(symbol, info)
         return info
 
+    def preload_instruments(self, category: str = "linear") -> int:
+        """
+        Fetch and cache instrument rules for every symbol in a category.
+
+        Warms the cache in a few paged requests so the first order on each
+        symbol doesn't pay an extra round trip.
+
+        Returns:
+            Number of instruments cached
+        """
+        params = {"category": category, "limit": 1000}
+        count = 0
+
+        while True:
+            result = self._send_request("GET", "/v5/market/instruments-info", params)
+            for info in result['result']['list']:
+                self._cache_instrument(info['symbol'], info)
+                count += 1
+
+            cursor = result['result'].get('nextPageCursor')
+            if not cursor:
+                break
+            params["cursor"] = cursor
+
+        return count
+
+    def _cache_instrument(self, symbol: str, info: Dict):
+        """Cache instrument info and precompute its quantity rounding rules."""
+        self.instrument_info_cache[symbol] = info
+        lot = info['lotSizeFilter']
+        qty_step = Decimal(lot['qtyStep'])
+        max_qty = Decimal(lot.get('maxOrderQty') or 'Infinity')
+        tick_size = info.get('priceFilter', {}).get('tickSize')
+
+        self._qty_rules[symbol] = (
+            qty_step,
+            Decimal(lot.get('minOrderQty') or qty_step),
+            max_qty,
+            Decimal(lot.get('maxMktOrderQty') or max_qty),
+            Decimal(tick_size) if tick_size else None
+        )
+
+    def _get_market_cached(self, endpoint: str, params: Dict) -> Dict:
+        """
+        GET a public market endpoint, reusing a response younger than
+        ticker_cache_ttl so repeated calls within one tick cost one request.
+
+        Callers get their own copy, so mutating it can't alter the cached
+        response seen by others.
+        """
+        key = (endpoint, *params.values())
+        now = time.monotonic()
+
+        hit = self._market_cache.get(key)
+        if hit is not None and now - hit[0] < self.ticker_cache_ttl:
+            return copy.deepcopy(hit[1])
+
+        result = self._send_request("GET", endpoint, params)
+        # Drop expired entries as new ones arrive, so the cache only ever
+        # holds what was fetched within the last TTL
+        self._market_cache = {
+            k: v for k, v in list(self._market_cache.items())
+            if now - v[0] < self.ticker_cache_ttl
+        }
+        self._market_cache[key] = (now, result)
+        return copy.deepcopy(result)
+
     def get_ticker(self, symbol: str, category: str = "linear") -> Dict:
-        """Get latest ticker."""
+        """Get latest ticker (from the stream when subscribed and connected)."""
+        if category == "linear" and self._public_ws is not None and self._public_ws.is_connected():
+            ticker = self._ticker_state.get(symbol)
+            if ticker is not None:
+                return ticker
+            # First request for this symbol: subscribe, answer from REST
+            self.watch_symbol(symbol)
+
         params = {"category": category, "symbol": symbol}
-        result = self._send_request("GET", "/v5/market/tickers", params)
+        result = self._get_market_cached("/v5/market/tickers", params)
         return result['result']['list'][0] if result['result']['list'] else {}
 
     def get_orderbook(self, symbol: str, category: str = "linear", limit: int = 25) -> Dict:
         """Get order book."""
         params = {"category": category, "symbol": symbol, "limit": limit}
-        result = self._send_request("GET", "/v5/market/orderbook", params)
+        result = self._get_market_cached("/v5/market/orderbook", params)
         return result['result']
 
     def get_kline(
@@ -167,6 +423,109 @@ class BybitExchange:
         result = self._send_request("GET", "/v5/market/kline", params)
         return result['result']['list']
 
+    # ========== Streaming ==========
+
+    def start_streams(self, symbols: List[str] = None) -> bool:
+        """
+        Open WebSocket streams for market data and (with keys) positions.
+
+        Public tickers always come from the mainnet stream - demo accounts
+        share mainnet market data - while the private stream follows the
+        trading mode. Until a stream connects, getters fall back to REST.
+
+        Args:
+            symbols: Linear symbols to subscribe to up front; others are
+                subscribed on their first get_ticker() call
+
+        Returns:
+            True if streams were started, False if pybit is unavailable
+        """
+        if WebSocket is None:
+            logger.warning("pybit not installed - market data stays on REST")
+            return False
+
+        self._public_ws = WebSocket(testnet=False, channel_type="linear")
+        for symbol in symbols or []:
+            self.watch_symbol(symbol)
+
+        if self.api_key and self.api_secret:
+            self._private_ws = WebSocket(
+                testnet=False,
+                demo=self.mode == TradingMode.DEMO,
+                channel_type="private",
+                api_key=self.api_key,
+                api_secret=self.api_secret
+            )
+            self._private_ws.position_stream(self._on_position)
+
+            # The position topic only pushes changes, so seed current state
+            # from REST without overwriting anything already pushed
+            for position in self._get_positions_rest():
+                self._position_state.setdefault(position['symbol'], position)
+
+        return True
+
+    def stop_streams(self):
+        """Close any open WebSocket streams."""
+        for ws in (self._public_ws, self._private_ws):
+            if ws is not None:
+                ws.exit()
+        self._public_ws = None
+        self._private_ws = None
+        self._ticker_state.clear()
+        self._position_state.clear()
+
+    def watch_symbol(self, symbol: str):
+        """Subscribe to a symbol's ticker stream (no-op if already watched)."""
+        if self._public_ws is None or symbol in self._ticker_state:
+            return
+        # Placeholder marks the topic as subscribed until the snapshot lands
+        self._ticker_state[symbol] = None
+        self._public_ws.ticker_stream(symbol=symbol, callback=self._on_ticker)
+
+    def _on_ticker(self, message: Dict):
+        """Apply a ticker snapshot or delta to the cached state."""
+        data = message['data']
+        symbol = data['symbol']
+        if message.get('type') == 'snapshot' or not self._ticker_state.get(symbol):
+            self._ticker_state[symbol] = data
+        else:
+            # Deltas carry only changed fields; swap in a merged copy so
+            # readers never see a half-updated dict
+            self._ticker_state[symbol] = {**self._ticker_state[symbol], **data}
+
+    def _on_position(self, message: Dict):
+        """Record pushed position updates (size "0" once closed)."""
+        for position in message['data']:
+            if position.get('category', 'linear') == 'linear':
+                self._position_state[position['symbol']] = position
+
+    def get_kline_np(
+        self,
+        symbol: str,
+        interval: str = "240",
+        category: str = "linear",
+        limit: int = 200,
+        start_time: datetime = None,
+        end_time: datetime = None
+    ) -> np.ndarray:
+        """
+        Get candlestick data as a float64 array, oldest bar first.
+
+        Columns: timestamp (ms), open, high, low, close, volume, turnover.
+        The exchange's string fields are parsed in one pass by NumPy.
+        """
+        klines = self.get_kline(symbol, interval, category, limit, start_time, end_time)
+        if not klines:
+            return np.empty((0, 7), dtype=np.float64)
+
+        arr = np.array(klines, dtype=np.float64)
+        if arr.ndim != 2 or arr.shape[1] != 7:
+            raise ValueError(f"Unexpected kline shape {arr.shape} for {symbol}")
+
+        # Bybit returns newest first; sort rather than trust that
+        return arr[np.argsort(arr[:, 0], kind='stable')]
+
     # ========== Account ==========
 
     def get_wallet_balance(self, account_type: str = "UNIFIED") -> Dict:
@@ -186,6 +545,21 @@ class BybitExchange:
 
         Note: Bybit V5 API requires either symbol OR settleCoin parameter.
         """
+        if category == "linear" and self._private_ws is not None and self._private_ws.is_connected():
+            if symbol:
+                position = self._position_state.get(symbol)
+                return [position] if position is not None else []
+            # Snapshot first: the WS thread adds symbols while we filter
+            # (list() copies in one step under the GIL)
+            return [
+                p for p in list(self._position_state.values())
+                if float(p.get('size') or 0) and p.get('settleCoin', settle_coin) == settle_coin
+            ]
+
+        return self._get_positions_rest(symbol, category, settle_coin)
+
+    def _get_positions_rest(self, symbol: str = None, category: str = "linear", settle_coin: str = "USDT") -> List[Dict]:
+        """Fetch positions over REST."""
         params = {"category": category}
 
         if symbol:
@@ -222,32 +596,140 @@ class BybitExchange:
                           Note: This is the distance (in price), not percentage.
                           Example: For BTC at $60,000 with 10% trailing, pass 6000.
         """
-        # 1. Fetch instrument rules
+        params = {
+            "category": category,
+            **self._order_params(
+                symbol, side, order_type, qty, price, category,
+                time_in_force, reduce_only, stop_loss, take_profit
+            )
+        }
+
+        # Send the request
+        result = self._send_request("POST", "/v5/order/create", params, auth_required=True)
+        order_result = result['result']
+
+        # Set trailing stop on position if requested
+        # Note: Bybit API requires trailing stop to be set AFTER order fills, not during order creation
+        if trailing_stop is not None and not reduce_only:
+            try:
+                # Wait for the fill so there is a position to attach to
+                if self._wait_for_fill(symbol, order_result['orderId'], category):
+                    # Set trailing stop on the position
+                    self.set_trading_stop(
+                        symbol=symbol,
+                        trailing_stop=trailing_stop,
+                        category=category,
+                        position_idx=position_idx
+                    )
+                    order_result['trailing_stop_set'] = True
+                    order_result['trailing_stop_distance'] = trailing_stop
+                else:
+                    logger.warning(
+                        "Order %s for %s not filled yet; trailing stop not set",
+                        order_result['orderId'], symbol
+                    )
+                    order_result['trailing_stop_set'] = False
+                    order_result['trailing_stop_error'] = "order not filled"
+            except Exception as e:
+                # Don't fail the order if trailing stop fails, just log warning
+                logger.warning("Order placed but could not set trailing stop: %s", e)
+                order_result['trailing_stop_set'] = False
+                order_result['trailing_stop_error'] = str(e)
+
+        return order_result
+
+    def place_orders_batch(self, orders: List[Dict], category: str = "linear") -> List[Dict]:
+        """
+        Place several orders with one signed request per 10 orders.
+
+        Args:
+            orders: Dicts with place_order's keyword names (symbol, side,
+                    order_type, qty and optionally price, time_in_force,
+                    reduce_only, stop_loss, take_profit). Trailing stops are
+                    not supported here - set them per position afterwards.
+
+        Returns:
+            One result per order, in input order, each with the per-order
+            'code'/'msg' reported by the exchange (code 0 = accepted)
+
+        Raises:
+            InvalidOrder: If any order breaks its instrument's size rules;
+                nothing is sent in that case
+        """
+        order_requests = [
+            self._order_params(
+                o['symbol'], o['side'], o['order_type'], o['qty'],
+                o.get('price'), category, o.get('time_in_force', "GTC"),
+                o.get('reduce_only', False), o.get('stop_loss'), o.get('take_profit')
+            )
+            for o in orders
+        ]
+
+        results = []
+        for i in range(0, len(order_requests), self.BATCH_ORDER_LIMIT):
+            params = {"category": category, "request": order_requests[i:i + self.BATCH_ORDER_LIMIT]}
+            result = self._send_request("POST", "/v5/order/create-batch", params, auth_required=True)
+            statuses = (result.get('retExtInfo') or {}).get('list', [])
+            for order, status in zip(result['result']['list'], statuses):
+                results.append({**order, **status})
+
+        return results
+
+    def _order_params(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        qty: float,
+        price: Optional[float],
+        category: str,
+        time_in_force: str,
+        reduce_only: bool,
+        stop_loss: Optional[float],
+        take_profit: Optional[float]
+    ) -> Dict:
+        """
+        Build an order request body with qty/price snapped to the instrument's
+        lot step and tick size.
+
+        Raises:
+            InvalidOrder: If the snapped qty is outside the instrument's
+                min/max order size, so the exchange would reject it anyway
+        """
+        # Fetch instrument rules (cached per symbol after the first order)
         try:
-            info = self.get_instrument_info(symbol, category)
-            lot_size_filter = info['lotSizeFilter']
-            qty_step = float(lot_size_filter['qtyStep'])
+            if symbol not in self._qty_rules:
+                self.get_instrument_info(symbol, category)
+            qty_step, min_qty, max_qty, max_mkt_qty, tick_size = self._qty_rules[symbol]
         except Exception as e:
-            print(f"Warning: Could not fetch instrument info for {symbol}. Error: {e}")
-            formatted_qty = qty
+            # Without rules nothing can be checked; let the exchange decide
+            logger.warning("Could not fetch instrument info for %s: %s", symbol, e)
+            formatted_qty = str(qty)
         else:
-            # 2. Format the quantity
-            precision = str(qty_step).count('0') if '.' in str(qty_step) else 0
-            formatted_qty = round(math.floor(qty / qty_step) * qty_step, precision)
+            # Exact decimal floor to the step; the result carries the step's
+            # exponent, so 'f' formatting gives the right number of places
+            qty_dec = (Decimal(str(qty)) // qty_step) * qty_step
+            limit = max_mkt_qty if order_type == "Market" else max_qty
+            if qty_dec < min_qty:
+                raise InvalidOrder(f"{symbol}: qty {qty} is below the minimum order size {min_qty}")
+            if qty_dec > limit:
+                raise InvalidOrder(f"{symbol}: qty {qty} is above the maximum order size {limit}")
+            formatted_qty = format(qty_dec, 'f')
+
+            if price and tick_size:
+                price = format((Decimal(str(price)) // tick_size) * tick_size, 'f')
 
-        print(f"Original Qty: {qty}, Formatted Qty for {symbol}: {formatted_qty}")
+        logger.debug("Original qty=%s formatted=%s symbol=%s", qty, formatted_qty, symbol)
 
-        # 3. Build the parameters dictionary
         params = {
-            "category": category,
             "symbol": symbol,
             "side": side,
             "orderType": order_type,
-            "qty": str(formatted_qty),
+            "qty": formatted_qty,
             "timeInForce": time_in_force,
         }
 
-        # 4. Add optional parameters IF they are provided
+        # Optional parameters only when provided
         if price:
             params["price"] = str(price)
         if reduce_only:
@@ -257,34 +739,39 @@ class BybitExchange:
         if take_profit:
             params["takeProfit"] = str(take_profit)
 
-        # 5. Send the request
-        result = self._send_request("POST", "/v5/order/create", params, auth_required=True)
-        order_result = result['result']
+        return params
 
-        # 6. Set trailing stop on position if requested
-        # Note: Bybit API requires trailing stop to be set AFTER order fills, not during order creation
-        if trailing_stop is not None and not reduce_only:
-            try:
-                # Small delay to ensure order fills
-                import time
-                time.sleep(0.5)
-
-                # Set trailing stop on the position
-                self.set_trading_stop(
-                    symbol=symbol,
-                    trailing_stop=trailing_stop,
-                    category=category,
-                    position_idx=position_idx
-                )
-                order_result['trailing_stop_set'] = True
-                order_result['trailing_stop_distance'] = trailing_stop
-            except Exception as e:
-                # Don't fail the order if trailing stop fails, just log warning
-                print(f"Warning: Order placed but could not set trailing stop: {e}")
-                order_result['trailing_stop_set'] = False
-                order_result['trailing_stop_error'] = str(e)
+    def _wait_for_fill(
+        self,
+        symbol: str,
+        order_id: str,
+        category: str = "linear",
+        delays: tuple = (0.02, 0.05, 0.1, 0.15, 0.2)
+    ) -> bool:
+        """
+        Poll an order's status with short backoff until it (partially) fills.
 
-        return order_result
+        Polls once up front and again after each delay, so the order gets
+        sum(delays) (~0.5s by default) to fill.
+
+        Returns:
+            True if a fill was seen, False if the polls ran out first
+        """
+        params = {"category": category, "symbol": symbol, "orderId": order_id}
+
+        def filled() -> bool:
+            result = self._send_request("GET", "/v5/order/realtime", params, auth_required=True)
+            orders = result['result']['list']
+            return bool(orders) and orders[0]['orderStatus'] in ("Filled", "PartiallyFilled")
+
+        if filled():
+            return True
+        for delay in delays:
+            time.sleep(delay)
+            if filled():
+                return True
+
+        return False
 
     def cancel_order(
         self,
@@ -364,9 +851,13 @@ class BybitExchange:
         Args:
             settle_coin: Settlement coin for positions (default: USDT)
         """
-        balance = self.get_wallet_balance()
-        positions = self.get_positions(settle_coin=settle_coin)
-        open_orders = self.get_open_orders()
+        balance_future = self._executor.submit(self.get_wallet_balance)
+        positions_future = self._executor.submit(self.get_positions, settle_coin=settle_coin)
+        orders_future = self._executor.submit(self.get_open_orders)
+
+        balance = balance_future.result()
+        positions = positions_future.result()
+        open_orders = orders_future.result()
 
         return {
             "mode": self.mode.value,
@@ -419,13 +910,16 @@ class BybitExchange:
         issues = []
 
         try:
+            ticker_future = self._executor.submit(self.get_ticker, "BTCUSDT")
+            balance_future = self._executor.submit(self.get_wallet_balance)
+
             # Test market data (public)
-            ticker = self.get_ticker("BTCUSDT")
+            ticker = ticker_future.result()
             if not ticker:
                 issues.append("Failed to get market data")
 
             # Test account access (private)
-            balance = self.get_wallet_balance()
+            balance = balance_future.result()
             if not balance:
                 issues.append("Failed to get account balance")
 
@@ -5,11 +5,18 @@ This module provides indicators including:
 - Bollinger Bands and BBWidth
 - Volume analysis and Relative Volume Ratio (RVR)
 - Moving averages
+- Online (per-bar) versions of the above plus ADX
+
+Columns are read into the kernels with to_numpy(dtype=np.float64), which
+is free for float64 NumPy-backed columns and a copy for anything else
+(int64 volume, Arrow or nullable dtypes). Convert OHLCV to float64 once
+when the frame is built rather than per indicator call.
 """
 
 from .bollinger_bands import calculate_bollinger_bands, calculate_bbwidth, calculate_bbwidth_percentile
 from .volume import calculate_relative_volume_ratio, calculate_avg_volume
-from .moving_averages import calculate_sma, calculate_multiple_smas
+from .moving_averages import calculate_sma, calculate_sma_batch, calculate_multiple_smas
+from .online import OnlineSMA, OnlineBBands, OnlineADX, OnlineRVR
 
 __all__ = [
     'calculate_bollinger_bands',
@@ -18,5 +25,10 @@ __all__ = [
     'calculate_relative_volume_ratio',
     'calculate_avg_volume',
     'calculate_sma',
-    'calculate_multiple_smas'
+    'calculate_sma_batch',
+    'calculate_multiple_smas',
+    'OnlineSMA',
+    'OnlineBBands',
+    'OnlineADX',
+    'OnlineRVR'
 ]
@@ -0,0 +1,52 @@
+"""
+Small LRU cache for the array kernels.
+
+The signal pipeline asks for the same Bollinger bands more than once per
+frame (BBWidth percentile, then band position), so the kernel result is
+kept for the last few inputs. The key is the full input bytes plus the
+scalar parameters: kline frames are a sliding window whose last bar is
+rewritten while the candle is open, so a partial fingerprint (first bytes
+plus length) would serve stale values. Hashing a few KB of prices is far
+cheaper than the kernel itself.
+"""
+
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+import numpy as np
+
+
+def array_cache(maxsize: int = 32):
+    """
+    Memoize a kernel func(values, *params) -> tuple of arrays.
+
+    Cached arrays are marked read-only since every caller shares them;
+    assigning them to a DataFrame column copies, so that is unaffected.
+    """
+    def decorator(func):
+        cache = OrderedDict()
+        lock = threading.Lock()
+
+        @wraps(func)
+        def wrapper(values: np.ndarray, *params):
+            key = (values.dtype.str, values.tobytes(), params)
+            with lock:
+                if key in cache:
+                    cache.move_to_end(key)
+                    return cache[key]
+
+            out = func(values, *params)
+            for arr in out:
+                arr.setflags(write=False)
+
+            with lock:
+                cache[key] = out
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return out
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
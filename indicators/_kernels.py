@@ -0,0 +1,425 @@
+"""
+Compiled sliding-window kernels shared by the indicator modules.
+
+Each kernel takes a float NumPy array and returns a new array of the same
+length and dtype, matching the pandas rolling equivalent (NaN until the
+window holds enough non-NaN values). Accumulators are always float64, so
+float32 input only narrows the reads and writes, not the arithmetic.
+
+Kernels are compiled with numba when it is installed. Without numba the
+moving mean and Bollinger bands use bottleneck's C moving-window functions
+if available (no JIT start-up cost), and everything else falls back to
+the pandas implementation.
+"""
+
+import os
+import numpy as np
+import pandas as pd
+from typing import Tuple
+
+try:
+    from numba import guvectorize, njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
+
+# Steps between exact recomputations of the sliding Bollinger statistics
+BBANDS_RESYNC = 4096
+
+
+def _sliding_mean_pandas(values: np.ndarray, window: int, min_periods: int) -> np.ndarray:
+    """Rolling mean via pandas. Used directly when numba is unavailable."""
+    return (
+        pd.Series(values).rolling(window, min_periods=min_periods).mean()
+        .to_numpy(dtype=values.dtype)
+    )
+
+
+def _sliding_mean_fill(values: np.ndarray, window: int, min_periods: int, out: np.ndarray):
+    """
+    O(n) rolling mean written into out, for numba compilation.
+
+    Adds the entering value and removes the leaving one at each step, with
+    Kahan compensation on both so the running sum doesn't drift (the same
+    scheme pandas uses). NaNs are skipped and don't count towards nobs.
+    """
+    n = len(values)
+    nobs = 0
+    sum_x = 0.0
+    compensation_add = 0.0
+    compensation_remove = 0.0
+
+    for i in range(n):
+        val = values[i]
+        if not np.isnan(val):
+            nobs += 1
+            y = val - compensation_add
+            t = sum_x + y
+            compensation_add = t - sum_x - y
+            sum_x = t
+
+        if i >= window:
+            prev = values[i - window]
+            if not np.isnan(prev):
+                nobs -= 1
+                y = -prev - compensation_remove
+                t = sum_x + y
+                compensation_remove = t - sum_x - y
+                sum_x = t
+
+        if nobs >= min_periods and nobs > 0:
+            out[i] = sum_x / nobs
+        else:
+            out[i] = np.nan
+
+
+def _sliding_mean_loop(values: np.ndarray, window: int, min_periods: int) -> np.ndarray:
+    """Rolling mean into a new array of the input's dtype."""
+    out = np.empty(len(values), values.dtype)
+    _sliding_mean_fill(values, window, min_periods, out)
+    return out
+
+
+def _sliding_mean_bottleneck(values: np.ndarray, window: int, min_periods: int) -> np.ndarray:
+    """Rolling mean via bottleneck (min_count matches pandas' min_periods)."""
+    if len(values) < window:
+        # bottleneck rejects a window longer than the series; pandas gives NaN
+        return _sliding_mean_pandas(values, window, min_periods)
+    return bn.move_mean(values, window, min_count=max(min_periods, 1))
+
+
+def _sliding_mean_rows_bottleneck(values: np.ndarray, window: int) -> np.ndarray:
+    """Row-wise rolling mean of a 2-D array via bottleneck."""
+    if values.shape[-1] < window:
+        return np.full(values.shape, np.nan, values.dtype)
+    return bn.move_mean(values, window, min_count=window, axis=-1)
+
+
+def _sliding_mean_rows_pandas(values: np.ndarray, window: int) -> np.ndarray:
+    """Row-wise rolling mean of a 2-D array via pandas (one column per row)."""
+    if values.ndim == 1:
+        return _sliding_mean_pandas(values, window, window)
+    return pd.DataFrame(values.T).rolling(window).mean().to_numpy(dtype=values.dtype).T
+
+
+def _sliding_mean_row(values, window, out):
+    """
+    gufunc body '(n),()->(n)': rolling mean along the last axis, so a
+    (symbols, bars) matrix is processed in one call with the rows spread
+    across threads.
+    """
+    _sliding_mean_fill(values, window, window, out)
+
+
+def _pct_rank(window: np.ndarray) -> float:
+    """Share of the earlier values in the window below its last value."""
+    return (window < window[-1]).sum() / (len(window) - 1)
+
+
+def _rolling_pct_rank_pandas(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling percentile rank via pandas. Used directly when numba is unavailable."""
+    if window < 2:
+        return np.full(len(values), np.nan)
+    return pd.Series(values).rolling(window).apply(_pct_rank, raw=True).to_numpy()
+
+
+def _rolling_pct_rank_loop(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Rolling percentile rank of each value within its trailing window, for
+    numba compilation.
+
+    out[i] = count(values[i-window+1:i+1] < values[i]) / (window - 1); NaN
+    until the window is full or while it contains a NaN, as with pandas.
+
+    Values are mapped once to their dense rank among the distinct values,
+    and a Fenwick tree over those ranks holds the counts of the previous
+    window - 1 entries, so each step is O(log n) instead of a scan of
+    the window. Ties share a rank, so they don't count as below.
+    """
+    n = len(values)
+    out = np.full(n, np.nan)
+    if window < 2:
+        return out
+
+    grid = np.unique(values[~np.isnan(values)])
+    m = len(grid)
+    rank = np.full(n, -1, np.int64)
+    for i in range(n):
+        if not np.isnan(values[i]):
+            rank[i] = np.searchsorted(grid, values[i])
+
+    tree = np.zeros(m + 1, np.int64)
+    nan_count = 0
+
+    for i in range(n):
+        if i >= window:
+            old = rank[i - window]
+            if old < 0:
+                nan_count -= 1
+            else:
+                j = old + 1
+                while j <= m:
+                    tree[j] -= 1
+                    j += j & -j
+
+        r = rank[i]
+        if r < 0:
+            nan_count += 1
+
+        if i >= window - 1 and nan_count == 0:
+            # Entries in the tree with a lower rank than the current value
+            count = 0
+            j = r
+            while j > 0:
+                count += tree[j]
+                j -= j & -j
+            out[i] = count / (window - 1)
+
+        if r >= 0:
+            j = r + 1
+            while j <= m:
+                tree[j] += 1
+                j += j & -j
+
+    return out
+
+
+def _bbands_pandas(prices: np.ndarray, window: int, num_std: float) -> Tuple[np.ndarray, ...]:
+    """Bollinger Bands via pandas rolling. Used directly when numba is unavailable."""
+    rolling = pd.Series(prices, dtype=np.float64).rolling(window)
+    middle = rolling.mean().to_numpy()
+    std = rolling.std().to_numpy()
+    upper = middle + num_std * std
+    lower = middle - num_std * std
+    width = (upper - lower) / middle
+    return tuple(a.astype(prices.dtype, copy=False) for a in (middle, upper, lower, width))
+
+
+def _bbands_bottleneck(prices: np.ndarray, window: int, num_std: float) -> Tuple[np.ndarray, ...]:
+    """Bollinger Bands via bottleneck move_mean/move_std (ddof=1, as pandas)."""
+    if len(prices) < window:
+        # Never a full window, so every output is NaN
+        return tuple(np.full(len(prices), np.nan, prices.dtype) for _ in range(4))
+    middle = bn.move_mean(prices, window, min_count=window)
+    std = bn.move_std(prices, window, min_count=window, ddof=1)
+    upper = middle + num_std * std
+    lower = middle - num_std * std
+    with np.errstate(divide='ignore', invalid='ignore'):
+        width = (upper - lower) / middle
+    return middle, upper, lower, width
+
+
+def _bbands_loop(prices: np.ndarray, window: int, num_std: float) -> Tuple[np.ndarray, ...]:
+    """
+    Bollinger middle/upper/lower/width in one pass, for numba compilation.
+
+    Keeps a sliding Welford mean and sum of squared deviations (sample std,
+    ddof=1, as pandas). Every BBANDS_RESYNC steps both are recomputed from
+    the window itself so add/remove rounding can't accumulate.
+    """
+    n = len(prices)
+    middle = np.full(n, np.nan, prices.dtype)
+    upper = np.full(n, np.nan, prices.dtype)
+    lower = np.full(n, np.nan, prices.dtype)
+    width = np.full(n, np.nan, prices.dtype)
+
+    nobs = 0
+    mean = 0.0
+    ssqdm = 0.0
+
+    for i in range(n):
+        if i > 0 and i % BBANDS_RESYNC == 0:
+            nobs = 0
+            mean = 0.0
+            ssqdm = 0.0
+            for j in range(max(0, i - window + 1), i + 1):
+                x = prices[j]
+                if not np.isnan(x):
+                    nobs += 1
+                    delta = x - mean
+                    mean += delta / nobs
+                    ssqdm += delta * (x - mean)
+        else:
+            x = prices[i]
+            if not np.isnan(x):
+                nobs += 1
+                delta = x - mean
+                mean += delta / nobs
+                ssqdm += delta * (x - mean)
+
+            if i >= window:
+                x = prices[i - window]
+                if not np.isnan(x):
+                    nobs -= 1
+                    if nobs > 0:
+                        delta = x - mean
+                        mean -= delta / nobs
+                        ssqdm -= delta * (x - mean)
+                    else:
+                        mean = 0.0
+                        ssqdm = 0.0
+
+        if nobs >= window and nobs > 1:
+            sd = np.sqrt(max(ssqdm / (nobs - 1), 0.0))
+            up = mean + num_std * sd
+            lo = mean - num_std * sd
+            middle[i] = mean
+            upper[i] = up
+            lower[i] = lo
+            width[i] = (up - lo) / mean
+
+    return middle, upper, lower, width
+
+
+def _adx_pandas(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> Tuple[np.ndarray, ...]:
+    """ADX via pandas ewm. Used directly when numba is unavailable."""
+    # Previous bar's values, shifted once and shared by TR and DM
+    prev_high, prev_low, prev_close = (
+        np.concatenate(([np.nan], x[:-1])) for x in (high, low, close)
+    )
+
+    # fmax rather than maximum so NaNs are skipped like DataFrame.max(axis=1)
+    tr = np.fmax.reduce([
+        high - low,
+        np.abs(high - prev_close),
+        np.abs(low - prev_close),
+    ])
+
+    up_move = high - prev_high
+    down_move = prev_low - low
+    with np.errstate(invalid='ignore'):
+        plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+        minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+
+    # Series only for ewm; the DI/DX arithmetic is done on the arrays so
+    # there is no index alignment between steps
+    def smooth(x: np.ndarray) -> np.ndarray:
+        return pd.Series(x).ewm(alpha=1 / period, adjust=False).mean().to_numpy()
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        atr = smooth(tr)
+        plus_di = 100 * smooth(plus_dm) / atr
+        minus_di = 100 * smooth(minus_dm) / atr
+        dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
+
+    return plus_di, minus_di, smooth(dx)
+
+
+def _ewm_update(avg: float, old_wt: float, x: float, alpha: float) -> Tuple[float, float]:
+    """
+    One step of pandas' ewm(alpha, adjust=False).mean() (ignore_na=False).
+
+    Starts at the first non-NaN value; NaNs hold the average but still
+    decay the old weight, as pandas does.
+    """
+    if np.isnan(avg):
+        if not np.isnan(x):
+            avg = x
+        return avg, old_wt
+
+    old_wt *= 1.0 - alpha
+    if not np.isnan(x):
+        if avg != x:
+            avg = (old_wt * avg + alpha * x) / (old_wt + alpha)
+        old_wt = 1.0
+    return avg, old_wt
+
+
+def _adx_loop(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> Tuple[np.ndarray, ...]:
+    """
+    +DI, -DI and ADX in one pass over high/low/close, for numba compilation.
+
+    True range, directional movement and the four Wilder smoothers (ATR,
+    +DM, -DM, DX) are all advanced together per bar.
+    """
+    n = len(close)
+    alpha = 1.0 / period
+    plus_di = np.empty(n)
+    minus_di = np.empty(n)
+    adx = np.empty(n)
+
+    atr = s_plus = s_minus = s_dx = np.nan
+    w_atr = w_plus = w_minus = w_dx = 1.0
+
+    for i in range(n):
+        # True range: max of the available components (NaNs skipped)
+        tr = high[i] - low[i]
+        plus_dm = 0.0
+        minus_dm = 0.0
+        if i > 0:
+            for component in (abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1])):
+                if np.isnan(tr) or component > tr:
+                    tr = component
+
+            up_move = high[i] - high[i - 1]
+            down_move = low[i - 1] - low[i]
+            if up_move > down_move and up_move > 0:
+                plus_dm = up_move
+            if down_move > up_move and down_move > 0:
+                minus_dm = down_move
+
+        atr, w_atr = _ewm_update(atr, w_atr, tr, alpha)
+        s_plus, w_plus = _ewm_update(s_plus, w_plus, plus_dm, alpha)
+        s_minus, w_minus = _ewm_update(s_minus, w_minus, minus_dm, alpha)
+
+        pdi = 100.0 * s_plus / atr
+        mdi = 100.0 * s_minus / atr
+        s_dx, w_dx = _ewm_update(s_dx, w_dx, 100.0 * abs(pdi - mdi) / (pdi + mdi), alpha)
+
+        plus_di[i] = pdi
+        minus_di[i] = mdi
+        adx[i] = s_dx
+
+    return plus_di, minus_di, adx
+
+
+if NUMBA_AVAILABLE:
+    # fastmath is left off since it would assume no NaNs in the isnan checks.
+    # Jitted first so sliding_mean and the gufunc both inline it
+    _sliding_mean_fill = njit(cache=True, nogil=True, inline='always')(_sliding_mean_fill)
+    sliding_mean = njit(cache=True, nogil=True)(_sliding_mean_loop)
+    # Serial on purpose: callers already fan out across symbols in threads
+    # (nogil lets those run in parallel), so prange would only oversubscribe
+    rolling_pct_rank = njit(cache=True, nogil=True)(_rolling_pct_rank_loop)
+    # numpy error model: width over a zero mean gives inf like pandas
+    bbands = njit(cache=True, nogil=True, error_model='numpy')(_bbands_loop)
+    # The helper must be jitted before adx is compiled so the call inlines
+    _ewm_update = njit(cache=True, nogil=True, inline='always')(_ewm_update)
+    adx = njit(cache=True, nogil=True, error_model='numpy')(_adx_loop)
+    # Rows are independent, so the batch version does use the thread pool
+    sliding_mean_rows = guvectorize(
+        ['void(float32[:], int64, float32[:])', 'void(float64[:], int64, float64[:])'],
+        '(n),()->(n)', nopython=True, cache=True, target='parallel',
+    )(_sliding_mean_row)
+
+    def _warmup(dtypes=(np.float64,)):
+        """Compile (or load from the on-disk cache) each kernel signature."""
+        for dtype in dtypes:
+            sliding_mean(np.zeros(2, dtype), 1, 1)
+            bbands(np.ones(2, dtype), 2, 2.0)
+        rolling_pct_rank(np.zeros(2), 2)
+        adx(np.ones(2), np.ones(2), np.ones(2), 2)
+
+    # Warm up at import rather than on the first indicator call in the
+    # trading loop. With INDICATORS_AOT set (image build) the opt-in float32
+    # variants are compiled too, so the cache shipped in the image covers
+    # every signature and containers never compile at start-up.
+    _warmup((np.float64, np.float32) if os.environ.get('INDICATORS_AOT') else (np.float64,))
+elif BOTTLENECK_AVAILABLE:
+    sliding_mean = _sliding_mean_bottleneck
+    rolling_pct_rank = _rolling_pct_rank_pandas
+    bbands = _bbands_bottleneck
+    adx = _adx_pandas
+    sliding_mean_rows = _sliding_mean_rows_bottleneck
+else:
+    sliding_mean = _sliding_mean_pandas
+    rolling_pct_rank = _rolling_pct_rank_pandas
+    bbands = _bbands_pandas
+    adx = _adx_pandas
+    sliding_mean_rows = _sliding_mean_rows_pandas
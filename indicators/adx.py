@@ -9,14 +9,17 @@ ADX measures trend strength on a scale of 0-100:
 import pandas as pd
 import numpy as np
 
+from ._kernels import adx as adx_kernel
 
-def calculate_adx(df: pd.DataFrame, period: int = 14) -> pd.DataFrame:
+
+def calculate_adx(df: pd.DataFrame, period: int = 14, inplace: bool = False) -> pd.DataFrame:
     """
     Calculate ADX (Average Directional Index).
 
     Args:
         df: DataFrame with 'high', 'low', 'close' columns
         period: ADX period (default: 14)
+        inplace: Add columns to df itself instead of a copy (default: False)
 
     Returns:
         DataFrame with added columns:
@@ -24,31 +27,15 @@ def calculate_adx(df: pd.DataFrame, period: int = 14) -> pd.DataFrame:
         - minus_di: Minus Directional Indicator
         - adx: Average Directional Index
     """
-    result = df.copy()
-
-    # Calculate True Range (TR)
-    high_low = result['high'] - result['low']
-    high_close = abs(result['high'] - result['close'].shift(1))
-    low_close = abs(result['low'] - result['close'].shift(1))
-
-    tr = pd.DataFrame({'hl': high_low, 'hc': high_close, 'lc': low_close}).max(axis=1)
-
-    # Calculate Directional Movement
-    up_move = result['high'] - result['high'].shift(1)
-    down_move = result['low'].shift(1) - result['low']
-
-    # Plus/Minus Directional Movement
-    plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0)
-    minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0)
-
-    # Smooth with Wilder's moving average
-    atr = tr.ewm(alpha=1/period, adjust=False).mean()
-    plus_di = 100 * pd.Series(plus_dm).ewm(alpha=1/period, adjust=False).mean() / atr
-    minus_di = 100 * pd.Series(minus_dm).ewm(alpha=1/period, adjust=False).mean() / atr
-
-    # Calculate DX and ADX
-    dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
-    adx = dx.ewm(alpha=1/period, adjust=False).mean()
+    result = df if inplace else df.copy()
+
+    # TR, directional movement and all Wilder smoothing in one pass
+    plus_di, minus_di, adx = adx_kernel(
+        result['high'].to_numpy(dtype=np.float64),
+        result['low'].to_numpy(dtype=np.float64),
+        result['close'].to_numpy(dtype=np.float64),
+        period
+    )
 
     result['plus_di'] = plus_di
     result['minus_di'] = minus_di
@@ -0,0 +1,52 @@
+"""
+Run an indicator pipeline over many symbols in parallel.
+
+The compiled kernels release the GIL (nogil=True), so worker threads can
+compute different symbols on separate cores while sharing the same
+in-memory OHLCV frames, which a process pool would have to copy.
+"""
+
+import os
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+
+def compute_all(
+    frames: Dict[str, pd.DataFrame],
+    func: Callable[..., pd.DataFrame],
+    max_workers: Optional[int] = None,
+    **kwargs
+) -> Dict[str, pd.DataFrame]:
+    """
+    Apply func(df, **kwargs) to every symbol's frame using a thread pool.
+
+    Blocks until all symbols are done, so don't call it directly from a
+    coroutine; use loop.run_in_executor(None, compute_all, ...) there.
+
+    Args:
+        frames: Symbol -> OHLCV DataFrame
+        func: Indicator or signal function taking a DataFrame first
+              (e.g. generate_entry_signals)
+        max_workers: Worker threads (default: os.cpu_count())
+        **kwargs: Passed through to func
+
+    Returns:
+        Symbol -> result DataFrame, in the same order as frames
+
+    Example:
+        signals = compute_all(data, generate_entry_signals, ma_period=20)
+    """
+    if not frames:
+        return {}
+
+    workers = min(max_workers or os.cpu_count() or 1, len(frames))
+    if workers == 1:
+        return {symbol: func(df, **kwargs) for symbol, df in frames.items()}
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="indicators") as executor:
+        futures = {
+            symbol: executor.submit(func, df, **kwargs)
+            for symbol, df in frames.items()
+        }
+        return {symbol: future.result() for symbol, future in futures.items()}
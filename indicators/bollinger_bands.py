@@ -14,12 +14,21 @@ import pandas as pd
 import numpy as np
 from typing import Tuple, Optional
 
+from ._cache import array_cache
+from ._kernels import bbands, rolling_pct_rank
+
+# Bands are requested several times per frame (bbwidth percentile, then
+# band position); compute once per distinct price array
+bbands = array_cache()(bbands)
+
 
 def calculate_bollinger_bands(
     df: pd.DataFrame,
     period: int = 20,
     num_std: float = 2.0,
-    price_col: str = 'close'
+    price_col: str = 'close',
+    inplace: bool = False,
+    dtype: np.dtype = np.float64
 ) -> pd.DataFrame:
     """
     Calculate Bollinger Bands.
@@ -29,6 +38,9 @@ def calculate_bollinger_bands(
         period: Period for moving average (default: 20)
         num_std: Number of standard deviations for bands (default: 2.0)
         price_col: Column to use for calculation (default: 'close')
+        inplace: Add columns to df itself instead of a copy (default: False)
+        dtype: Float dtype for the kernel input/output; np.float32 halves
+               the memory traffic at ~7 significant digits (default: np.float64)
 
     Returns:
         DataFrame with added columns: bb_middle, bb_upper, bb_lower
@@ -38,17 +50,15 @@ def calculate_bollinger_bands(
         Upper Band = Middle Band + (2 * 20-period std dev)
         Lower Band = Middle Band - (2 * 20-period std dev)
     """
-    result = df.copy()
-
-    # Calculate middle band (SMA)
-    result['bb_middle'] = result[price_col].rolling(window=period).mean()
-
-    # Calculate standard deviation
-    std = result[price_col].rolling(window=period).std()
+    result = df if inplace else df.copy()
 
-    # Calculate upper and lower bands
-    result['bb_upper'] = result['bb_middle'] + (num_std * std)
-    result['bb_lower'] = result['bb_middle'] - (num_std * std)
+    # Middle/upper/lower bands from one pass over the prices
+    middle, upper, lower, _ = bbands(
+        result[price_col].to_numpy(dtype=dtype), period, num_std
+    )
+    result['bb_middle'] = middle
+    result['bb_upper'] = upper
+    result['bb_lower'] = lower
 
     return result
 
@@ -57,7 +67,8 @@ def calculate_bbwidth(
     df: pd.DataFrame,
     period: int = 20,
     num_std: float = 2.0,
-    price_col: str = 'close'
+    price_col: str = 'close',
+    inplace: bool = False
 ) -> pd.DataFrame:
     """
     Calculate Bollinger Band Width (BBWidth).
@@ -70,6 +81,7 @@ def calculate_bbwidth(
         period: Period for Bollinger Bands (default: 20)
         num_std: Number of standard deviations (default: 2.0)
         price_col: Column to use for calculation (default: 'close')
+        inplace: Add columns to df itself instead of a copy (default: False)
 
     Returns:
         DataFrame with added column: bbwidth
@@ -77,10 +89,16 @@ def calculate_bbwidth(
     Formula:
         BBWidth = (Upper Band - Lower Band) / Middle Band
     """
-    result = calculate_bollinger_bands(df, period, num_std, price_col)
+    result = df if inplace else df.copy()
 
-    # Calculate BBWidth
-    result['bbwidth'] = (result['bb_upper'] - result['bb_lower']) / result['bb_middle']
+    # Bands and BBWidth from the same single pass
+    middle, upper, lower, width = bbands(
+        result[price_col].to_numpy(dtype=np.float64), period, num_std
+    )
+    result['bb_middle'] = middle
+    result['bb_upper'] = upper
+    result['bb_lower'] = lower
+    result['bbwidth'] = width
 
     return result
 
@@ -90,7 +108,8 @@ def calculate_bbwidth_percentile(
     lookback_period: int = 90,
     bb_period: int = 20,
     num_std: float = 2.0,
-    price_col: str = 'close'
+    price_col: str = 'close',
+    inplace: bool = False
 ) -> pd.DataFrame:
     """
     Calculate BBWidth percentile ranking.
@@ -105,6 +124,7 @@ def calculate_bbwidth_percentile(
         bb_period: Period for Bollinger Bands (default: 20)
         num_std: Number of standard deviations (default: 2.0)
         price_col: Column to use for calculation (default: 'close')
+        inplace: Add columns to df itself instead of a copy (default: False)
 
     Returns:
         DataFrame with added column: bbwidth_percentile (0-1 scale)
@@ -113,19 +133,12 @@ def calculate_bbwidth_percentile(
         bbwidth_percentile = 0.15 means current BBWidth is lower than 85% of
         the past 90 days (very compressed, potential breakout)
     """
-    result = calculate_bbwidth(df, bb_period, num_std, price_col)
+    result = calculate_bbwidth(df, bb_period, num_std, price_col, inplace=inplace)
 
     # Calculate rolling percentile rank
-    def percentile_rank(series):
-        """Calculate percentile rank of last value in series."""
-        if len(series) < 2:
-            return np.nan
-        # Rank from 0 to 1
-        return (series < series.iloc[-1]).sum() / (len(series) - 1)
-
-    result['bbwidth_percentile'] = result['bbwidth'].rolling(
-        window=lookback_period
-    ).apply(percentile_rank, raw=False)
+    result['bbwidth_percentile'] = rolling_pct_rank(
+        result['bbwidth'].to_numpy(dtype=np.float64), lookback_period
+    )
 
     return result
 
@@ -134,7 +147,8 @@ def get_bb_position(
     df: pd.DataFrame,
     period: int = 20,
     num_std: float = 2.0,
-    price_col: str = 'close'
+    price_col: str = 'close',
+    inplace: bool = False
 ) -> pd.DataFrame:
     """
     Calculate price position relative to Bollinger Bands.
@@ -146,6 +160,7 @@ def get_bb_position(
         period: Period for Bollinger Bands (default: 20)
         num_std: Number of standard deviations (default: 2.0)
         price_col: Column to use for calculation (default: 'close')
+        inplace: Add columns to df itself instead of a copy (default: False)
 
     Returns:
         DataFrame with added columns:
@@ -153,15 +168,19 @@ def get_bb_position(
         - above_upper_band: Boolean, True if close > upper band
         - below_lower_band: Boolean, True if close < lower band
     """
-    result = calculate_bollinger_bands(df, period, num_std, price_col)
+    result = calculate_bollinger_bands(df, period, num_std, price_col, inplace=inplace)
+
+    price = result[price_col].to_numpy()
+    upper = result['bb_upper'].to_numpy()
+    lower = result['bb_lower'].to_numpy()
 
     # Calculate position (0-1 scale)
-    band_range = result['bb_upper'] - result['bb_lower']
-    result['bb_position'] = (result[price_col] - result['bb_lower']) / band_range
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result['bb_position'] = (price - lower) / (upper - lower)
 
     # Boolean flags
-    result['above_upper_band'] = result[price_col] > result['bb_upper']
-    result['below_lower_band'] = result[price_col] < result['bb_lower']
+    result['above_upper_band'] = price > upper
+    result['below_lower_band'] = price < lower
 
     return result
 
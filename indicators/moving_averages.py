@@ -9,12 +9,16 @@ import pandas as pd
 import numpy as np
 from typing import List, Optional, Dict
 
+from ._kernels import sliding_mean, sliding_mean_rows
+
 
 def calculate_sma(
     df: pd.DataFrame,
     period: int,
     price_col: str = 'close',
-    output_col: Optional[str] = None
+    output_col: Optional[str] = None,
+    inplace: bool = False,
+    dtype: np.dtype = np.float64
 ) -> pd.DataFrame:
     """
     Calculate Simple Moving Average (SMA).
@@ -24,6 +28,9 @@ def calculate_sma(
         period: Period for moving average
         price_col: Column to use for calculation (default: 'close')
         output_col: Name for output column (default: 'sma_{period}')
+        inplace: Add columns to df itself instead of a copy (default: False)
+        dtype: Float dtype for the kernel input/output; np.float32 halves
+               the memory traffic at ~7 significant digits (default: np.float64)
 
     Returns:
         DataFrame with added SMA column
@@ -31,20 +38,46 @@ def calculate_sma(
     Formula:
         SMA = Sum of prices over N periods / N
     """
-    result = df.copy()
+    result = df if inplace else df.copy()
 
     if output_col is None:
         output_col = f'sma_{period}'
 
-    result[output_col] = result[price_col].rolling(window=period).mean()
+    result[output_col] = sliding_mean(
+        result[price_col].to_numpy(dtype=dtype), period, period
+    )
 
     return result
 
 
+def calculate_sma_batch(prices: np.ndarray, period: int) -> np.ndarray:
+    """
+    Calculate the same SMA for many symbols at once.
+
+    Args:
+        prices: (symbols, bars) array of prices, one row per symbol
+        period: Period for moving average
+
+    Returns:
+        Array of the same shape with the SMA of each row (NaN until the
+        window is full, as calculate_sma)
+
+    Example:
+        closes = np.vstack([df['close'].to_numpy() for df in frames])
+        sma_20 = calculate_sma_batch(closes, 20)
+    """
+    prices = np.asarray(prices)
+    if prices.dtype != np.float32:
+        prices = prices.astype(np.float64, copy=False)
+    return sliding_mean_rows(prices, period)
+
+
 def calculate_multiple_smas(
     df: pd.DataFrame,
     periods: List[int],
-    price_col: str = 'close'
+    price_col: str = 'close',
+    inplace: bool = False,
+    dtype: np.dtype = np.float64
 ) -> pd.DataFrame:
     """
     Calculate multiple SMAs at once.
@@ -53,6 +86,9 @@ def calculate_multiple_smas(
         df: DataFrame with OHLCV data
         periods: List of periods to calculate (e.g., [20, 50, 200])
         price_col: Column to use for calculation (default: 'close')
+        inplace: Add columns to df itself instead of a copy (default: False)
+        dtype: Float dtype for the kernel input/output; np.float32 halves
+               the memory traffic at ~7 significant digits (default: np.float64)
 
     Returns:
         DataFrame with added columns: sma_20, sma_50, etc.
@@ -61,19 +97,29 @@ def calculate_multiple_smas(
         df = calculate_multiple_smas(df, [20, 50, 200])
         # Adds columns: sma_20, sma_50, sma_200
     """
-    result = df.copy()
+    # Convert the price column once and run the kernel per window
+    prices = df[price_col].to_numpy(dtype=dtype)
+    smas = {f'sma_{period}': sliding_mean(prices, period, period) for period in periods}
 
-    for period in periods:
-        result = calculate_sma(result, period, price_col)
+    # Recomputing on a frame that already has some of the columns: overwrite
+    # them where they are so the column order doesn't change
+    if inplace or df.columns.intersection(list(smas)).size:
+        result = df if inplace else df.copy()
+        for col, values in smas.items():
+            result[col] = values
+        return result
 
-    return result
+    # Attach all new columns with one concat rather than a copy plus one
+    # insert per column
+    return pd.concat([df, pd.DataFrame(smas, index=df.index)], axis=1)
 
 
 def calculate_ema(
     df: pd.DataFrame,
     period: int,
     price_col: str = 'close',
-    output_col: Optional[str] = None
+    output_col: Optional[str] = None,
+    inplace: bool = False
 ) -> pd.DataFrame:
     """
     Calculate Exponential Moving Average (EMA).
@@ -85,6 +131,7 @@ def calculate_ema(
         period: Period for moving average
         price_col: Column to use for calculation (default: 'close')
         output_col: Name for output column (default: 'ema_{period}')
+        inplace: Add columns to df itself instead of a copy (default: False)
 
     Returns:
         DataFrame with added EMA column
@@ -92,7 +139,7 @@ def calculate_ema(
     Formula:
         EMA = Price * (2 / (period + 1)) + EMA_prev * (1 - (2 / (period + 1)))
     """
-    result = df.copy()
+    result = df if inplace else df.copy()
 
     if output_col is None:
         output_col = f'ema_{period}'
@@ -105,7 +152,8 @@ def calculate_ema(
 def check_price_above_ma(
     df: pd.DataFrame,
     ma_period: int,
-    price_col: str = 'close'
+    price_col: str = 'close',
+    inplace: bool = False
 ) -> pd.DataFrame:
     """
     Check if price is above its moving average.
@@ -117,16 +165,17 @@ def check_price_above_ma(
         df: DataFrame with OHLCV data
         ma_period: Period for moving average
         price_col: Column to use (default: 'close')
+        inplace: Add columns to df itself instead of a copy (default: False)
 
     Returns:
         DataFrame with added columns:
         - sma_{period}: The moving average
         - above_ma_{period}: Boolean, True if price > MA
     """
-    result = calculate_sma(df, ma_period, price_col)
+    result = calculate_sma(df, ma_period, price_col, inplace=inplace)
 
     ma_col = f'sma_{ma_period}'
-    result[f'above_ma_{ma_period}'] = result[price_col] > result[ma_col]
+    result[f'above_ma_{ma_period}'] = result[price_col].to_numpy() > result[ma_col].to_numpy()
 
     return result
 
@@ -134,7 +183,8 @@ def check_price_above_ma(
 def calculate_ma_distance(
     df: pd.DataFrame,
     ma_period: int,
-    price_col: str = 'close'
+    price_col: str = 'close',
+    inplace: bool = False
 ) -> pd.DataFrame:
     """
     Calculate distance of price from its moving average.
@@ -145,6 +195,7 @@ def calculate_ma_distance(
         df: DataFrame with OHLCV data
         ma_period: Period for moving average
         price_col: Column to use (default: 'close')
+        inplace: Add columns to df itself instead of a copy (default: False)
 
     Returns:
         DataFrame with added columns:
@@ -155,13 +206,15 @@ def calculate_ma_distance(
     Formula:
         MA Distance % = (Price - MA) / MA
     """
-    result = calculate_sma(df, ma_period, price_col)
+    result = calculate_sma(df, ma_period, price_col, inplace=inplace)
 
-    ma_col = f'sma_{ma_period}'
-    result[f'ma_distance_{ma_period}'] = result[price_col] - result[ma_col]
-    result[f'ma_distance_pct_{ma_period}'] = (
-        (result[price_col] - result[ma_col]) / result[ma_col]
-    )
+    ma = result[f'sma_{ma_period}'].to_numpy()
+    distance = result[price_col].to_numpy(dtype=np.float64) - ma
+    result[f'ma_distance_{ma_period}'] = distance
+
+    # Reuse the difference for the percentage instead of subtracting again
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result[f'ma_distance_pct_{ma_period}'] = distance / ma
 
     return result
 
@@ -170,7 +223,8 @@ def calculate_ma_crossover(
     df: pd.DataFrame,
     fast_period: int,
     slow_period: int,
-    price_col: str = 'close'
+    price_col: str = 'close',
+    inplace: bool = False
 ) -> pd.DataFrame:
     """
     Detect moving average crossovers.
@@ -183,6 +237,7 @@ def calculate_ma_crossover(
         fast_period: Period for fast MA (e.g., 20)
         slow_period: Period for slow MA (e.g., 50)
         price_col: Column to use (default: 'close')
+        inplace: Add columns to df itself instead of a copy (default: False)
 
     Returns:
         DataFrame with added columns:
@@ -191,28 +246,25 @@ def calculate_ma_crossover(
         - ma_cross_bearish: True on day of bearish crossover
         - fast_above_slow: True when fast MA > slow MA
     """
-    result = df.copy()
+    result = df if inplace else df.copy()
 
     # Calculate both MAs
-    result = calculate_sma(result, fast_period, price_col)
-    result = calculate_sma(result, slow_period, price_col)
+    calculate_sma(result, fast_period, price_col, inplace=True)
+    calculate_sma(result, slow_period, price_col, inplace=True)
 
     fast_col = f'sma_{fast_period}'
     slow_col = f'sma_{slow_period}'
 
     # Check if fast is above slow
-    result['fast_above_slow'] = result[fast_col] > result[slow_col]
+    fast_above_slow = result[fast_col].to_numpy() > result[slow_col].to_numpy()
 
-    # Detect crossovers (when fast_above_slow changes)
-    result['ma_cross_bullish'] = (
-        (result['fast_above_slow'] == True) &
-        (result['fast_above_slow'].shift(1) == False)
-    )
+    # Detect crossovers (when fast_above_slow changes from the previous bar)
+    changed = np.zeros_like(fast_above_slow)
+    np.not_equal(fast_above_slow[1:], fast_above_slow[:-1], out=changed[1:])
 
-    result['ma_cross_bearish'] = (
-        (result['fast_above_slow'] == False) &
-        (result['fast_above_slow'].shift(1) == True)
-    )
+    result['fast_above_slow'] = fast_above_slow
+    result['ma_cross_bullish'] = changed & fast_above_slow
+    result['ma_cross_bearish'] = changed & ~fast_above_slow
 
     return result
 
@@ -220,7 +272,8 @@ def calculate_ma_crossover(
 def get_ma_regime(
     df: pd.DataFrame,
     regime_period: int = 50,
-    price_col: str = 'close'
+    price_col: str = 'close',
+    inplace: bool = False
 ) -> pd.DataFrame:
     """
     Determine market regime based on MA.
@@ -231,6 +284,7 @@ def get_ma_regime(
         df: DataFrame with OHLCV data
         regime_period: Period for regime MA (default: 50)
         price_col: Column to use (default: 'close')
+        inplace: Add columns to df itself instead of a copy (default: False)
 
     Returns:
         DataFrame with added columns:
@@ -241,11 +295,11 @@ def get_ma_regime(
     Interpretation:
         Only take long positions when regime_uptrend = True
     """
-    result = check_price_above_ma(df, regime_period, price_col)
+    result = check_price_above_ma(df, regime_period, price_col, inplace=inplace)
 
-    ma_col = f'above_ma_{regime_period}'
-    result['regime_uptrend'] = result[ma_col]
-    result['regime_downtrend'] = ~result[ma_col]
+    above_ma = result[f'above_ma_{regime_period}'].to_numpy()
+    result['regime_uptrend'] = above_ma
+    result['regime_downtrend'] = ~above_ma
 
     return result
 
@@ -0,0 +1,241 @@
+"""
+Online (streaming) versions of the strategy indicators.
+
+Each class keeps just enough state to fold in one new bar in O(1) and
+returns the same value the batch function would give for that bar, so a
+live loop can call update() per candle instead of recomputing the full
+history. fit_transform() replays an array (e.g. history at startup) and
+leaves the object ready for the next live bar.
+"""
+
+import math
+import numpy as np
+from typing import Tuple
+
+from ._kernels import BBANDS_RESYNC
+
+NAN = float('nan')
+
+
+class OnlineSMA:
+    """
+    Rolling mean over the last `period` values (matches calculate_sma).
+
+    Kahan-compensated running sum over a ring buffer; NaN until the window
+    holds `period` non-NaN values.
+    """
+
+    def __init__(self, period: int):
+        self.period = period
+        self._buf = [NAN] * period
+        self._pos = 0
+        self._nobs = 0
+        self._sum = 0.0
+        self._comp_add = 0.0
+        self._comp_remove = 0.0
+
+    def update(self, value: float) -> float:
+        """Add a value and return the current mean."""
+        prev = self._buf[self._pos]
+        if not math.isnan(prev):
+            self._nobs -= 1
+            y = -prev - self._comp_remove
+            t = self._sum + y
+            self._comp_remove = t - self._sum - y
+            self._sum = t
+
+        value = float(value)
+        if not math.isnan(value):
+            self._nobs += 1
+            y = value - self._comp_add
+            t = self._sum + y
+            self._comp_add = t - self._sum - y
+            self._sum = t
+
+        self._buf[self._pos] = value
+        self._pos = (self._pos + 1) % self.period
+
+        if self._nobs >= self.period:
+            return self._sum / self._nobs
+        return NAN
+
+    def fit_transform(self, values: np.ndarray) -> np.ndarray:
+        """Feed every value in order; returns the mean after each one."""
+        return np.array([self.update(v) for v in values], dtype=np.float64)
+
+
+class OnlineBBands:
+    """
+    Bollinger Bands over the last `period` prices (matches calculate_bbwidth).
+
+    Sliding Welford mean/variance over a ring buffer, resynced from the
+    buffer every BBANDS_RESYNC updates like the batch kernel.
+    """
+
+    def __init__(self, period: int = 20, num_std: float = 2.0):
+        self.period = period
+        self.num_std = num_std
+        self._buf = [NAN] * period
+        self._pos = 0
+        self._count = 0
+        self._nobs = 0
+        self._mean = 0.0
+        self._ssqdm = 0.0
+
+    def _add(self, x: float):
+        self._nobs += 1
+        delta = x - self._mean
+        self._mean += delta / self._nobs
+        self._ssqdm += delta * (x - self._mean)
+
+    def _remove(self, x: float):
+        self._nobs -= 1
+        if self._nobs > 0:
+            delta = x - self._mean
+            self._mean -= delta / self._nobs
+            self._ssqdm -= delta * (x - self._mean)
+        else:
+            self._mean = 0.0
+            self._ssqdm = 0.0
+
+    def update(self, price: float) -> Tuple[float, float, float, float]:
+        """Add a price and return (middle, upper, lower, bbwidth)."""
+        price = float(price)
+        prev = self._buf[self._pos]
+        self._buf[self._pos] = price
+        self._pos = (self._pos + 1) % self.period
+        resync = self._count > 0 and self._count % BBANDS_RESYNC == 0
+        self._count += 1
+
+        if resync:
+            self._nobs = 0
+            self._mean = 0.0
+            self._ssqdm = 0.0
+            for x in self._buf:
+                if not math.isnan(x):
+                    self._add(x)
+        else:
+            if not math.isnan(prev):
+                self._remove(prev)
+            if not math.isnan(price):
+                self._add(price)
+
+        if self._nobs < self.period or self._nobs < 2:
+            return NAN, NAN, NAN, NAN
+
+        sd = math.sqrt(max(self._ssqdm / (self._nobs - 1), 0.0))
+        middle = self._mean
+        upper = middle + self.num_std * sd
+        lower = middle - self.num_std * sd
+        width = (upper - lower) / middle if middle != 0 else math.copysign(math.inf, upper - lower)
+        return middle, upper, lower, width
+
+    def fit_transform(self, prices: np.ndarray) -> np.ndarray:
+        """Feed every price in order; returns an (n, 4) array of bands."""
+        return np.array([self.update(p) for p in prices], dtype=np.float64).reshape(-1, 4)
+
+
+class _WilderSmoother:
+    """One pandas ewm(alpha, adjust=False).mean() series, stepped per value."""
+
+    def __init__(self, alpha: float):
+        self.alpha = alpha
+        self.value = NAN
+        self._old_wt = 1.0
+
+    def update(self, x: float) -> float:
+        if math.isnan(self.value):
+            if not math.isnan(x):
+                self.value = x
+            return self.value
+
+        self._old_wt *= 1.0 - self.alpha
+        if not math.isnan(x):
+            if self.value != x:
+                self.value = (
+                    (self._old_wt * self.value + self.alpha * x)
+                    / (self._old_wt + self.alpha)
+                )
+            self._old_wt = 1.0
+        return self.value
+
+
+def _div(a: float, b: float) -> float:
+    """a / b with NumPy semantics (x/0 -> +-inf, 0/0 -> NaN)."""
+    if b == 0:
+        if a == 0 or math.isnan(a):
+            return NAN
+        return math.copysign(math.inf, a) * math.copysign(1.0, b)
+    return a / b
+
+
+class OnlineADX:
+    """
+    +DI, -DI and ADX updated per bar (matches calculate_adx).
+
+    Purely recursive: only the previous bar and four Wilder smoothers are
+    kept, no history buffer.
+    """
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        alpha = 1.0 / period
+        self._atr = _WilderSmoother(alpha)
+        self._plus = _WilderSmoother(alpha)
+        self._minus = _WilderSmoother(alpha)
+        self._dx = _WilderSmoother(alpha)
+        self._prev = None
+
+    def update(self, high: float, low: float, close: float) -> Tuple[float, float, float]:
+        """Add a bar and return (plus_di, minus_di, adx)."""
+        high, low, close = float(high), float(low), float(close)
+        tr = high - low
+        plus_dm = minus_dm = 0.0
+
+        if self._prev is not None:
+            prev_high, prev_low, prev_close = self._prev
+            for component in (abs(high - prev_close), abs(low - prev_close)):
+                if math.isnan(tr) or component > tr:
+                    tr = component
+
+            up_move = high - prev_high
+            down_move = prev_low - low
+            if up_move > down_move and up_move > 0:
+                plus_dm = up_move
+            if down_move > up_move and down_move > 0:
+                minus_dm = down_move
+
+        self._prev = (high, low, close)
+
+        atr = self._atr.update(tr)
+        pdi = 100.0 * _div(self._plus.update(plus_dm), atr)
+        mdi = 100.0 * _div(self._minus.update(minus_dm), atr)
+        adx = self._dx.update(100.0 * _div(abs(pdi - mdi), pdi + mdi))
+        return pdi, mdi, adx
+
+    def fit_transform(self, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+        """Feed every bar in order; returns an (n, 3) array of +DI, -DI, ADX."""
+        return np.array(
+            [self.update(h, l, c) for h, l, c in zip(high, low, close)], dtype=np.float64
+        ).reshape(-1, 3)
+
+
+class OnlineRVR:
+    """Relative volume ratio per bar (matches calculate_relative_volume_ratio)."""
+
+    def __init__(self, period: int = 20):
+        self.period = period
+        self._avg = OnlineSMA(period)
+
+    def update(self, volume: float) -> float:
+        """Add a bar's volume and return volume / average volume."""
+        volume = float(volume)
+        avg = self._avg.update(volume)
+        if avg == 0 or math.isnan(avg) or math.isnan(volume):
+            # calculate_relative_volume_ratio maps the inf from x/0 to NaN
+            return NAN
+        return volume / avg
+
+    def fit_transform(self, volumes: np.ndarray) -> np.ndarray:
+        """Feed every volume in order; returns the RVR after each one."""
+        return np.array([self.update(v) for v in volumes], dtype=np.float64)
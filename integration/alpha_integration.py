@@ -7,6 +7,10 @@ import sys
 import os
 from pathlib import Path
 import logging
+import logging.handlers
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, Optional
 
@@ -19,6 +23,48 @@ from shared.alpha_db_client import AlphaDBClient, create_client_order_id
 logger = logging.getLogger(__name__)
 
 
+class _ForwardToRoot(logging.Handler):
+    """Pass records to the root logger's handlers (runs on the listener thread)."""
+
+    def emit(self, record):
+        logging.getLogger().handle(record)
+
+
+# While an integration is open, records from this module only go onto a
+# queue; a listener thread hands them to the real (possibly slow, e.g. file
+# or database) handlers, so the trading loop and the write executors never
+# block on log I/O. With no integration open the logger propagates as usual.
+_log_queue = queue.SimpleQueue()
+_log_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_log_listener = logging.handlers.QueueListener(_log_queue, _ForwardToRoot())
+_log_listener_lock = threading.Lock()
+_log_listener_users = 0
+
+
+def _start_log_listener():
+    """Register a user of the log listener, starting it for the first one."""
+    global _log_listener_users
+    with _log_listener_lock:
+        if _log_listener_users == 0:
+            _log_listener.start()
+            logger.addHandler(_log_queue_handler)
+            logger.propagate = False
+        _log_listener_users += 1
+
+
+def _stop_log_listener():
+    """Release a user of the log listener; the last one drains and stops it."""
+    global _log_listener_users
+    with _log_listener_lock:
+        if _log_listener_users == 0:
+            return
+        _log_listener_users -= 1
+        if _log_listener_users == 0:
+            logger.removeHandler(_log_queue_handler)
+            logger.propagate = True
+            _log_listener.stop()
+
+
 class MomentumAlphaIntegration:
     """
     Integration layer between Momentum strategy and Alpha infrastructure.
@@ -39,6 +85,22 @@ class MomentumAlphaIntegration:
         """
         self.bot_id = bot_id
         self.db_client = None
+        # Trade logging from the trading loop runs on these single-thread
+        # executors (in submission order) so placing orders never waits on
+        # the database. Redis and PostgreSQL get one each so the two stores
+        # are written in parallel.
+        self._redis_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="alpha-redis")
+        self._pg_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="alpha-pg")
+
+        # Registry updates made during one loop iteration (latest equity,
+        # heartbeat flag), written together by a single queued flush
+        self._tick_lock = threading.Lock()
+        self._pending_tick: Dict = {}
+
+        self._heartbeat_stop = threading.Event()
+        self._heartbeat_thread: Optional[threading.Thread] = None
+        _start_log_listener()
+        self._log_listener_held = True
         self._initialize_db_client()
 
     def _initialize_db_client(self):
@@ -153,6 +215,193 @@ class MomentumAlphaIntegration:
             traceback.print_exc()
             return False
 
+    @staticmethod
+    def _log_failure(future, action: str):
+        """Log an exception raised by a background write."""
+        error = future.exception()
+        if error is not None:
+            logger.error(f"❌ Failed to {action}: {error}")
+
+    def _submit(self, executor: ThreadPoolExecutor, action: str, fn, *args, **kwargs):
+        """Queue a database write; failures are logged when it completes."""
+        future = executor.submit(fn, *args, **kwargs)
+        future.add_done_callback(lambda f: self._log_failure(f, action))
+        return future
+
+    def log_trade_entry(
+        self,
+        trade_id: str,
+        symbol: str,
+        side: str,
+        entry_price: float,
+        quantity: float,
+        position_size_usd: float,
+        stop_loss: float = None,
+        take_profit: float = None,
+        signal_strength: float = None
+    ) -> bool:
+        """
+        Log a trade entry from the trading loop (fill + position entry + Redis).
+
+        The writes are queued and run in the background; the bot holds at
+        most one position per symbol, so the Redis position is just this
+        entry and is written in parallel with PostgreSQL.
+
+        Args:
+            trade_id: Unique trade identifier
+            symbol: Trading pair
+            side: 'Buy' or 'Sell'
+            entry_price: Entry price
+            quantity: Position quantity
+            position_size_usd: Position value in USD
+            stop_loss: Stop loss price
+            take_profit: Take profit price
+            signal_strength: Signal strength (0-1)
+
+        Returns:
+            True if the writes were queued
+        """
+        if not self.db_client:
+            return False
+
+        side_capitalized = side.capitalize() if side else side
+        entry_time = datetime.utcnow()
+
+        self._submit(
+            self._redis_executor, "update Redis position",
+            self.db_client.update_position_redis,
+            symbol=symbol,
+            size=quantity,
+            side=side_capitalized,
+            avg_price=entry_price,
+            unrealized_pnl=0.0
+        )
+        self._submit(
+            self._pg_executor, "log trade entry",
+            self._record_entry, trade_id, symbol, side_capitalized, entry_price, quantity, entry_time
+        )
+
+        logger.info(f"📊 Trade entry queued: {symbol} {side} {quantity} @ {entry_price} (${position_size_usd:,.2f})")
+        return True
+
+    def _record_entry(
+        self,
+        trade_id: str,
+        symbol: str,
+        side: str,
+        entry_price: float,
+        quantity: float,
+        entry_time: datetime
+    ):
+        """Write the entry fill and its position entry (needs the fill id)."""
+        fill_id = self.db_client.write_fill(
+            symbol=symbol,
+            side=side,
+            exec_price=entry_price,
+            exec_qty=quantity,
+            order_id=trade_id,
+            client_order_id=create_client_order_id(self.bot_id, 'entry'),
+            close_reason='entry',
+            commission=0.0,  # Will be updated from actual order
+            exec_time=entry_time
+        )
+        self.db_client.create_position_entry(
+            symbol=symbol,
+            entry_price=entry_price,
+            quantity=quantity,
+            entry_time=entry_time,
+            entry_order_id=trade_id,
+            entry_fill_id=fill_id,
+            commission=0.0
+        )
+
+    def log_trade_exit(
+        self,
+        trade_id: str,
+        symbol: str,
+        side: str,
+        exit_price: float,
+        quantity: float,
+        pnl_usd: float,
+        pnl_pct: float,
+        exit_reason: str,
+        holding_time_seconds: int
+    ) -> bool:
+        """
+        Log a full trade exit from the trading loop (fill + FIFO close + Redis).
+
+        Queued behind any earlier entry writes for the same bot, so the FIFO
+        close always sees its position entry. The flat Redis state is
+        written in parallel.
+
+        Args:
+            trade_id: Trade identifier
+            symbol: Trading pair
+            side: Original entry side ('Buy' or 'Sell')
+            exit_price: Exit price
+            quantity: Position quantity
+            pnl_usd: Profit/loss in USD
+            pnl_pct: Profit/loss percentage
+            exit_reason: Why position closed
+            holding_time_seconds: How long position was held
+
+        Returns:
+            True if the writes were queued
+        """
+        if not self.db_client:
+            return False
+
+        exit_side = 'Sell' if side == 'Buy' else 'Buy'
+        exit_time = datetime.utcnow()
+
+        self._submit(
+            self._redis_executor, "update Redis position",
+            self.db_client.update_position_redis,
+            symbol=symbol,
+            size=0.0,
+            side='None',
+            avg_price=0.0,
+            unrealized_pnl=0.0
+        )
+        self._submit(
+            self._pg_executor, "log trade exit",
+            self._record_exit, trade_id, symbol, exit_side, exit_price, quantity, exit_reason, exit_time
+        )
+
+        logger.info(f"📊 Trade exit queued: {symbol} PnL: ${pnl_usd:.2f} ({pnl_pct:.2f}%) - {exit_reason}")
+        return True
+
+    def _record_exit(
+        self,
+        trade_id: str,
+        symbol: str,
+        exit_side: str,
+        exit_price: float,
+        quantity: float,
+        exit_reason: str,
+        exit_time: datetime
+    ):
+        """Write the exit fill and close the position entries FIFO."""
+        self.db_client.write_fill(
+            symbol=symbol,
+            side=exit_side,
+            exec_price=exit_price,
+            exec_qty=quantity,
+            order_id=f"{trade_id}_exit",
+            client_order_id=create_client_order_id(self.bot_id, exit_reason),
+            close_reason=exit_reason,
+            commission=0.0,  # Will be updated from actual order
+            exec_time=exit_time
+        )
+        self.db_client.close_position_fifo(
+            symbol=symbol,
+            exit_price=exit_price,
+            close_qty=quantity,
+            exit_time=exit_time,
+            exit_reason=exit_reason,
+            exit_commission=0.0
+        )
+
     def log_trade_closed(
         self,
         symbol: str,
@@ -185,9 +434,9 @@ class MomentumAlphaIntegration:
             # Determine exit side (opposite of entry)
             exit_side = 'Sell' if side == 'Buy' else 'Buy'
 
-            # Create trade ID
-            trade_id = f"{self.bot_id}_{symbol}_exit_{int(datetime.utcnow().timestamp())}"
+            # Create trade ID (one clock read for both the ID and the fill)
             exit_time = datetime.utcnow()
+            trade_id = f"{self.bot_id}_{symbol}_exit_{int(exit_time.timestamp())}"
 
             # Record exit fill
             self.db_client.write_fill(
@@ -309,26 +558,68 @@ class MomentumAlphaIntegration:
     # ========================================
 
     def send_heartbeat(self):
-        """Send heartbeat to bot registry."""
-        if not self.db_client:
+        """Send heartbeat to bot registry (coalesced with pending equity updates)."""
+        self._queue_tick('heartbeat', True)
+
+    def update_equity(self, equity: float):
+        """Update current equity in bot registry (only the latest value is written)."""
+        self._queue_tick('equity', equity)
+
+    def start_heartbeat(self, interval: float = 30.0):
+        """
+        Send heartbeats from a daemon thread every `interval` seconds.
+
+        Keeps the registry heartbeat fresh while the trading loop sleeps
+        between candle checks. Each beat only queues a flush, so a slow
+        database never delays the thread's schedule, let alone the loop.
+        """
+        if not self.db_client or self._heartbeat_thread is not None:
             return
 
-        try:
-            self.db_client.update_heartbeat()
-            logger.debug(f"💓 Heartbeat sent for {self.bot_id}")
-        except Exception as e:
-            logger.debug(f"Failed to send heartbeat: {e}")
+        def beat():
+            while not self._heartbeat_stop.is_set():
+                self.send_heartbeat()
+                self._heartbeat_stop.wait(interval)
 
-    def update_equity(self, equity: float):
-        """Update current equity in bot registry."""
+        self._heartbeat_thread = threading.Thread(target=beat, name="alpha-heartbeat", daemon=True)
+        self._heartbeat_thread.start()
+
+    def _queue_tick(self, key: str, value):
+        """
+        Record a registry update and schedule a flush if none is pending.
+
+        Updates arriving before the flush runs just overwrite the pending
+        value, so a burst (equity after each close, then the loop's
+        heartbeat) costs one write per field instead of one per call.
+        """
         if not self.db_client:
             return
 
-        try:
-            self.db_client.update_equity(equity)
-            logger.debug(f"💰 Equity updated: ${equity:,.2f}")
-        except Exception as e:
-            logger.debug(f"Failed to update equity: {e}")
+        with self._tick_lock:
+            schedule = not self._pending_tick
+            self._pending_tick[key] = value
+
+        if schedule:
+            self._pg_executor.submit(self._flush_tick)
+
+    def _flush_tick(self):
+        """Write the pending equity/heartbeat updates."""
+        with self._tick_lock:
+            pending, self._pending_tick = self._pending_tick, {}
+
+        if 'equity' in pending:
+            try:
+                self.db_client.update_equity(pending['equity'])
+                logger.debug(f"💰 Equity updated: ${pending['equity']:,.2f}")
+            except Exception as e:
+                logger.debug(f"Failed to update equity: {e}")
+
+        if pending.get('heartbeat'):
+            try:
+                self.db_client.update_heartbeat()
+                logger.debug(f"💓 Heartbeat sent for {self.bot_id}")
+            except Exception as e:
+                logger.debug(f"Failed to send heartbeat: {e}")
 
     # ========================================
     # PERFORMANCE QUERIES
@@ -360,12 +651,23 @@ class MomentumAlphaIntegration:
 
     def close(self):
         """Close database connections."""
+        # Stop the heartbeat, then drain queued writes before the
+        # connections go away
+        self._heartbeat_stop.set()
+        if self._heartbeat_thread is not None:
+            self._heartbeat_thread.join()
+            self._heartbeat_thread = None
+        self._redis_executor.shutdown(wait=True)
+        self._pg_executor.shutdown(wait=True)
         if self.db_client:
             try:
                 self.db_client.close()
                 logger.info(f"Alpha integration closed for {self.bot_id}")
             except:
                 pass
+        if self._log_listener_held:
+            self._log_listener_held = False
+            _stop_log_listener()
 
 
 # Singleton instance for easy import
@@ -7,6 +7,7 @@ Shows current BTC regime status to understand why signals may not be appearing.
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
+import pandas as pd
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -43,8 +44,8 @@ try:
         adx_threshold=25.0
     )
 
-    # Get latest status
-    latest = regime.iloc[-1]
+    # Get latest status (one row fetch, then plain dict lookups)
+    latest = regime.iloc[-1].to_dict()
 
     print("\n" + "="*80)
     print("CURRENT BTC STATUS")
@@ -88,8 +89,10 @@ try:
     print("HISTORICAL REGIME STATS (Last 90 days)")
     print("="*80)
 
-    favorable_count = regime['btc_regime_favorable'].sum()
-    total_count = len(regime[regime['btc_regime_favorable'].notna()])
+    favorable = regime['btc_regime_favorable'].to_numpy()
+    valid = ~pd.isna(favorable)
+    total_count = int(valid.sum())
+    favorable_count = int(favorable[valid].astype(bool).sum())
     favorable_pct = (favorable_count / total_count * 100) if total_count > 0 else 0
 
     print(f"Favorable periods: {favorable_count}/{total_count} ({favorable_pct:.1f}%)")
@@ -14,192 +14,244 @@ Schedule with cron:
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional
 import json
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from config.trading_config import TradingConfig
-from database.trade_logger import TradeLogger
-from utils.telegram_alerts import TelegramAlerts
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+        )
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, default=str).encode()
+
+from database.trade_database import TradeDatabase
+from alerts.telegram_bot import TelegramBot
+
+# Trade columns the reports actually use
+ANALYSIS_COLUMNS = ('symbol', 'exit_time', 'return_pct', 'return_usd')
+
+# TradeDatabase column -> name used in the reports
+_DB_COLUMN_NAMES = {'pnl_pct': 'return_pct', 'pnl_usd': 'return_usd'}
+
+# Closed trades only, with the P&L columns under their report names
+_SELECT_CLOSED_TRADES = f'''
+    SELECT symbol, exit_time,
+           {', '.join(f"{col} AS {name}" for col, name in _DB_COLUMN_NAMES.items())}
+    FROM trades
+    WHERE exit_time IS NOT NULL
+    ORDER BY exit_time
+'''
+
+# All-time totals over closed trades, without fetching them
+_SUMMARIZE_CLOSED_TRADES = '''
+    SELECT COUNT(*), COALESCE(SUM(pnl_pct > 0), 0), COALESCE(SUM(pnl_usd), 0)
+    FROM trades
+    WHERE exit_time IS NOT NULL
+'''
 
 
 class PerformanceAnalyzer:
     """Analyzes trading performance and generates daily/weekly reports."""
 
-    def __init__(self, config: TradingConfig):
+    def __init__(self, config, return_dtype: np.dtype = np.float64):
+        """
+        Args:
+            config: Trading configuration (TradingConfig)
+            return_dtype: Float dtype for the return_pct/return_usd columns;
+                          np.float32 halves their memory traffic at ~7
+                          significant digits (sums still accumulate in
+                          float64) (default: np.float64)
+        """
         self.config = config
-        self.db = TradeLogger(config.database.db_path)
-        self.telegram = TelegramAlerts(
+        self.return_dtype = return_dtype
+        self.db = TradeDatabase(config.database.db_path)
+        self.telegram = TelegramBot(
             config.alerts.bot_token,
             config.alerts.chat_id
         ) if config.alerts.enabled else None
 
-    def analyze_daily_performance(self) -> Dict:
-        """Analyze performance for the last 24 hours."""
-        now = datetime.utcnow()
-        yesterday = now - timedelta(days=1)
+    def _load_trades(self, start: datetime, end: datetime,
+                     trades: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """
+        Trades that closed in [start, end).
+
+        Slices an already loaded trades frame when one is given, otherwise
+        queries just that window.
+        """
+        if trades is None:
+            # Most windows are empty; a COUNT(*) avoids fetching and framing
+            if self.db.count_trades_between(start, end) == 0:
+                return pd.DataFrame()
+            trades = pd.DataFrame(self.db.get_trades_between(start, end))
+            trades = trades.rename(columns=_DB_COLUMN_NAMES)[list(ANALYSIS_COLUMNS)]
+            return trades.astype(self._return_dtypes())
+        exit_time = trades['exit_time']
+        return trades[(exit_time >= start) & (exit_time < end)]
+
+    def _load_trades_df(self) -> pd.DataFrame:
+        """Load closed trades once (only the analysed columns), with exit_time parsed."""
+        return pd.read_sql(
+            _SELECT_CLOSED_TRADES,
+            self.db.conn,
+            parse_dates=['exit_time'],
+            dtype=self._return_dtypes()
+        )
+
+    def _return_dtypes(self) -> Dict:
+        """Column dtypes for the loaded return columns."""
+        return {'return_pct': self.return_dtype, 'return_usd': self.return_dtype}
+
+    @staticmethod
+    def _trade_summary(trades: pd.DataFrame) -> Dict:
+        """Metrics shared by the daily and weekly reports."""
+        returns_pct = trades['return_pct'].to_numpy()
+        returns_usd = trades['return_usd'].to_numpy()
+
+        # Split winners/losers once and reuse the masks for every metric
+        winners = returns_pct > 0
+        losers = ~winners
+        n_winners = int(winners.sum())
+        n_losers = len(trades) - n_winners
+
+        def trade_at(i: int) -> Dict:
+            return {
+                'symbol': trades['symbol'].iat[i],
+                'return_pct': returns_pct[i],
+                'return_usd': returns_usd[i]
+            }
 
-        # Get trades from last 24 hours
-        all_trades = self.db.get_all_trades()
-        if not all_trades:
-            return self._empty_daily_report()
+        return {
+            'total_trades': len(trades),
+            'winners': n_winners,
+            'losers': n_losers,
+            'win_rate': n_winners / len(trades),
+            'total_pnl_usd': returns_usd.sum(dtype=np.float64),
+            'avg_win_pct': returns_pct[winners].mean(dtype=np.float64) if n_winners > 0 else 0,
+            'avg_loss_pct': returns_pct[losers].mean(dtype=np.float64) if n_losers > 0 else 0,
+            'gross_profit': returns_usd[winners].sum(dtype=np.float64),
+            'gross_loss': abs(returns_usd[losers].sum(dtype=np.float64)),
+            'best_trade': trade_at(int(returns_pct.argmax())),
+            'worst_trade': trade_at(int(returns_pct.argmin()))
+        }
 
-        df = pd.DataFrame(all_trades)
-        df['entry_time'] = pd.to_datetime(df['entry_time'])
-        df['exit_time'] = pd.to_datetime(df['exit_time'])
+    def analyze_daily_performance(self, trades: Optional[pd.DataFrame] = None) -> Dict:
+        """
+        Analyze performance for the last 24 hours.
 
-        # Filter for trades that closed in last 24 hours
-        daily_trades = df[
-            (df['exit_time'] >= yesterday) &
-            (df['exit_time'] < now)
-        ]
+        Args:
+            trades: Pre-loaded trades covering at least the last 24 hours
+                    (default: query the window)
+        """
+        now = datetime.utcnow()
+        yesterday = now - timedelta(days=1)
 
+        # Trades that closed in the last 24 hours
+        daily_trades = self._load_trades(yesterday, now, trades)
         if len(daily_trades) == 0:
             return self._empty_daily_report()
 
-        # Calculate metrics
-        total_trades = len(daily_trades)
-        winners = daily_trades[daily_trades['return_pct'] > 0]
-        losers = daily_trades[daily_trades['return_pct'] <= 0]
-
-        win_rate = len(winners) / total_trades if total_trades > 0 else 0
-        total_pnl = daily_trades['return_usd'].sum()
-        avg_win = winners['return_pct'].mean() if len(winners) > 0 else 0
-        avg_loss = losers['return_pct'].mean() if len(losers) > 0 else 0
-
-        # Best and worst trades
-        best_trade = daily_trades.loc[daily_trades['return_pct'].idxmax()] if len(daily_trades) > 0 else None
-        worst_trade = daily_trades.loc[daily_trades['return_pct'].idxmin()] if len(daily_trades) > 0 else None
+        summary = self._trade_summary(daily_trades)
+        del summary['gross_profit'], summary['gross_loss']
 
         return {
             'period': 'daily',
             'start_time': yesterday.isoformat(),
             'end_time': now.isoformat(),
-            'total_trades': total_trades,
-            'winners': len(winners),
-            'losers': len(losers),
-            'win_rate': win_rate,
-            'total_pnl_usd': total_pnl,
-            'avg_win_pct': avg_win,
-            'avg_loss_pct': avg_loss,
-            'best_trade': {
-                'symbol': best_trade['symbol'],
-                'return_pct': best_trade['return_pct'],
-                'return_usd': best_trade['return_usd']
-            } if best_trade is not None else None,
-            'worst_trade': {
-                'symbol': worst_trade['symbol'],
-                'return_pct': worst_trade['return_pct'],
-                'return_usd': worst_trade['return_usd']
-            } if worst_trade is not None else None
+            **summary
         }
 
-    def analyze_weekly_performance(self) -> Dict:
-        """Analyze performance for the last 7 days."""
+    def analyze_weekly_performance(self, trades: Optional[pd.DataFrame] = None) -> Dict:
+        """
+        Analyze performance for the last 7 days.
+
+        Args:
+            trades: Pre-loaded trades covering at least the last 7 days
+                    (default: query the window)
+        """
         now = datetime.utcnow()
         week_ago = now - timedelta(days=7)
 
-        # Get trades from last 7 days
-        all_trades = self.db.get_all_trades()
-        if not all_trades:
-            return self._empty_weekly_report()
-
-        df = pd.DataFrame(all_trades)
-        df['entry_time'] = pd.to_datetime(df['entry_time'])
-        df['exit_time'] = pd.to_datetime(df['exit_time'])
-
-        # Filter for trades that closed in last 7 days
-        weekly_trades = df[
-            (df['exit_time'] >= week_ago) &
-            (df['exit_time'] < now)
-        ]
-
+        # Trades that closed in the last 7 days
+        weekly_trades = self._load_trades(week_ago, now, trades)
         if len(weekly_trades) == 0:
             return self._empty_weekly_report()
 
-        # Calculate metrics
-        total_trades = len(weekly_trades)
-        winners = weekly_trades[weekly_trades['return_pct'] > 0]
-        losers = weekly_trades[weekly_trades['return_pct'] <= 0]
-
-        win_rate = len(winners) / total_trades if total_trades > 0 else 0
-        total_pnl = weekly_trades['return_usd'].sum()
-        avg_win = winners['return_pct'].mean() if len(winners) > 0 else 0
-        avg_loss = losers['return_pct'].mean() if len(losers) > 0 else 0
-
-        # Profit factor
-        gross_profit = winners['return_usd'].sum() if len(winners) > 0 else 0
-        gross_loss = abs(losers['return_usd'].sum()) if len(losers) > 0 else 0
-        profit_factor = gross_profit / gross_loss if gross_loss > 0 else float('inf')
-
-        # Best and worst trades
-        best_trade = weekly_trades.loc[weekly_trades['return_pct'].idxmax()] if len(weekly_trades) > 0 else None
-        worst_trade = weekly_trades.loc[weekly_trades['return_pct'].idxmin()] if len(weekly_trades) > 0 else None
-
-        # Top symbols
-        symbol_performance = weekly_trades.groupby('symbol').agg({
-            'return_usd': 'sum',
-            'symbol': 'count'
-        }).rename(columns={'symbol': 'trades'})
-        symbol_performance = symbol_performance.sort_values('return_usd', ascending=False)
-        top_symbols = symbol_performance.head(5).to_dict('index')
+        summary = self._trade_summary(weekly_trades)
+        gross_loss = summary['gross_loss']
+        profit_factor = summary['gross_profit'] / gross_loss if gross_loss > 0 else float('inf')
+
+        # Per-symbol and per-day P&L: bincount over the group codes rather
+        # than DataFrame.groupby, which is mostly overhead at this size
+        returns_usd = weekly_trades['return_usd'].to_numpy()
+
+        symbols, symbol_idx = np.unique(weekly_trades['symbol'].to_numpy(), return_inverse=True)
+        symbol_pnl = np.bincount(symbol_idx, weights=returns_usd)
+        symbol_trades = np.bincount(symbol_idx)
+        top = np.argsort(-symbol_pnl, kind='stable')[:5]
+        top_symbols = {
+            str(symbols[i]): {'return_usd': symbol_pnl[i], 'trades': int(symbol_trades[i])}
+            for i in top
+        }
 
-        # Daily breakdown
-        daily_pnl = weekly_trades.groupby(weekly_trades['exit_time'].dt.date)['return_usd'].sum()
+        days, day_idx = np.unique(
+            weekly_trades['exit_time'].to_numpy().astype('datetime64[D]'), return_inverse=True
+        )
+        daily_pnl = dict(zip(days.astype(str).tolist(), np.bincount(day_idx, weights=returns_usd)))
 
         return {
             'period': 'weekly',
             'start_time': week_ago.isoformat(),
             'end_time': now.isoformat(),
-            'total_trades': total_trades,
-            'winners': len(winners),
-            'losers': len(losers),
-            'win_rate': win_rate,
-            'total_pnl_usd': total_pnl,
-            'avg_win_pct': avg_win,
-            'avg_loss_pct': avg_loss,
+            **summary,
             'profit_factor': profit_factor,
-            'gross_profit': gross_profit,
-            'gross_loss': gross_loss,
-            'best_trade': {
-                'symbol': best_trade['symbol'],
-                'return_pct': best_trade['return_pct'],
-                'return_usd': best_trade['return_usd']
-            } if best_trade is not None else None,
-            'worst_trade': {
-                'symbol': worst_trade['symbol'],
-                'return_pct': worst_trade['return_pct'],
-                'return_usd': worst_trade['return_usd']
-            } if worst_trade is not None else None,
             'top_symbols': top_symbols,
-            'daily_pnl': daily_pnl.to_dict()
+            'daily_pnl': daily_pnl
         }
 
-    def analyze_all_time_performance(self) -> Dict:
-        """Analyze all-time performance statistics."""
-        all_trades = self.db.get_all_trades()
-        if not all_trades:
+    def analyze_all_time_performance(self, trades: Optional[pd.DataFrame] = None) -> Dict:
+        """
+        Analyze all-time performance statistics.
+
+        Args:
+            trades: Pre-loaded trades table (default: aggregate in SQL)
+        """
+        if trades is None:
+            total_trades, n_winners, total_pnl = self.db.conn.execute(
+                _SUMMARIZE_CLOSED_TRADES
+            ).fetchone()
+        else:
+            total_trades = len(trades)
+            n_winners = int((trades['return_pct'].to_numpy() > 0).sum())
+            total_pnl = trades['return_usd'].to_numpy().sum(dtype=np.float64)
+
+        if total_trades == 0:
             return {}
 
-        df = pd.DataFrame(all_trades)
-
-        total_trades = len(df)
-        winners = df[df['return_pct'] > 0]
-        losers = df[df['return_pct'] <= 0]
-
-        win_rate = len(winners) / total_trades if total_trades > 0 else 0
-        total_pnl = df['return_usd'].sum()
+        win_rate = n_winners / total_trades
 
         return {
             'period': 'all_time',
             'total_trades': total_trades,
             'win_rate': win_rate,
             'total_pnl_usd': total_pnl,
-            'current_equity': self.db.get_current_equity()
+            'current_equity': self._current_equity()
         }
 
+    def _current_equity(self) -> Optional[float]:
+        """Ending equity of the latest daily snapshot, if any."""
+        snapshots = self.db.get_daily_snapshots(days=1)
+        return snapshots[0]['ending_equity'] if snapshots else None
+
     def _empty_daily_report(self) -> Dict:
         """Return empty daily report."""
         now = datetime.utcnow()
@@ -237,67 +289,71 @@ class PerformanceAnalyzer:
         if metrics.get('total_trades', 0) == 0:
             return f"📊 **Daily Performance Report**\n{metrics.get('message', 'No trades')}"
 
-        report = f"""
-📊 **Daily Performance Report** - {datetime.utcnow().strftime('%Y-%m-%d')}
-
-**Trading Activity:**
-  Trades: {metrics['total_trades']}
-  Winners: {metrics['winners']} | Losers: {metrics['losers']}
-  Win Rate: {metrics['win_rate']*100:.1f}%
-
-**Returns:**
-  Total P&L: ${metrics['total_pnl_usd']:,.2f}
-  Avg Win: {metrics['avg_win_pct']:.2f}%
-  Avg Loss: {metrics['avg_loss_pct']:.2f}%
-
-**Highlights:**
-"""
+        lines = [
+            f"📊 **Daily Performance Report** - {datetime.utcnow().strftime('%Y-%m-%d')}",
+            "",
+            "**Trading Activity:**",
+            f"  Trades: {metrics['total_trades']}",
+            f"  Winners: {metrics['winners']} | Losers: {metrics['losers']}",
+            f"  Win Rate: {metrics['win_rate']*100:.1f}%",
+            "",
+            "**Returns:**",
+            f"  Total P&L: ${metrics['total_pnl_usd']:,.2f}",
+            f"  Avg Win: {metrics['avg_win_pct']:.2f}%",
+            f"  Avg Loss: {metrics['avg_loss_pct']:.2f}%",
+            "",
+            "**Highlights:**",
+        ]
 
-        if metrics.get('best_trade'):
-            bt = metrics['best_trade']
-            report += f"  Best: {bt['symbol']} +{bt['return_pct']:.2f}% (${bt['return_usd']:,.2f})\n"
+        bt = metrics.get('best_trade')
+        if bt:
+            lines.append(f"  Best: {bt['symbol']} +{bt['return_pct']:.2f}% (${bt['return_usd']:,.2f})")
 
-        if metrics.get('worst_trade'):
-            wt = metrics['worst_trade']
-            report += f"  Worst: {wt['symbol']} {wt['return_pct']:.2f}% (${wt['return_usd']:,.2f})\n"
+        wt = metrics.get('worst_trade')
+        if wt:
+            lines.append(f"  Worst: {wt['symbol']} {wt['return_pct']:.2f}% (${wt['return_usd']:,.2f})")
 
-        return report.strip()
+        return "\n".join(lines)
 
     def format_weekly_report(self, metrics: Dict) -> str:
         """Format weekly metrics as readable text."""
         if metrics.get('total_trades', 0) == 0:
             return f"📈 **Weekly Performance Report**\n{metrics.get('message', 'No trades')}"
 
-        report = f"""
-📈 **Weekly Performance Report** - Week ending {datetime.utcnow().strftime('%Y-%m-%d')}
-
-**Trading Activity:**
-  Trades: {metrics['total_trades']}
-  Winners: {metrics['winners']} | Losers: {metrics['losers']}
-  Win Rate: {metrics['win_rate']*100:.1f}%
-
-**Returns:**
-  Total P&L: ${metrics['total_pnl_usd']:,.2f}
-  Gross Profit: ${metrics['gross_profit']:,.2f}
-  Gross Loss: ${metrics['gross_loss']:,.2f}
-  Profit Factor: {metrics['profit_factor']:.2f}
-
-**Performance:**
-  Avg Win: {metrics['avg_win_pct']:.2f}%
-  Avg Loss: {metrics['avg_loss_pct']:.2f}%
-
-**Top Performers:**
-"""
+        lines = [
+            f"📈 **Weekly Performance Report** - Week ending {datetime.utcnow().strftime('%Y-%m-%d')}",
+            "",
+            "**Trading Activity:**",
+            f"  Trades: {metrics['total_trades']}",
+            f"  Winners: {metrics['winners']} | Losers: {metrics['losers']}",
+            f"  Win Rate: {metrics['win_rate']*100:.1f}%",
+            "",
+            "**Returns:**",
+            f"  Total P&L: ${metrics['total_pnl_usd']:,.2f}",
+            f"  Gross Profit: ${metrics['gross_profit']:,.2f}",
+            f"  Gross Loss: ${metrics['gross_loss']:,.2f}",
+            f"  Profit Factor: {metrics['profit_factor']:.2f}",
+            "",
+            "**Performance:**",
+            f"  Avg Win: {metrics['avg_win_pct']:.2f}%",
+            f"  Avg Loss: {metrics['avg_loss_pct']:.2f}%",
+            "",
+            "**Top Performers:**",
+        ]
 
-        if metrics.get('top_symbols'):
-            for symbol, data in list(metrics['top_symbols'].items())[:3]:
-                report += f"  {symbol}: ${data['return_usd']:,.2f} ({int(data['trades'])} trades)\n"
+        top_symbols = metrics.get('top_symbols')
+        if top_symbols:
+            lines.extend(
+                f"  {symbol}: ${data['return_usd']:,.2f} ({int(data['trades'])} trades)"
+                for symbol, data in list(top_symbols.items())[:3]
+            )
 
-        if metrics.get('best_trade'):
-            bt = metrics['best_trade']
-            report += f"\n**Best Trade:** {bt['symbol']} +{bt['return_pct']:.2f}% (${bt['return_usd']:,.2f})\n"
+        bt = metrics.get('best_trade')
+        if bt:
+            lines.append("")
+            lines.append(f"**Best Trade:** {bt['symbol']} +{bt['return_pct']:.2f}% (${bt['return_usd']:,.2f})")
 
-        return report.strip()
+        return "\n".join(lines)
 
     def save_report(self, daily_metrics: Dict, weekly_metrics: Optional[Dict] = None):
         """Save performance reports to file."""
@@ -306,14 +362,14 @@ class PerformanceAnalyzer:
 
         # Save daily report
         daily_file = reports_dir / f"daily_{datetime.utcnow().strftime('%Y%m%d')}.json"
-        with open(daily_file, 'w') as f:
-            json.dump(daily_metrics, f, indent=2, default=str)
+        with open(daily_file, 'wb') as f:
+            f.write(_json_dumps(daily_metrics))
 
         # Save weekly report if Monday
         if weekly_metrics:
             weekly_file = reports_dir / f"weekly_{datetime.utcnow().strftime('%Y%m%d')}.json"
-            with open(weekly_file, 'w') as f:
-                json.dump(weekly_metrics, f, indent=2, default=str)
+            with open(weekly_file, 'wb') as f:
+                f.write(_json_dumps(weekly_metrics))
 
     def run(self):
         """Run performance analysis - called daily at 12 AM UTC."""
@@ -321,16 +377,29 @@ class PerformanceAnalyzer:
         print(f"PERFORMANCE ANALYSIS - {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC")
         print("="*80)
 
+        # Count the weekly window first: when nothing closed this week the
+        # daily and weekly reports are empty and the all-time stats come from
+        # one SQL aggregate, so nothing is loaded into pandas. Otherwise load
+        # the trades table once and share it across the analyses; the daily
+        # report only needs a slice of the weekly window
+        now = datetime.utcnow()
+        week_ago = now - timedelta(days=7)
+        all_trades = weekly_trades = None
+        if self.db.count_trades_between(week_ago, now) > 0:
+            all_trades = self._load_trades_df()
+            weekly_trades = self._load_trades(week_ago, now, all_trades)
+
         # Daily analysis (always run)
         print("\nAnalyzing daily performance...")
-        daily_metrics = self.analyze_daily_performance()
+        daily_metrics = self.analyze_daily_performance(weekly_trades)
         daily_report = self.format_daily_report(daily_metrics)
 
         print(daily_report)
 
-        # Send daily report via Telegram
+        # Reports to send via Telegram, combined into one message below
+        telegram_reports = []
         if self.telegram and self.config.alerts.send_daily_summary:
-            self.telegram.send_message(daily_report)
+            telegram_reports.append(daily_report)
 
         # Weekly analysis (only on Mondays)
         weekly_metrics = None
@@ -339,25 +408,30 @@ class PerformanceAnalyzer:
             print("WEEKLY ANALYSIS")
             print("="*80)
 
-            weekly_metrics = self.analyze_weekly_performance()
+            weekly_metrics = self.analyze_weekly_performance(weekly_trades)
             weekly_report = self.format_weekly_report(weekly_metrics)
 
             print(weekly_report)
 
-            # Send weekly report via Telegram
             if self.telegram and self.config.alerts.send_weekly_summary:
-                self.telegram.send_message(weekly_report)
+                telegram_reports.append(weekly_report)
+
+        # One Telegram round trip for the daily and (Mondays) weekly report
+        if telegram_reports:
+            # The reports use Markdown bold, and "P&L" would break HTML parsing
+            self.telegram.send_message("\n\n".join(telegram_reports), parse_mode="Markdown")
 
         # All-time summary
         print("\n" + "="*80)
         print("ALL-TIME STATISTICS")
         print("="*80)
-        all_time = self.analyze_all_time_performance()
+        all_time = self.analyze_all_time_performance(all_trades)
         if all_time:
             print(f"Total Trades: {all_time['total_trades']}")
             print(f"Win Rate: {all_time['win_rate']*100:.1f}%")
             print(f"Total P&L: ${all_time['total_pnl_usd']:,.2f}")
-            print(f"Current Equity: ${all_time['current_equity']:,.2f}")
+            if all_time['current_equity'] is not None:
+                print(f"Current Equity: ${all_time['current_equity']:,.2f}")
 
         # Save reports
         self.save_report(daily_metrics, weekly_metrics)
@@ -369,6 +443,7 @@ class PerformanceAnalyzer:
 
 if __name__ == "__main__":
     """Run performance analysis."""
+    from config.trading_config import TradingConfig
 
     # Load configuration
     config = TradingConfig(fetch_capital_from_exchange=False)
@@ -9,24 +9,24 @@ This script:
 5. Saves results to CSV
 """
 
+import multiprocessing
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime, timedelta
-import pandas as pd
+from typing import Dict, List, Optional
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from config.assets import load_universe
-from backtest.backtester import Backtester
-from backtest.performance import calculate_performance_metrics, generate_performance_report
-
 
 def run_full_backtest(
     initial_capital: float = 10000,
     backtest_days: int = 365,
     bbwidth_threshold: float = 0.25,
     rvr_threshold: float = 2.0,
-    save_results: bool = True
+    save_results: bool = True,
+    csv_copy: bool = False
 ):
     """
     Run full backtest on asset universe.
@@ -36,8 +36,16 @@ def run_full_backtest(
         backtest_days: Days to backtest (default: 365)
         bbwidth_threshold: BBWidth percentile threshold (default: 0.25)
         rvr_threshold: Minimum RVR (default: 2.0)
-        save_results: Whether to save results to CSV (default: True)
+        save_results: Whether to save results (Parquet, or CSV without pyarrow) (default: True)
+        csv_copy: Also write CSV copies of the results in the background (default: False)
     """
+    # Imported here so importing this module (e.g. for run_threshold_sweep)
+    # doesn't pay for pandas and the backtester until a backtest runs
+    from config.assets import load_universe
+    from backtest.backtester import Backtester, trades_to_frame
+    from backtest.performance import calculate_performance_metrics, generate_performance_report
+    from backtest.results_io import save_results_table, save_metrics
+
     print("="*80)
     print("VOLATILITY BREAKOUT MOMENTUM STRATEGY - BACKTEST")
     print("="*80)
@@ -99,38 +107,20 @@ def run_full_backtest(
         print("\n6. Saving results...")
 
         # Save trades
-        trades_data = []
-        for trade in result.trades:
-            trades_data.append({
-                'symbol': trade.symbol,
-                'entry_date': trade.entry_date,
-                'entry_price': trade.entry_price,
-                'exit_date': trade.exit_date,
-                'exit_price': trade.exit_price,
-                'position_size_usd': trade.position_size_usd,
-                'return_pct': trade.return_pct,
-                'return_usd': trade.return_usd,
-                'holding_days': trade.holding_days,
-                'exit_reason': trade.exit_reason,
-                'peak_price': trade.peak_price,
-                'max_adverse_excursion': trade.max_adverse_excursion
-            })
-
-        trades_df = pd.DataFrame(trades_data)
-        trades_file = Path(__file__).parent / 'results' / 'backtest_trades.csv'
-        trades_file.parent.mkdir(exist_ok=True)
-        trades_df.to_csv(trades_file, index=False)
+        results_dir = Path(__file__).parent / 'results'
+        trades_file = save_results_table(
+            trades_to_frame(result.trades), results_dir / 'backtest_trades', csv_copy
+        )
         print(f"   Saved trades to: {trades_file}")
 
         # Save equity curve
-        equity_file = Path(__file__).parent / 'results' / 'equity_curve.csv'
-        result.equity_curve.to_csv(equity_file, index=False)
+        equity_file = save_results_table(
+            result.equity_curve, results_dir / 'equity_curve', csv_copy
+        )
         print(f"   Saved equity curve to: {equity_file}")
 
         # Save metrics
-        metrics_df = pd.DataFrame([metrics])
-        metrics_file = Path(__file__).parent / 'results' / 'performance_metrics.csv'
-        metrics_df.to_csv(metrics_file, index=False)
+        metrics_file = save_metrics(metrics, results_dir / 'performance_metrics')
         print(f"   Saved metrics to: {metrics_file}")
 
     print(f"\n{'='*80}")
@@ -140,6 +130,102 @@ def run_full_backtest(
     return result, metrics
 
 
+def run_threshold_sensitivity(
+    thresholds: List[float],
+    initial_capital: float = 10000,
+    backtest_days: int = 365,
+    rvr_threshold: float = 2.0
+) -> Dict[float, Dict]:
+    """
+    Backtest several BBWidth thresholds on one set of loaded data.
+
+    Data and indicators are loaded once (Backtester.precompute); only the
+    threshold-dependent signals and the simulation run per threshold.
+
+    Args:
+        thresholds: BBWidth percentile thresholds to test
+        initial_capital: Starting capital (default: $10,000)
+        backtest_days: Days to backtest (default: 365)
+        rvr_threshold: Minimum RVR (default: 2.0)
+
+    Returns:
+        Threshold -> performance metrics
+    """
+    from config.assets import load_universe
+    from backtest.backtester import Backtester
+    from backtest.performance import calculate_performance_metrics
+
+    symbols = load_universe().get_trading_symbols()
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=backtest_days)
+
+    backtester = Backtester(
+        initial_capital=initial_capital,
+        risk_per_trade_pct=0.02,
+        stop_loss_pct=0.20,
+        max_positions=5
+    )
+    prepared = backtester.precompute(symbols, start_date, end_date)
+
+    results = {}
+    for threshold in thresholds:
+        result = backtester.simulate(prepared, threshold, rvr_threshold)
+        results[threshold] = calculate_performance_metrics(
+            result.trades,
+            result.equity_curve,
+            result.daily_returns,
+            initial_capital
+        )
+    return results
+
+
+def _run_sweep_job(thresholds: List[float], kwargs: Dict) -> Dict[float, Dict]:
+    """Worker for run_threshold_sweep (top-level so it pickles)."""
+    return run_threshold_sensitivity(thresholds, **kwargs)
+
+
+def run_threshold_sweep(
+    thresholds: List[float],
+    max_workers: Optional[int] = None,
+    **kwargs
+) -> Dict[float, Dict]:
+    """
+    Backtest each BBWidth threshold, spread over parallel processes.
+
+    Each run is an independent portfolio simulation, so the runs spread
+    across cores with no shared state. (Symbols within one run share
+    capital and the position limit, so they are not split up.) Each worker
+    takes a share of the thresholds and loads data and indicators once
+    for all of them (see run_threshold_sensitivity).
+
+    Args:
+        thresholds: BBWidth percentile thresholds to test
+        max_workers: Worker processes (default: os.cpu_count())
+        **kwargs: Passed to run_threshold_sensitivity (initial_capital,
+                  backtest_days, rvr_threshold)
+
+    Returns:
+        Threshold -> performance metrics
+    """
+    workers = min(max_workers or os.cpu_count() or 1, len(thresholds))
+    results = {}
+
+    # Spawn rather than fork: the parent has numba's (TBB) worker pool up
+    # after importing the indicators, and forking it can hang at exit
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context('spawn')
+    ) as executor:
+        futures = [
+            executor.submit(_run_sweep_job, thresholds[i::workers], kwargs)
+            for i in range(workers)
+        ]
+        for done, future in enumerate(as_completed(futures), 1):
+            results.update(future.result())
+            print(f"Sweep: {done}/{len(futures)} workers done ({len(results)}/{len(thresholds)} thresholds)")
+
+    return {threshold: results[threshold] for threshold in thresholds}
+
+
 if __name__ == "__main__":
     # Run backtest with different parameters
 
@@ -151,20 +237,21 @@ if __name__ == "__main__":
         rvr_threshold=2.0
     )
 
-    # You can run sensitivity analysis here
+    # You can run sensitivity analysis here (data and indicators are loaded
+    # once; run_threshold_sweep takes the same arguments and spreads the
+    # thresholds over worker processes)
     # print("\n\n" + "="*80)
     # print("SENSITIVITY ANALYSIS - BBWidth Threshold")
     # print("="*80)
     #
-    # for threshold in [0.20, 0.25, 0.30]:
-    #     print(f"\nTesting BBWidth threshold: {threshold*100:.0f}th percentile")
-    #     result, metrics = run_full_backtest(
-    #         initial_capital=10000,
-    #         backtest_days=365,
-    #         bbwidth_threshold=threshold,
-    #         rvr_threshold=2.0,
-    #         save_results=False
-    #     )
+    # sweep = run_threshold_sensitivity(
+    #     [0.20, 0.25, 0.30],
+    #     initial_capital=10000,
+    #     backtest_days=365,
+    #     rvr_threshold=2.0
+    # )
+    # for threshold, metrics in sweep.items():
+    #     print(f"\nBBWidth threshold: {threshold*100:.0f}th percentile")
     #     print(f"Total Return: {metrics.get('total_return_pct', 0):.2f}%")
     #     print(f"Win Rate: {metrics.get('win_rate', 0)*100:.2f}%")
     #     print(f"Sharpe: {metrics.get('sharpe_ratio', 0):.2f}")
@@ -13,14 +13,10 @@ Compare this to the static backtest to see the difference.
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
-import pandas as pd
 import json
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from backtest.realistic_backtester import RealisticBacktester
-from backtest.performance import calculate_performance_metrics, generate_performance_report
-
 
 def run_realistic_backtest(
     initial_capital: float = 10000,
@@ -35,7 +31,8 @@ def run_realistic_backtest(
     lookback_period: int = 90,  # Same as daily - 90 periods on 4h
     save_results: bool = True,
     use_static_universe: bool = False,
-    static_universe_file: str = "config/static_universe.json"
+    static_universe_file: str = "config/static_universe.json",
+    csv_copy: bool = False
 ):
     """
     Run realistic backtest with live API data.
@@ -48,8 +45,15 @@ def run_realistic_backtest(
         universe_update_days: Days between universe updates
         bbwidth_threshold: BBWidth percentile threshold
         rvr_threshold: Minimum RVR
-        save_results: Save results to CSV
+        save_results: Save results (Parquet, or CSV without pyarrow)
+        csv_copy: Also write CSV copies of the results in the background
     """
+    # Imported here so importing this module stays cheap until a backtest runs
+    from backtest.realistic_backtester import RealisticBacktester
+    from backtest.backtester import trades_to_frame
+    from backtest.performance import calculate_performance_metrics, generate_performance_report
+    from backtest.results_io import save_results_table, save_metrics
+
     print("="*80)
     print("REALISTIC BACKTEST - Using Live Bybit API")
     print("="*80)
@@ -145,7 +149,7 @@ def run_realistic_backtest(
 
     # Analyze universe-related exits
     if len(result.trades) > 0:
-        universe_exits = sum(1 for t in result.trades if t.exit_reason == 'removed_from_universe')
+        universe_exits = metrics['exit_reasons'].get('removed_from_universe', 0)
         if universe_exits > 0:
             print(f"\nTrades exited due to universe removal: {universe_exits} "
                   f"({universe_exits/len(result.trades)*100:.1f}%)")
@@ -155,32 +159,16 @@ def run_realistic_backtest(
         print("\nSaving results...")
 
         # Save trades
-        trades_data = []
-        for trade in result.trades:
-            trades_data.append({
-                'symbol': trade.symbol,
-                'entry_date': trade.entry_date,
-                'entry_price': trade.entry_price,
-                'exit_date': trade.exit_date,
-                'exit_price': trade.exit_price,
-                'position_size_usd': trade.position_size_usd,
-                'return_pct': trade.return_pct,
-                'return_usd': trade.return_usd,
-                'holding_days': trade.holding_days,
-                'exit_reason': trade.exit_reason,
-                'peak_price': trade.peak_price,
-                'max_adverse_excursion': trade.max_adverse_excursion
-            })
-
-        trades_df = pd.DataFrame(trades_data)
-        trades_file = Path(__file__).parent / 'results' / 'realistic_backtest_trades.csv'
-        trades_file.parent.mkdir(exist_ok=True)
-        trades_df.to_csv(trades_file, index=False)
+        results_dir = Path(__file__).parent / 'results'
+        trades_file = save_results_table(
+            trades_to_frame(result.trades), results_dir / 'realistic_backtest_trades', csv_copy
+        )
         print(f"  Saved trades to: {trades_file}")
 
         # Save equity curve
-        equity_file = Path(__file__).parent / 'results' / 'realistic_equity_curve.csv'
-        result.equity_curve.to_csv(equity_file, index=False)
+        equity_file = save_results_table(
+            result.equity_curve, results_dir / 'realistic_equity_curve', csv_copy
+        )
         print(f"  Saved equity curve to: {equity_file}")
 
         # Save metrics with comparison flag
@@ -188,9 +176,7 @@ def run_realistic_backtest(
         metrics['universe_dynamic'] = True
         metrics['data_source'] = 'bybit_api'
 
-        metrics_df = pd.DataFrame([metrics])
-        metrics_file = Path(__file__).parent / 'results' / 'realistic_performance_metrics.csv'
-        metrics_df.to_csv(metrics_file, index=False)
+        metrics_file = save_metrics(metrics, results_dir / 'realistic_performance_metrics')
         print(f"  Saved metrics to: {metrics_file}")
 
     print(f"\n{'='*80}")
@@ -204,54 +190,51 @@ def compare_with_static_backtest():
     """
     Compare realistic backtest with static backtest results.
     """
-    realistic_file = Path(__file__).parent / 'results' / 'realistic_performance_metrics.csv'
-    static_file = Path(__file__).parent / 'results' / 'performance_metrics.csv'
+    from backtest.results_io import load_metrics
 
-    if not realistic_file.exists() or not static_file.exists():
+    results_dir = Path(__file__).parent / 'results'
+    realistic = load_metrics(results_dir / 'realistic_performance_metrics')
+    static = load_metrics(results_dir / 'performance_metrics')
+
+    if realistic is None or static is None:
         print("Run both backtests first to compare")
         return
 
-    realistic = pd.read_csv(realistic_file)
-    static = pd.read_csv(static_file)
-
     print("\n" + "="*80)
     print("BACKTEST COMPARISON: Realistic API vs Static Warehouse")
     print("="*80 + "\n")
 
-    comparison = pd.DataFrame({
-        'Metric': [
-            'Total Trades',
-            'Win Rate',
-            'Total Return',
-            'Avg Win',
-            'Avg Loss',
-            'Profit Factor',
-            'Max Drawdown',
-            'Sharpe Ratio'
-        ],
-        'Static': [
-            static['total_trades'].iloc[0],
-            f"{static['win_rate'].iloc[0]*100:.1f}%",
-            f"{static.get('total_return_pct', [0]).iloc[0]:.2f}%",
-            f"{static['avg_win_pct'].iloc[0]*100:.1f}%",
-            f"{static['avg_loss_pct'].iloc[0]*100:.1f}%",
-            f"{static['profit_factor'].iloc[0]:.2f}",
-            f"{static.get('max_drawdown_pct', [0]).iloc[0]:.2f}%",
-            f"{static.get('sharpe_ratio', [0]).iloc[0]:.2f}"
-        ],
-        'Realistic API': [
-            realistic['total_trades'].iloc[0],
-            f"{realistic['win_rate'].iloc[0]*100:.1f}%",
-            f"{realistic.get('total_return_pct', [0]).iloc[0]:.2f}%",
-            f"{realistic['avg_win_pct'].iloc[0]*100:.1f}%",
-            f"{realistic['avg_loss_pct'].iloc[0]*100:.1f}%",
-            f"{realistic['profit_factor'].iloc[0]:.2f}",
-            f"{realistic.get('max_drawdown_pct', [0]).iloc[0]:.2f}%",
-            f"{realistic.get('sharpe_ratio', [0]).iloc[0]:.2f}"
+    def metric_values(m):
+        return [
+            str(m['total_trades']),
+            f"{m['win_rate']*100:.1f}%",
+            f"{m.get('total_return_pct', 0):.2f}%",
+            f"{m['avg_win_pct']*100:.1f}%",
+            f"{m['avg_loss_pct']*100:.1f}%",
+            f"{m['profit_factor']:.2f}",
+            f"{m.get('max_drawdown_pct', 0):.2f}%",
+            f"{m.get('sharpe_ratio', 0):.2f}"
         ]
-    })
 
-    print(comparison.to_string(index=False))
+    # An 8-row table is cheaper to format directly than through a DataFrame
+    labels = [
+        'Total Trades',
+        'Win Rate',
+        'Total Return',
+        'Avg Win',
+        'Avg Loss',
+        'Profit Factor',
+        'Max Drawdown',
+        'Sharpe Ratio'
+    ]
+    rows = [('Metric', 'Static', 'Realistic API')]
+    rows += zip(labels, metric_values(static), metric_values(realistic))
+    widths = [max(len(row[i]) for row in rows) for i in range(3)]
+
+    print("\n".join(
+        f"{metric:<{widths[0]}} {s:>{widths[1]}} {r:>{widths[2]}}"
+        for metric, s, r in rows
+    ))
     print(f"\n{'='*80}\n")
 
 
@@ -6,23 +6,23 @@ Just tests if your API credentials work.
 """
 
 import os
+import re
 import sys
 from pathlib import Path
 
+# KEY=VALUE lines (LF or CRLF); comment lines never match since '#' can't
+# start a key
+ENV_LINE_RE = re.compile(r'^[ \t]*([A-Za-z_]\w*)[ \t]*=[ \t]*(.*?)[ \t\r]*$', re.M)
+
 # Load .env manually
 def load_env():
     env_path = Path(__file__).parent / '.env'
     if env_path.exists():
-        with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip().strip('"').strip("'")
-                    os.environ[key] = value
+        text = env_path.read_text()
+        os.environ.update(
+            (key, value.strip('"').strip("'"))
+            for key, value in ENV_LINE_RE.findall(text)
+        )
 
 load_env()
 
@@ -50,149 +50,165 @@ import time
 import hmac
 import hashlib
 import json
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+
+# One keep-alive session for all tests, so the TLS handshake is paid once
+# per pooled connection instead of once per request
+session = requests.Session()
+session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+# HMAC keyed with the secret once; each signature copies it instead of
+# recomputing the key pads
+_HMAC_TEMPLATE = hmac.new(api_secret.encode('utf-8'), b'', hashlib.sha256)
 
 def generate_signature(params_str, timestamp):
     """Generate HMAC SHA256 signature."""
     recv_window = 5000
     param_str = str(timestamp) + api_key + str(recv_window) + params_str
-    return hmac.new(
-        api_secret.encode('utf-8'),
-        param_str.encode('utf-8'),
-        hashlib.sha256
-    ).hexdigest()
+    h = _HMAC_TEMPLATE.copy()
+    h.update(param_str.encode('utf-8'))
+    return h.hexdigest()
 
-# Test 1: Public endpoint (no auth)
-print("\n1. Testing public endpoint...")
-try:
-    response = requests.get(f"{base_url}/v5/market/tickers?category=linear&symbol=BTCUSDT", timeout=10)
-    if response.status_code == 200:
-        data = response.json()
-        if data.get('retCode') == 0:
-            ticker = data['result']['list'][0]
-            price = float(ticker['lastPrice'])
-            print(f"   ✓ BTC Price: ${price:,.2f}")
-        else:
-            print(f"   ✗ API Error: {data.get('retMsg')}")
-    else:
-        print(f"   ✗ HTTP Error: {response.status_code}")
-except Exception as e:
-    print(f"   ✗ Failed: {e}")
-
-# Test 2: Private endpoint (with auth)
-print("\n2. Testing private endpoint (account balance)...")
-try:
+def signed_headers(params):
+    """Build the auth headers for a signed GET with the given query string."""
     timestamp = int(time.time() * 1000)
-    params = "accountType=UNIFIED"
-
-    signature = generate_signature(params, timestamp)
-
-    headers = {
+    return {
         "X-BAPI-API-KEY": api_key,
-        "X-BAPI-SIGN": signature,
+        "X-BAPI-SIGN": generate_signature(params, timestamp),
         "X-BAPI-SIGN-TYPE": "2",
         "X-BAPI-TIMESTAMP": str(timestamp),
         "X-BAPI-RECV-WINDOW": "5000",
         "Content-Type": "application/json"
     }
 
-    response = requests.get(
-        f"{base_url}/v5/account/wallet-balance?{params}",
-        headers=headers,
-        timeout=10
-    )
-
-    if response.status_code == 200:
-        data = response.json()
-        if data.get('retCode') == 0:
-            print("   ✓ Authentication successful")
-
-            # Try to parse balance
-            result = data.get('result', {})
-            if 'list' in result and len(result['list']) > 0:
-                account = result['list'][0]
-                print(f"   ✓ Account Type: {account.get('accountType', 'Unknown')}")
-
-                if 'coin' in account:
-                    for coin in account['coin']:
-                        if coin['coin'] == 'USDT':
-                            equity_str = coin.get('equity', '0')
-                            available_str = coin.get('availableToWithdraw', '0')
-
-                            equity = float(equity_str) if equity_str and equity_str != '' else 0.0
-                            available = float(available_str) if available_str and available_str != '' else 0.0
-
-                            print(f"   ✓ USDT Equity: ${equity:,.2f}")
-                            print(f"   ✓ USDT Available: ${available:,.2f}")
-
-                            if equity == 0.0:
-                                print("   ⚠️  Balance is $0.00 - Account is empty")
-                                print("      This is normal for a new demo account")
-                            break
+# The tests run concurrently on the shared session; each collects its
+# output lines so the report still prints in order
+
+
+# Test 1: Public endpoint (no auth)
+def test_public():
+    out = ["\n1. Testing public endpoint..."]
+    try:
+        response = session.get(f"{base_url}/v5/market/tickers?category=linear&symbol=BTCUSDT", timeout=10)
+        if response.status_code == 200:
+            data = response.json()
+            if data.get('retCode') == 0:
+                ticker = data['result']['list'][0]
+                price = float(ticker['lastPrice'])
+                out.append(f"   ✓ BTC Price: ${price:,.2f}")
             else:
-                print("   ⚠️  No account data in response")
+                out.append(f"   ✗ API Error: {data.get('retMsg')}")
         else:
-            print(f"   ✗ API Error: {data.get('retMsg')}")
-            print(f"      Code: {data.get('retCode')}")
-    else:
-        print(f"   ✗ HTTP Error: {response.status_code}")
-        print(f"      Response: {response.text[:200]}")
+            out.append(f"   ✗ HTTP Error: {response.status_code}")
+    except Exception as e:
+        out.append(f"   ✗ Failed: {e}")
+    return out
 
-except Exception as e:
-    print(f"   ✗ Failed: {e}")
-    import traceback
-    traceback.print_exc()
 
-# Test 3: Position query
-print("\n3. Testing position query...")
-try:
-    timestamp = int(time.time() * 1000)
-    params = "category=linear&settleCoin=USDT"
+# Test 2: Private endpoint (with auth)
+def test_balance():
+    out = ["\n2. Testing private endpoint (account balance)..."]
+    try:
+        params = "accountType=UNIFIED"
+
+        response = session.get(
+            f"{base_url}/v5/account/wallet-balance?{params}",
+            headers=signed_headers(params),
+            timeout=10
+        )
+
+        if response.status_code == 200:
+            data = response.json()
+            if data.get('retCode') == 0:
+                out.append("   ✓ Authentication successful")
+
+                # Try to parse balance
+                result = data.get('result', {})
+                if 'list' in result and len(result['list']) > 0:
+                    account = result['list'][0]
+                    out.append(f"   ✓ Account Type: {account.get('accountType', 'Unknown')}")
+
+                    if 'coin' in account:
+                        for coin in account['coin']:
+                            if coin['coin'] == 'USDT':
+                                equity_str = coin.get('equity', '0')
+                                available_str = coin.get('availableToWithdraw', '0')
+
+                                equity = float(equity_str) if equity_str and equity_str != '' else 0.0
+                                available = float(available_str) if available_str and available_str != '' else 0.0
+
+                                out.append(f"   ✓ USDT Equity: ${equity:,.2f}")
+                                out.append(f"   ✓ USDT Available: ${available:,.2f}")
+
+                                if equity == 0.0:
+                                    out.append("   ⚠️  Balance is $0.00 - Account is empty")
+                                    out.append("      This is normal for a new demo account")
+                                break
+                else:
+                    out.append("   ⚠️  No account data in response")
+            else:
+                out.append(f"   ✗ API Error: {data.get('retMsg')}")
+                out.append(f"      Code: {data.get('retCode')}")
+        else:
+            out.append(f"   ✗ HTTP Error: {response.status_code}")
+            out.append(f"      Response: {response.text[:200]}")
 
-    signature = generate_signature(params, timestamp)
+    except Exception as e:
+        out.append(f"   ✗ Failed: {e}")
+        import traceback
+        out.append(traceback.format_exc())
+    return out
 
-    headers = {
-        "X-BAPI-API-KEY": api_key,
-        "X-BAPI-SIGN": signature,
-        "X-BAPI-SIGN-TYPE": "2",
-        "X-BAPI-TIMESTAMP": str(timestamp),
-        "X-BAPI-RECV-WINDOW": "5000",
-        "Content-Type": "application/json"
-    }
 
-    response = requests.get(
-        f"{base_url}/v5/position/list?{params}",
-        headers=headers,
-        timeout=10
-    )
-
-    if response.status_code == 200:
-        data = response.json()
-        if data.get('retCode') == 0:
-            positions = data['result']['list']
-            open_positions = [p for p in positions if float(p.get('size', 0)) > 0]
-
-            print(f"   ✓ Open Positions: {len(open_positions)}")
-
-            if open_positions:
-                print("   Position Details:")
-                for pos in open_positions:
-                    symbol = pos.get('symbol')
-                    size = float(pos.get('size', 0))
-                    side = pos.get('side')
-                    avg_price = float(pos.get('avgPrice', 0))
-                    unrealized_pnl = float(pos.get('unrealisedPnl', 0))
-
-                    print(f"      • {symbol}: {side} {size} @ ${avg_price:,.2f}")
-                    print(f"        Unrealized P&L: ${unrealized_pnl:+,.2f}")
+# Test 3: Position query
+def test_positions():
+    out = ["\n3. Testing position query..."]
+    try:
+        params = "category=linear&settleCoin=USDT"
+
+        response = session.get(
+            f"{base_url}/v5/position/list?{params}",
+            headers=signed_headers(params),
+            timeout=10
+        )
+
+        if response.status_code == 200:
+            data = response.json()
+            if data.get('retCode') == 0:
+                positions = data['result']['list']
+                open_positions = [p for p in positions if float(p.get('size', 0)) > 0]
+
+                out.append(f"   ✓ Open Positions: {len(open_positions)}")
+
+                if open_positions:
+                    out.append("   Position Details:")
+                    for pos in open_positions:
+                        symbol = pos.get('symbol')
+                        size = float(pos.get('size', 0))
+                        side = pos.get('side')
+                        avg_price = float(pos.get('avgPrice', 0))
+                        unrealized_pnl = float(pos.get('unrealisedPnl', 0))
+
+                        out.append(f"      • {symbol}: {side} {size} @ ${avg_price:,.2f}")
+                        out.append(f"        Unrealized P&L: ${unrealized_pnl:+,.2f}")
+                else:
+                    out.append("   ℹ️  No open positions")
             else:
-                print("   ℹ️  No open positions")
+                out.append(f"   ✗ API Error: {data.get('retMsg')}")
         else:
-            print(f"   ✗ API Error: {data.get('retMsg')}")
-    else:
-        print(f"   ✗ HTTP Error: {response.status_code}")
+            out.append(f"   ✗ HTTP Error: {response.status_code}")
+
+    except Exception as e:
+        out.append(f"   ✗ Failed: {e}")
+    return out
+
 
-except Exception as e:
-    print(f"   ✗ Failed: {e}")
+tests = [test_public, test_balance, test_positions]
+with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+    futures = [executor.submit(test) for test in tests]
+    for future in futures:
+        print("\n".join(future.result()))
 
 print("\n" + "="*80)
 print("✓ ALL TESTS COMPLETE")
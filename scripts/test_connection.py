@@ -15,11 +15,13 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from config.trading_config import config
-from exchange.bybit_exchange import BybitExchange
-
 
 def main():
+    # Imported here so importing this module doesn't load the config
+    # (and .env) or the exchange client
+    from config.trading_config import config
+    from exchange.bybit_exchange import BybitExchange
+
     print("\n" + "="*80)
     print("EXCHANGE CONNECTION TEST")
     print("="*80)
@@ -52,11 +52,11 @@ def check_btc_regime(
     result = btc_data.copy()
 
     # 1. Calculate 50-period MA
-    result = calculate_sma(result, period=ma_period)
+    calculate_sma(result, period=ma_period, inplace=True)
     result[f'ma_{ma_period}'] = result[f'sma_{ma_period}']
 
     # 2. Calculate ADX
-    result = calculate_adx(result, period=adx_period)
+    calculate_adx(result, period=adx_period, inplace=True)
 
     # 3. Calculate rolling highs
     result['rolling_high_20'] = result['high'].rolling(lookback_high_period).max()
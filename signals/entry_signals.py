@@ -118,33 +118,56 @@ def check_entry_signal(
     return all_met, signal_details
 
 
-def generate_entry_signals(
+def calculate_entry_indicators(
     df: pd.DataFrame,
-    bbwidth_threshold: float = 0.25,
-    rvr_threshold: float = 2.0,
     ma_period: int = 20,
     lookback_period: int = 90
 ) -> pd.DataFrame:
     """
-    Generate entry signals for entire DataFrame.
+    Calculate the indicators the entry criteria are checked against.
+
+    None of them depend on the BBWidth or RVR thresholds, so a parameter
+    sweep can calculate them once and call apply_entry_signals per threshold.
 
     Args:
         df: DataFrame with OHLCV data
+        ma_period: Period for trend MA (default: 20)
+        lookback_period: Lookback for BBWidth percentile (default: 90)
+
+    Returns:
+        Copy of df with BBWidth percentile, band position, RVR and MA columns
+    """
+    # One copy of df, then in place
+    result = calculate_bbwidth_percentile(df, lookback_period=lookback_period)
+    get_bb_position(result, inplace=True)
+    calculate_relative_volume_ratio(result, inplace=True)
+    check_price_above_ma(result, ma_period, inplace=True)
+    return result
+
+
+def apply_entry_signals(
+    df: pd.DataFrame,
+    bbwidth_threshold: float = 0.25,
+    rvr_threshold: float = 2.0,
+    ma_period: int = 20,
+    lookback_period: int = 90,
+    inplace: bool = False
+) -> pd.DataFrame:
+    """
+    Evaluate the entry criteria on a frame from calculate_entry_indicators.
+
+    Args:
+        df: DataFrame from calculate_entry_indicators
         bbwidth_threshold: BBWidth percentile threshold (default: 0.25)
         rvr_threshold: Minimum RVR (default: 2.0)
         ma_period: Period for trend MA (default: 20)
         lookback_period: Lookback for BBWidth percentile (default: 90)
+        inplace: Add columns to df itself instead of a copy (default: False)
 
     Returns:
-        DataFrame with added columns:
-        - entry_signal: Boolean, True on entry days
-        - signal_strength: Float (0-1)
+        DataFrame with added entry_signal and signal_strength columns
     """
-    # Calculate all required indicators
-    result = calculate_bbwidth_percentile(df, lookback_period=lookback_period)
-    result = get_bb_position(result)
-    result = calculate_relative_volume_ratio(result)
-    result = check_price_above_ma(result, ma_period)
+    result = df if inplace else df.copy()
 
     # Check each row for entry signal
     signals = []
@@ -169,6 +192,35 @@ def generate_entry_signals(
     return result
 
 
+def generate_entry_signals(
+    df: pd.DataFrame,
+    bbwidth_threshold: float = 0.25,
+    rvr_threshold: float = 2.0,
+    ma_period: int = 20,
+    lookback_period: int = 90
+) -> pd.DataFrame:
+    """
+    Generate entry signals for entire DataFrame.
+
+    Args:
+        df: DataFrame with OHLCV data
+        bbwidth_threshold: BBWidth percentile threshold (default: 0.25)
+        rvr_threshold: Minimum RVR (default: 2.0)
+        ma_period: Period for trend MA (default: 20)
+        lookback_period: Lookback for BBWidth percentile (default: 90)
+
+    Returns:
+        DataFrame with added columns:
+        - entry_signal: Boolean, True on entry days
+        - signal_strength: Float (0-1)
+    """
+    result = calculate_entry_indicators(df, ma_period, lookback_period)
+    return apply_entry_signals(
+        result, bbwidth_threshold, rvr_threshold, ma_period, lookback_period,
+        inplace=True
+    )
+
+
 if __name__ == "__main__":
     # Test entry signal logic
     from data.data_loader import load_historical_ohlcv
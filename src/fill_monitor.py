@@ -18,6 +18,36 @@ from typing import Dict, Set, Optional
 from shared.alpha_db_client import AlphaDBClient
 from ..integration.alpha_integration import get_integration
 
+# The two polling queries are prepared once per PostgreSQL session and run
+# with EXECUTE, so each poll skips parsing and planning
+_PREPARED_QUERIES = {
+    'fill_monitor_new_sells': """
+        PREPARE fill_monitor_new_sells (text, bigint, text[]) AS
+        SELECT
+            id,
+            symbol,
+            exec_price,
+            exec_qty,
+            exec_time,
+            close_reason,
+            commission
+        FROM trading.fills
+        WHERE bot_id IN ($1, 'unknown')
+          AND side = 'Sell'
+          AND id > $2
+          AND symbol = ANY($3)
+        ORDER BY id ASC
+    """,
+    'fill_monitor_remaining_qty': """
+        PREPARE fill_monitor_remaining_qty (text, text) AS
+        SELECT SUM(remaining_qty) as total_remaining
+        FROM trading.position_entries
+        WHERE bot_id = $1
+          AND symbol = $2
+          AND status != 'closed'
+    """,
+}
+
 
 class FillMonitor:
     """Monitors database for SELL fills and triggers trade closure tracking"""
@@ -27,18 +57,26 @@ class FillMonitor:
         self.bot_id = bot_id
         self.redis_db = redis_db
 
-        # Database client
-        self.db_client = AlphaDBClient(bot_id=bot_id, redis_db=redis_db)
-
         # Alpha integration for logging closes
         self.alpha_integration = get_integration(bot_id=bot_id)
 
+        # Database client: only PostgreSQL is queried here, so share the
+        # integration's client rather than opening a second set of
+        # connections per process
+        if self.alpha_integration.is_connected():
+            self.db_client = self.alpha_integration.db_client
+        else:
+            self.db_client = AlphaDBClient(bot_id=bot_id, redis_db=redis_db)
+
         # Track last processed fill ID to avoid duplicates
         self.last_processed_fill_id = 0
 
         # Cache of active position symbols
         self.tracked_symbols: Set[str] = set()
 
+        # Whether _PREPARED_QUERIES exist on the current connection
+        self._queries_prepared = False
+
         print(f"✅ Fill monitor initialized for {bot_id}")
 
     def update_tracked_symbols(self):
@@ -54,6 +92,40 @@ class FillMonitor:
         for (symbol, rule_id) in breakeven_trades.keys():
             self.tracked_symbols.add(symbol)
 
+    def _prepare_queries(self):
+        """
+        Prepare the polling queries on the PostgreSQL session.
+
+        The connection may be shared with the alpha integration (and may
+        have been prepared by an earlier monitor), so existing statements
+        are left alone.
+        """
+        with self.db_client.pg_conn.cursor() as cur:
+            cur.execute(
+                "SELECT name FROM pg_prepared_statements WHERE name = ANY(%s)",
+                (list(_PREPARED_QUERIES),)
+            )
+            existing = {row[0] for row in cur.fetchall()}
+            for name, sql in _PREPARED_QUERIES.items():
+                if name not in existing:
+                    cur.execute(sql)
+        self._queries_prepared = True
+
+    def _execute_prepared(self, name: str, params: tuple) -> list:
+        """Run a prepared polling query, preparing it first if needed."""
+        if not self._queries_prepared:
+            self._prepare_queries()
+        placeholders = ", ".join(["%s"] * len(params))
+        try:
+            with self.db_client.pg_conn.cursor() as cur:
+                cur.execute(f"EXECUTE {name} ({placeholders})", params)
+                return cur.fetchall()
+        except Exception:
+            # e.g. reconnected session without the statements - re-prepare
+            # on the next poll
+            self._queries_prepared = False
+            raise
+
     async def start_monitoring(self):
         """Main monitoring loop - polls for new SELL fills"""
         print("🔍 Starting fill monitor...")
@@ -100,25 +172,10 @@ class FillMonitor:
 
             # Query for new SELL fills for tracked symbols
             # Note: WebSocket listener writes fills with bot_id='unknown', so we need to check both
-            with self.db_client.pg_conn.cursor() as cur:
-                cur.execute("""
-                    SELECT
-                        id,
-                        symbol,
-                        exec_price,
-                        exec_qty,
-                        exec_time,
-                        close_reason,
-                        commission
-                    FROM trading.fills
-                    WHERE bot_id IN (%s, 'unknown')
-                      AND side = 'Sell'
-                      AND id > %s
-                      AND symbol = ANY(%s)
-                    ORDER BY id ASC
-                """, (self.bot_id, self.last_processed_fill_id, list(self.tracked_symbols)))
-
-                new_fills = cur.fetchall()
+            new_fills = self._execute_prepared(
+                'fill_monitor_new_sells',
+                (self.bot_id, self.last_processed_fill_id, list(self.tracked_symbols))
+            )
 
             # Process each new SELL fill
             for fill in new_fills:
@@ -188,16 +245,10 @@ class FillMonitor:
                 print(f"✅ Trade closure logged: {symbol} ({rule_id}) | Fill ID: {fill_id}")
 
                 # Check if position is fully closed
-                with self.db_client.pg_conn.cursor() as cur:
-                    cur.execute("""
-                        SELECT SUM(remaining_qty) as total_remaining
-                        FROM trading.position_entries
-                        WHERE bot_id = %s
-                          AND symbol = %s
-                          AND status != 'closed'
-                    """, (self.bot_id, symbol))
-                    result = cur.fetchone()
-                    remaining_qty = float(result[0]) if result[0] else 0.0
+                result = self._execute_prepared(
+                    'fill_monitor_remaining_qty', (self.bot_id, symbol)
+                )[0]
+                remaining_qty = float(result[0]) if result[0] else 0.0
 
                 if remaining_qty == 0:
                     # Position fully closed - remove from bot tracking
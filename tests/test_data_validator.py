@@ -14,7 +14,8 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from data.data_validator import (
     validate_data_quality,
-    check_data_coverage
+    check_data_coverage,
+    format_issue
 )
 from data.data_loader import load_historical_ohlcv
 
@@ -118,6 +119,29 @@ class TestDataValidator(unittest.TestCase):
         # Should have warnings about zero volume
         self.assertTrue(len(validation['warnings']) > 0 or len(validation['errors']) > 0)
 
+    def test_validate_data_quality_timestamp_gaps(self):
+        """Test detection of large timestamp gaps on unsorted data."""
+        timestamps = list(pd.date_range('2024-01-01', periods=5, freq='D'))
+        timestamps[4] = pd.Timestamp('2024-01-20')  # 16-day gap
+        df = pd.DataFrame({
+            'timestamp': timestamps[::-1],
+            'open': [100, 101, 102, 103, 104],
+            'high': [102, 103, 104, 105, 106],
+            'low': [99, 100, 101, 102, 103],
+            'close': [101, 102, 103, 104, 105],
+            'volume': [1000] * 5,
+            'turnover': [100000] * 5
+        })
+
+        validation = validate_data_quality(df, 'TEST')
+
+        self.assertTrue(validation['passed'])
+        self.assertIn(('TIME_GAPS', 1), validation['warnings'])
+        self.assertEqual(
+            format_issue(('TIME_GAPS', 1)),
+            "Found 1 large time gaps (>3 days)"
+        )
+
     def test_check_data_coverage_sufficient(self):
         """Test coverage check for symbol with sufficient data."""
         coverage = check_data_coverage(self.test_symbol, required_days=90)
@@ -3,11 +3,13 @@ Unit tests for technical indicators.
 """
 
 import unittest
+import importlib.util
 import pandas as pd
 import numpy as np
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
+from unittest import mock
 
 sys.path.append(str(Path(__file__).parent.parent))
 
@@ -24,10 +26,14 @@ from indicators.volume import (
 )
 from indicators.moving_averages import (
     calculate_sma,
+    calculate_sma_batch,
     calculate_multiple_smas,
     check_price_above_ma,
     get_ma_regime
 )
+from indicators.adx import calculate_adx
+from indicators.online import OnlineSMA, OnlineBBands, OnlineADX, OnlineRVR
+from indicators.batch import compute_all
 from data.data_loader import load_historical_ohlcv
 
 
@@ -57,6 +63,28 @@ class TestBollingerBands(unittest.TestCase):
         valid_rows = result.dropna()
         self.assertTrue((valid_rows['bb_upper'] > valid_rows['bb_lower']).all())
 
+    def test_calculate_bollinger_bands_matches_pandas_rolling(self):
+        """Test fused band kernel against pandas rolling mean/std."""
+        result = calculate_bbwidth(self.df)
+
+        middle = self.df['close'].rolling(window=20).mean()
+        std = self.df['close'].rolling(window=20).std()
+        np.testing.assert_allclose(result['bb_middle'], middle, rtol=1e-9)
+        np.testing.assert_allclose(result['bb_upper'], middle + 2 * std, rtol=1e-9)
+        np.testing.assert_allclose(result['bbwidth'], 4 * std / middle, rtol=1e-7)
+
+    def test_bollinger_bands_cache_tracks_last_bar(self):
+        """Test cached bands are recomputed when the open candle changes."""
+        first = calculate_bollinger_bands(self.df)
+        self.assertIsNot(first, calculate_bollinger_bands(self.df))
+
+        df = self.df.copy()
+        df.loc[99, 'close'] += 5
+        updated = calculate_bollinger_bands(df)
+        expected = df['close'].rolling(window=20).mean()
+        self.assertNotEqual(first['bb_middle'].iloc[-1], updated['bb_middle'].iloc[-1])
+        np.testing.assert_allclose(updated['bb_middle'], expected, rtol=1e-12)
+
     def test_calculate_bbwidth(self):
         """Test BBWidth calculation."""
         result = calculate_bbwidth(self.df)
@@ -131,6 +159,15 @@ class TestVolumeIndicators(unittest.TestCase):
         self.assertTrue((valid_rows['volume_percentile'] >= 0).all())
         self.assertTrue((valid_rows['volume_percentile'] <= 1).all())
 
+    def test_calculate_volume_percentile_matches_rolling_rank(self):
+        """Test percentile kernel against a pandas rolling-apply rank."""
+        result = calculate_volume_percentile(self.df, lookback_period=50)
+
+        expected = self.df['volume'].rolling(window=50).apply(
+            lambda w: (w < w[-1]).sum() / (len(w) - 1), raw=True
+        )
+        np.testing.assert_allclose(result['volume_percentile'], expected)
+
 
 class TestMovingAverages(unittest.TestCase):
     """Test moving average indicators."""
@@ -153,6 +190,42 @@ class TestMovingAverages(unittest.TestCase):
         valid_rows = result.dropna()
         self.assertTrue((valid_rows['sma_20'] > 0).all())
 
+    def test_calculate_sma_matches_pandas_rolling(self):
+        """Test SMA kernel against pandas rolling mean, including NaN gaps."""
+        df = self.df.copy()
+        df.loc[30, 'close'] = np.nan
+        result = calculate_sma(df, period=20)
+
+        expected = df['close'].rolling(window=20).mean()
+        np.testing.assert_allclose(result['sma_20'], expected, rtol=1e-12)
+
+    def test_calculate_sma_float32(self):
+        """Test float32 opt-in stays within single precision of float64."""
+        result = calculate_sma(self.df, period=20, dtype=np.float32)
+
+        self.assertEqual(result['sma_20'].dtype, np.float32)
+        expected = calculate_sma(self.df, period=20)['sma_20']
+        np.testing.assert_allclose(result['sma_20'], expected, rtol=1e-6)
+
+    def test_calculate_sma_batch(self):
+        """Test batch SMA over a symbols x bars matrix matches per-symbol SMA."""
+        prices = np.vstack([self.df['close'].to_numpy(), self.df['close'].to_numpy()[::-1]])
+        result = calculate_sma_batch(prices, 20)
+
+        self.assertEqual(result.shape, prices.shape)
+        for row, closes in zip(result, prices):
+            expected = calculate_sma(pd.DataFrame({'close': closes}), period=20)['sma_20']
+            np.testing.assert_allclose(row, expected, rtol=1e-12)
+
+    def test_compute_all_matches_serial(self):
+        """Test threaded fan-out returns the same frames, keyed and ordered by symbol."""
+        frames = {'AAA': self.df, 'BBB': self.df.iloc[::-1].reset_index(drop=True)}
+        result = compute_all(frames, calculate_sma, max_workers=2, period=20)
+
+        self.assertEqual(list(result), ['AAA', 'BBB'])
+        for symbol, df in frames.items():
+            pd.testing.assert_frame_equal(result[symbol], calculate_sma(df, period=20))
+
     def test_calculate_multiple_smas(self):
         """Test multiple SMA calculation."""
         result = calculate_multiple_smas(self.df, periods=[20, 50])
@@ -160,6 +233,18 @@ class TestMovingAverages(unittest.TestCase):
         self.assertIn('sma_20', result.columns)
         self.assertIn('sma_50', result.columns)
 
+    def test_calculate_sma_inplace(self):
+        """Test inplace flag mutates the input frame instead of copying."""
+        result = calculate_sma(self.df, period=20)
+        self.assertNotIn('sma_20', self.df.columns)
+        self.assertIsNot(result, self.df)
+
+        df = self.df.copy()
+        result = calculate_multiple_smas(df, periods=[20, 50], inplace=True)
+        self.assertIs(result, df)
+        self.assertIn('sma_20', df.columns)
+        self.assertIn('sma_50', df.columns)
+
     def test_check_price_above_ma(self):
         """Test price above MA check."""
         result = check_price_above_ma(self.df, ma_period=20)
@@ -183,6 +268,124 @@ class TestMovingAverages(unittest.TestCase):
         self.assertTrue((valid_rows['regime_uptrend'] != valid_rows['regime_downtrend']).all())
 
 
+class TestADX(unittest.TestCase):
+    """Test ADX calculation."""
+
+    def setUp(self):
+        """Create test data."""
+        rng = np.random.default_rng(11)
+        close = 100 + np.cumsum(rng.normal(0, 1, 200))
+        self.df = pd.DataFrame({
+            'high': close + rng.random(200),
+            'low': close - rng.random(200),
+            'close': close
+        })
+        self.df.loc[50, 'high'] = np.nan
+
+    def test_calculate_adx_matches_pandas_ewm(self):
+        """Test the recursive ADX kernel against pandas ewm(adjust=False) smoothing."""
+        result = calculate_adx(self.df, period=14)
+
+        high, low, close = self.df['high'], self.df['low'], self.df['close']
+        prev_close = close.shift(1)
+        tr = pd.concat([high - low, (high - prev_close).abs(), (low - prev_close).abs()], axis=1).max(axis=1)
+        up_move = high - high.shift(1)
+        down_move = low.shift(1) - low
+        plus_dm = pd.Series(np.where((up_move > down_move) & (up_move > 0), up_move, 0.0))
+        minus_dm = pd.Series(np.where((down_move > up_move) & (down_move > 0), down_move, 0.0))
+
+        atr = tr.ewm(alpha=1 / 14, adjust=False).mean()
+        plus_di = 100 * plus_dm.ewm(alpha=1 / 14, adjust=False).mean() / atr
+        minus_di = 100 * minus_dm.ewm(alpha=1 / 14, adjust=False).mean() / atr
+        dx = 100 * (plus_di - minus_di).abs() / (plus_di + minus_di)
+        adx = dx.ewm(alpha=1 / 14, adjust=False).mean()
+
+        np.testing.assert_allclose(result['plus_di'], plus_di, rtol=1e-10)
+        np.testing.assert_allclose(result['minus_di'], minus_di, rtol=1e-10)
+        np.testing.assert_allclose(result['adx'], adx, rtol=1e-10)
+
+
+class TestBottleneckKernels(unittest.TestCase):
+    """Test the bottleneck tier used when numba is not installed."""
+
+    def setUp(self):
+        """Load a copy of the kernels module with numba unavailable."""
+        path = Path(__file__).parent.parent / 'indicators' / '_kernels.py'
+        spec = importlib.util.spec_from_file_location('_kernels_no_numba', path)
+        self.kernels = importlib.util.module_from_spec(spec)
+        with mock.patch.dict(sys.modules, {'numba': None}):
+            spec.loader.exec_module(self.kernels)
+
+        if not self.kernels.BOTTLENECK_AVAILABLE:
+            self.skipTest("bottleneck not installed")
+        self.assertFalse(self.kernels.NUMBA_AVAILABLE)
+
+    def test_series_shorter_than_window(self):
+        """Test a series shorter than the window gives NaN instead of raising."""
+        values = np.array([1.0, 2.0, 3.0])
+
+        result = self.kernels.sliding_mean(values, 20, 20)
+        expected = pd.Series(values).rolling(20).mean().to_numpy()
+        np.testing.assert_array_equal(result, expected)
+
+        # min_periods below the series length still yields values, as pandas
+        result = self.kernels.sliding_mean(values, 20, 2)
+        expected = pd.Series(values).rolling(20, min_periods=2).mean().to_numpy()
+        np.testing.assert_allclose(result, expected)
+
+        for band in self.kernels.bbands(values, 20, 2.0):
+            self.assertEqual(len(band), 3)
+            self.assertTrue(np.isnan(band).all())
+
+        rows = self.kernels.sliding_mean_rows(np.vstack([values, values]), 20)
+        self.assertEqual(rows.shape, (2, 3))
+        self.assertTrue(np.isnan(rows).all())
+
+
+class TestOnlineIndicators(unittest.TestCase):
+    """Test streaming indicators against the batch functions."""
+
+    def setUp(self):
+        """Create test data."""
+        rng = np.random.default_rng(7)
+        close = 100 + np.cumsum(rng.normal(0, 1, 300))
+        self.df = pd.DataFrame({
+            'timestamp': pd.date_range('2024-01-01', periods=300, freq='h'),
+            'high': close + rng.random(300),
+            'low': close - rng.random(300),
+            'close': close,
+            'volume': rng.random(300) * 1000
+        })
+
+    def test_online_sma(self):
+        """Test OnlineSMA matches calculate_sma."""
+        online = OnlineSMA(20).fit_transform(self.df['close'].to_numpy())
+        expected = calculate_sma(self.df, period=20)['sma_20']
+        np.testing.assert_allclose(online, expected, rtol=1e-12)
+
+    def test_online_bbands(self):
+        """Test OnlineBBands matches calculate_bbwidth."""
+        online = OnlineBBands(20, 2.0).fit_transform(self.df['close'].to_numpy())
+        expected = calculate_bbwidth(self.df, period=20, num_std=2.0)
+        np.testing.assert_allclose(online[:, 0], expected['bb_middle'], rtol=1e-10)
+        np.testing.assert_allclose(online[:, 3], expected['bbwidth'], rtol=1e-8)
+
+    def test_online_adx(self):
+        """Test OnlineADX matches calculate_adx."""
+        online = OnlineADX(14).fit_transform(
+            self.df['high'].to_numpy(), self.df['low'].to_numpy(), self.df['close'].to_numpy()
+        )
+        expected = calculate_adx(self.df, period=14)
+        np.testing.assert_allclose(online[:, 0], expected['plus_di'], rtol=1e-10)
+        np.testing.assert_allclose(online[:, 2], expected['adx'], rtol=1e-10)
+
+    def test_online_rvr(self):
+        """Test OnlineRVR matches calculate_relative_volume_ratio."""
+        online = OnlineRVR(20).fit_transform(self.df['volume'].to_numpy())
+        expected = calculate_relative_volume_ratio(self.df, period=20)['rvr']
+        np.testing.assert_allclose(online, expected, rtol=1e-12)
+
+
 class TestIndicatorsWithRealData(unittest.TestCase):
     """Test indicators with real market data."""
 
@@ -0,0 +1,104 @@
+"""
+Unit tests for the performance analysis script.
+"""
+
+import unittest
+from unittest import mock
+import tempfile
+import shutil
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from datetime import datetime, timedelta
+
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent / 'scripts'))
+
+from performance_analysis import PerformanceAnalyzer
+
+
+class TestPerformanceAnalyzer(unittest.TestCase):
+    """Test loading trades from a TradeDatabase."""
+
+    def setUp(self):
+        """Create an analyzer on a temporary database with a few trades."""
+        self.tmp_dir = tempfile.mkdtemp()
+        config = SimpleNamespace(
+            database=SimpleNamespace(db_path=str(Path(self.tmp_dir) / 'trading.db')),
+            alerts=SimpleNamespace(enabled=False)
+        )
+        self.analyzer = PerformanceAnalyzer(config)
+        db = self.analyzer.db
+
+        now = datetime.utcnow()
+        closed = [
+            ('BTCUSDT', 5.0, 50.0, timedelta(hours=12)),
+            ('ETHUSDT', -2.0, -20.0, timedelta(days=2)),
+            ('SOLUSDT', 3.0, 30.0, timedelta(days=10)),
+        ]
+        for i, (symbol, pnl_pct, pnl_usd, age) in enumerate(closed):
+            db.log_trade_entry(f'T{i}', 'demo', symbol, 'Buy', 1.0, 1.0, 100.0,
+                               ts=now - age - timedelta(days=1))
+            db.log_trade_exit(f'T{i}', 1.1, pnl_usd, pnl_pct, 'take_profit', 3600,
+                              ts=now - age)
+
+        # Still open - must not count anywhere
+        db.log_trade_entry('OPEN', 'demo', 'DOGEUSDT', 'Buy', 1.0, 1.0, 100.0, ts=now)
+
+    def tearDown(self):
+        self.analyzer.db.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def test_load_trades_df(self):
+        """Loads closed trades with the P&L columns under their report names."""
+        trades = self.analyzer._load_trades_df()
+
+        self.assertEqual(list(trades.columns), ['symbol', 'exit_time', 'return_pct', 'return_usd'])
+        self.assertEqual(trades['symbol'].tolist(), ['SOLUSDT', 'ETHUSDT', 'BTCUSDT'])
+        self.assertAlmostEqual(trades['return_usd'].sum(), 60.0)
+
+    def test_all_time_excludes_open_trades(self):
+        """All-time stats only cover closed trades."""
+        stats = self.analyzer.analyze_all_time_performance()
+
+        self.assertEqual(stats['total_trades'], 3)
+        self.assertAlmostEqual(stats['win_rate'], 2 / 3)
+        self.assertAlmostEqual(stats['total_pnl_usd'], 60.0)
+
+    def test_all_time_sql_matches_frame(self):
+        """The SQL aggregate gives the same all-time stats as a loaded frame."""
+        from_sql = self.analyzer.analyze_all_time_performance()
+        from_frame = self.analyzer.analyze_all_time_performance(self.analyzer._load_trades_df())
+
+        self.assertEqual(from_sql, from_frame)
+
+    def test_run_skips_loading_when_week_is_empty(self):
+        """run() doesn't load the trades table when nothing closed this week."""
+        week_ago = datetime.utcnow() - timedelta(days=7)
+        self.analyzer.db.conn.execute('DELETE FROM trades WHERE exit_time >= ?', (week_ago,))
+        self.analyzer.db.conn.commit()
+
+        with mock.patch.object(self.analyzer, '_load_trades_df') as load, \
+                mock.patch.object(self.analyzer, 'save_report') as save:
+            self.analyzer.run()
+
+        load.assert_not_called()
+        daily_metrics = save.call_args[0][0]
+        self.assertEqual(daily_metrics['total_trades'], 0)
+
+    def test_daily_and_weekly_windows(self):
+        """Window reports match with and without a preloaded frame."""
+        all_trades = self.analyzer._load_trades_df()
+
+        for trades in (None, all_trades):
+            daily = self.analyzer.analyze_daily_performance(trades)
+            weekly = self.analyzer.analyze_weekly_performance(trades)
+
+            self.assertEqual(daily['total_trades'], 1)
+            self.assertAlmostEqual(daily['total_pnl_usd'], 50.0)
+            self.assertEqual(weekly['total_trades'], 2)
+            self.assertAlmostEqual(weekly['total_pnl_usd'], 30.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
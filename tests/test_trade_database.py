@@ -0,0 +1,71 @@
+"""
+Unit tests for the trade database.
+"""
+
+import unittest
+from unittest import mock
+import sqlite3
+import tempfile
+import shutil
+import sys
+import time
+from pathlib import Path
+from datetime import datetime
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from database.trade_database import TradeDatabase
+
+
+class TestEventBuffer(unittest.TestCase):
+    """Test buffered system and risk event writes."""
+
+    def setUp(self):
+        """Create a database with the background flusher stopped."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = TradeDatabase(str(Path(self.tmp_dir) / 'trading.db'))
+        self.db._stopping.set()
+        self.db._flush_requested.set()
+        self.db._flusher_thread.join()
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def test_failed_flush_requeues_events(self):
+        """Test events survive a failed write and land on the next flush."""
+        self.db.log_event('TRADE', 'INFO', 'first', ts=datetime(2025, 1, 1, 0, 0, 1))
+        self.db.log_event('TRADE', 'INFO', 'second', ts=datetime(2025, 1, 1, 0, 0, 2))
+        self.db.log_risk_event('DAILY_LOSS', 5.0, 4.0, 'HALT')
+
+        failing = mock.Mock()
+        failing.executemany.side_effect = sqlite3.OperationalError('disk I/O error')
+        with mock.patch.object(self.db, '_cursor', failing):
+            with self.assertRaises(sqlite3.OperationalError):
+                self.db.flush()
+
+        self.assertEqual(len(self.db._event_buf), 2)
+        self.assertEqual(len(self.db._risk_buf), 1)
+
+        self.db.flush()
+        events = self.db.get_recent_events()
+        self.assertEqual([e['message'] for e in events], ['second', 'first'])
+        risk_count = self.db.conn.execute('SELECT COUNT(*) FROM risk_events').fetchone()[0]
+        self.assertEqual(risk_count, 1)
+
+    def test_unstamped_events_keep_log_time(self):
+        """Test events logged without ts are stamped when logged, not flushed."""
+        before = datetime.now()
+        self.db.log_event('TRADE', 'INFO', 'entry')
+        self.db.log_risk_event('DAILY_LOSS', 5.0, 4.0, 'HALT')
+        after = datetime.now()
+        time.sleep(0.05)
+        self.db.flush()
+
+        for table in ('system_events', 'risk_events'):
+            row = self.db.conn.execute(f'SELECT event_time FROM {table}').fetchone()
+            self.assertTrue(before <= datetime.fromisoformat(row[0]) <= after)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,6 +17,7 @@ import time
 import signal as sys_signal
 import json
 from typing import Dict, List
+import numpy as np
 import pandas as pd
 
 sys.path.append(str(Path(__file__).parent))
@@ -107,6 +108,20 @@ class TradingSystem:
         if not health['healthy']:
             raise Exception(f"Exchange health check failed: {health['issues']}")
 
+        # Warm instrument rules so first orders skip the lookup
+        try:
+            count = self.exchange.preload_instruments()
+            print(f"✓ Loaded rules for {count} instruments")
+        except Exception as e:
+            print(f"⚠️  Could not preload instruments: {e}")
+
+        # Stream tickers/positions over WebSocket; REST stays as fallback
+        try:
+            if self.exchange.start_streams():
+                print("✓ WebSocket streams started")
+        except Exception as e:
+            print(f"⚠️  Could not start WebSocket streams: {e}")
+
         print("✓ Exchange connected and healthy")
 
     def _init_telegram(self):
@@ -130,6 +145,7 @@ class TradingSystem:
 
             # Alpha infrastructure integration
             self.alpha_integration = get_integration(bot_id='momentum_001')
+            self.alpha_integration.start_heartbeat()
             print(f"Alpha integration status: {'✅ Connected' if self.alpha_integration.is_connected() else '⚠️ Not connected'}")
             print("✓ Database connected")
         else:
@@ -248,7 +264,7 @@ class TradingSystem:
         # BTC regime filter
         if config.strategy.use_btc_regime_filter:
             try:
-                btc_data = self.exchange.get_kline(
+                btc_data = self.exchange.get_kline_np(
                     'BTCUSDT',
                     interval='D',
                     limit=config.strategy.btc_ma_period + 50
@@ -273,7 +289,7 @@ class TradingSystem:
                 continue
 
             try:
-                klines = self.exchange.get_kline(
+                klines = self.exchange.get_kline_np(
                     symbol,
                     interval=config.strategy.timeframe,
                     limit=config.strategy.lookback_period + 50
@@ -433,7 +449,7 @@ class TradingSystem:
                 # Get current market data for MA calculation
                 if config.strategy.use_ma_exit:
                     try:
-                        klines = self.exchange.get_kline(
+                        klines = self.exchange.get_kline_np(
                             symbol,
                             interval=config.strategy.timeframe,
                             limit=config.strategy.ma_period + 10
@@ -548,20 +564,22 @@ class TradingSystem:
             if self.telegram:
                 self.telegram.alert_error("Exit Execution", str(e), symbol)
 
-    def _format_kline_data(self, klines: List) -> pd.DataFrame:
-        """Format kline data to DataFrame."""
-        if not klines:
+    def _format_kline_data(self, klines: np.ndarray) -> pd.DataFrame:
+        """Format a get_kline_np() array (oldest first) to DataFrame."""
+        if len(klines) == 0:
             return pd.DataFrame()
 
-        df = pd.DataFrame(klines, columns=[
-            'timestamp', 'open', 'high', 'low', 'close', 'volume', 'turnover'
-        ])
-
-        df['timestamp'] = pd.to_datetime(df['timestamp'].astype(int), unit='ms')
-        for col in ['open', 'high', 'low', 'close', 'volume', 'turnover']:
-            df[col] = df[col].astype(float)
+        df = pd.DataFrame({
+            'timestamp': pd.to_datetime(klines[:, 0].astype(np.int64), unit='ms'),
+            'open': klines[:, 1],
+            'high': klines[:, 2],
+            'low': klines[:, 3],
+            'close': klines[:, 4],
+            'volume': klines[:, 5],
+            'turnover': klines[:, 6]
+        })
 
-        return df.sort_values('timestamp').reset_index(drop=True)
+        return df
 
     # ========== Main Trading Loop ==========
 
@@ -718,6 +736,14 @@ class TradingSystem:
         if self.db:
             stats = self.db.get_performance_stats(mode=config.TRADING_MODE.value)
             self.db.log_event("SYSTEM_STOP", "INFO", "Trading system stopped", stats)
+            self.db.flush()
+
+        # Drain queued trade writes (including the shutdown closes above)
+        if hasattr(self, 'alpha_integration'):
+            self.alpha_integration.close()
+
+        if self.exchange:
+            self.exchange.stop_streams()
 
         # Send notification
         if self.telegram: